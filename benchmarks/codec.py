@@ -0,0 +1,399 @@
+""""""
+
+import io
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple, cast
+
+import platformdirs
+from PIL import Image
+from pylibdmtx import pylibdmtx
+
+from printer import pdf
+from printer.config import settings
+from printer.header import SymbolHeader, pack_symbol
+from printer.symbol_codec import DMTX_ENCODING_SCHEMES, encode_symbol_data
+from scanner import decoder, ingest
+from scanner import utils as scanner_utils
+from scanner.colour import ColourMode
+from scanner.header import HeaderVersion
+from scanner.symbol_codec import SymbolCodec
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from pathlib import Path
+    from typing import Final
+
+    from printer.packing import SymbolPacking
+
+__all__: Sequence[str] = ()
+
+
+RESULTS_FILE_PATH: Final[Path] = (
+    platformdirs.user_state_path("IPoPS-benchmarks", roaming=False, ensure_exists=True)
+    / "codec.json"
+)
+TRACE_SIZE: Final[int] = 32 * 1024
+MAX_BUFFER_SIZES: Final[Sequence[int]] = (250, 500, 1000, 1500)
+FLOWS_COUNT: Final[int] = 4
+PAYLOAD_SIZES: Final[range] = range(0, 1461)
+TEXT_PAYLOAD_PROBABILITY: Final[float] = 0.5
+REPEATS: Final[int] = 3
+STARTING_PAGE_NUMBER: Final[int] = 0
+IPV4_HEADER_SIZE: Final[int] = 20
+TCP_HEADER_SIZE: Final[int] = 20
+TCP_PROTOCOL: Final[int] = 6
+REGRESSION_THRESHOLD: Final[float] = 0.1
+
+
+class CodecResult(NamedTuple):
+    """"""
+
+    max_buffer_size: int
+    pages_count: int
+    payload_bytes_per_sheet: float
+    pdf_size: int
+    encode_ms_per_page: float
+    decode_ms_per_page: float
+    symbol_pack_ms_per_page: float
+    dmtx_encode_ms_per_page: float
+    resize_ms_per_page: float
+    rasterize_ms_per_page: float
+    dmtx_decode_ms_per_page: float
+    parse_ms_per_page: float
+    state_ms_per_page: float
+
+
+def _get_ipv4_checksum(ip_header: bytes | bytearray) -> int:
+    checksum: int = sum(
+        int.from_bytes(ip_header[offset : offset + 2], byteorder="big")
+        for offset in range(0, len(ip_header), 2)
+    )
+    while checksum > 0xFFFF:
+        checksum = (checksum & 0xFFFF) + (checksum >> 16)
+
+    return ~checksum & 0xFFFF
+
+
+def _make_packet(
+    flow: int, sequence_number: int, identification: int, payload: bytes
+) -> bytes:
+    ip_header: bytearray = bytearray(
+        b"\x45\x00"
+        + (IPV4_HEADER_SIZE + TCP_HEADER_SIZE + len(payload)).to_bytes(2, byteorder="big")
+        + identification.to_bytes(2, byteorder="big")
+        + b"\x40\x00\x40"
+        + bytes((TCP_PROTOCOL,))
+        + bytes(2)
+        + bytes((10, 0, 0, 1, 10, 0, 0, 2))
+    )
+    ip_header[10:12] = _get_ipv4_checksum(ip_header).to_bytes(2, byteorder="big")
+
+    tcp_header: bytes = (
+        (49152 + flow).to_bytes(2, byteorder="big")
+        + (80).to_bytes(2, byteorder="big")
+        + sequence_number.to_bytes(4, byteorder="big")
+        + bytes(4)
+        + b"\x50\x18\xff\xff"
+        + bytes(4)
+    )
+
+    return bytes(ip_header) + tcp_header + payload
+
+
+def _make_packet_trace() -> bytes:
+    random_generator: random.Random = random.Random(0)  # noqa: S311
+
+    # NOTE: Half of the payloads are repetitive text and half are incompressible, so both
+    # frame compression and header compression see realistic traffic
+    sequence_numbers: list[int] = [0] * FLOWS_COUNT
+    packet_trace: bytearray = bytearray()
+    identification: int = 0
+    while len(packet_trace) < TRACE_SIZE:
+        flow: int = random_generator.randrange(FLOWS_COUNT)
+        payload_size: int = random_generator.choice(PAYLOAD_SIZES)
+        payload: bytes = (
+            (b"GET /index.html HTTP/1.1\r\nHost: example.org\r\n\r\n" * payload_size)[
+                :payload_size
+            ]
+            if random_generator.random() < TEXT_PAYLOAD_PROBABILITY
+            else random_generator.randbytes(payload_size)
+        )
+
+        packet_trace += _make_packet(flow, sequence_numbers[flow], identification, payload)
+        sequence_numbers[flow] = (sequence_numbers[flow] + len(payload)) % (1 << 32)
+        identification = (identification + 1) % (1 << 16)
+
+    return bytes(packet_trace)
+
+
+def _time_call(function: Callable[[], object], repeats: int = REPEATS) -> float:
+    best_duration: float = float("inf")
+    for _ in range(repeats):
+        start_time: float = time.perf_counter()
+        function()
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration
+
+
+def _measure_symbol_stages(symbol_packing: SymbolPacking) -> tuple[float, float, float]:
+    random_generator: random.Random = random.Random(0)  # noqa: S311
+    chunks: Sequence[bytes] = [
+        random_generator.randbytes(symbol_packing.chunk_size)
+        for _ in range(symbol_packing.slots_per_page)
+    ]
+
+    def pack_symbols() -> Sequence[bytes]:
+        symbols_data: list[bytes] = []
+
+        slot: int
+        chunk: bytes
+        for slot, chunk in enumerate(chunks):
+            raw_prefix: bytes
+            symbol_data: bytes
+            raw_prefix, symbol_data = pack_symbol(
+                settings.HEADER_VERSION,
+                SymbolHeader(
+                    page_number=STARTING_PAGE_NUMBER,
+                    slot=slot,
+                    slots_count=symbol_packing.slots_per_page,
+                    page_flags=0,
+                    stream_id=settings.STREAM_ID,
+                ),
+                chunk,
+            )
+            symbols_data.append(
+                encode_symbol_data(settings.SYMBOL_CODEC, symbol_data, raw_prefix)
+            )
+
+        return symbols_data
+
+    symbols_data: Sequence[bytes] = pack_symbols()
+
+    def encode_symbols() -> Sequence[pylibdmtx.Encoded]:
+        return [
+            pylibdmtx.encode(
+                symbol_data,
+                scheme=DMTX_ENCODING_SCHEMES[settings.SYMBOL_CODEC],
+                size="SquareAuto",
+            )
+            for symbol_data in symbols_data
+        ]
+
+    encoded_datamatrices: Sequence[pylibdmtx.Encoded] = encode_symbols()
+    symbol_images: Sequence[Image.Image] = [
+        Image.frombytes(
+            "RGB",
+            (encoded_datamatrix.width, encoded_datamatrix.height),
+            encoded_datamatrix.pixels,
+        )
+        for encoded_datamatrix in encoded_datamatrices
+    ]
+
+    return (
+        _time_call(pack_symbols),
+        _time_call(encode_symbols),
+        _time_call(lambda: [pdf.resize(symbol_image) for symbol_image in symbol_images]),
+    )
+
+
+def _measure(max_buffer_size: int) -> CodecResult:
+    # NOTE: Runs in a fresh worker process, with its settings and scanner state directory
+    # taken from the environment, so each buffer size starts from an empty page store
+    packet_trace: bytes = _make_packet_trace()
+
+    encode_duration: float = _time_call(
+        lambda: pdf.bytes_into_pdf(packet_trace, STARTING_PAGE_NUMBER)
+    )
+    rendered_pdf: pdf.RenderedPDF = pdf.bytes_into_pdf(packet_trace, STARTING_PAGE_NUMBER)
+
+    symbol_pack_duration: float
+    dmtx_encode_duration: float
+    resize_duration: float
+    symbol_pack_duration, dmtx_encode_duration, resize_duration = _measure_symbol_stages(
+        pdf.get_symbol_packing(STARTING_PAGE_NUMBER)
+    )
+
+    start_time: float = time.perf_counter()
+    scanned_sheets: Sequence[Image.Image] = ingest.load_scan_file(
+        io.BytesIO(rendered_pdf.pdf_bytes), ColourMode.MONOCHROME
+    )
+    rasterize_duration: float = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    raw_symbols_data: Sequence[bytes] = [
+        raw_data
+        for scanned_sheet in scanned_sheets
+        for raw_data in decoder.decode_page(scanned_sheet, workers=1)
+    ]
+    dmtx_decode_duration: float = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    pages: Mapping[int, bytes] = scanner_utils.assemble_pages(
+        scanner_utils.parse_symbol_payload(
+            raw_data, SymbolCodec[settings.SYMBOL_CODEC.name], HeaderVersion.AUTO
+        )
+        for raw_data in raw_symbols_data
+    )
+    parse_duration: float = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    page_number: int
+    page_record: bytes
+    for page_number, page_record in pages.items():
+        scanner_utils.save_data_for_page(page_number, page_record)
+    scanner_utils.recover_missing_pages(STARTING_PAGE_NUMBER)
+    decoded_trace: bytes | None = scanner_utils.send_lowest_contiguous_block(
+        STARTING_PAGE_NUMBER
+    )
+    scanner_utils.get_page_states(STARTING_PAGE_NUMBER)
+    state_duration: float = time.perf_counter() - start_time
+
+    if decoded_trace != packet_trace:
+        ROUND_TRIP_FAILED_MESSAGE: Final[str] = (
+            f"The packet trace did not round-trip with MAX_BUFFER_SIZE {max_buffer_size}."
+        )
+        raise ValueError(ROUND_TRIP_FAILED_MESSAGE)
+
+    pages_count: int = rendered_pdf.pages_count
+    return CodecResult(
+        max_buffer_size=max_buffer_size,
+        pages_count=pages_count,
+        payload_bytes_per_sheet=len(packet_trace) / pages_count,
+        pdf_size=len(rendered_pdf.pdf_bytes),
+        encode_ms_per_page=1000 * encode_duration / pages_count,
+        decode_ms_per_page=(
+            1000 * (dmtx_decode_duration + parse_duration + state_duration) / pages_count
+        ),
+        symbol_pack_ms_per_page=1000 * symbol_pack_duration,
+        dmtx_encode_ms_per_page=1000 * dmtx_encode_duration,
+        resize_ms_per_page=1000 * resize_duration,
+        rasterize_ms_per_page=1000 * rasterize_duration / pages_count,
+        dmtx_decode_ms_per_page=1000 * dmtx_decode_duration / pages_count,
+        parse_ms_per_page=1000 * parse_duration / pages_count,
+        state_ms_per_page=1000 * state_duration / pages_count,
+    )
+
+
+def _run_measurement(max_buffer_size: int, state_directory: str) -> CodecResult:
+    os.environ["IPOPS_PRINTER_MAX_BUFFER_SIZE"] = str(max_buffer_size)
+    os.environ["IPOPS_PRINTER_ENCODE_WORKERS"] = "1"
+    os.environ["XDG_STATE_HOME"] = state_directory
+
+    # NOTE: Spawned workers inherit the environment as it is when they start, and import
+    # the printer settings and scanner state paths afresh
+    executor: ProcessPoolExecutor
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(_measure, max_buffer_size).result()
+
+
+def _load_previous_results() -> Mapping[int, Mapping[str, float]]:
+    if not RESULTS_FILE_PATH.exists():
+        return {}
+
+    # NOTE: Results from a different packet trace are not comparable, so they are ignored
+    saved_results: Mapping[str, object] = json.loads(RESULTS_FILE_PATH.read_text())
+    if saved_results.get("trace_size") != TRACE_SIZE:
+        return {}
+
+    return {
+        int(result["max_buffer_size"]): result
+        for result in cast("Sequence[Mapping[str, float]]", saved_results["results"])
+    }
+
+
+def _format_change(value: float, previous_value: float | None) -> str:
+    if not previous_value:
+        return f"{'':>8}"
+
+    change: float = value / previous_value - 1
+    return f"{change:>+7.0%}{'!' if change > REGRESSION_THRESHOLD else ' '}"
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv:
+        sys.stderr.write("Command line arguments not recognized\n")
+        return -1
+
+    previous_results: Mapping[int, Mapping[str, float]] = _load_previous_results()
+    results: list[CodecResult] = []
+
+    sys.stdout.write(
+        f"Printing and scanning a {TRACE_SIZE} byte synthetic packet trace "
+        f"(encode best of {REPEATS})\n"
+    )
+    sys.stdout.write(
+        f"{'buffer':>7} {'pages':>6} {'payload B/sheet':>16} {'PDF KiB':>8} "
+        f"{'encode ms/page':>15} {'change':>8} {'decode ms/page':>15} {'change':>8}\n"
+    )
+
+    original_environment: Mapping[str, str] = dict(os.environ)
+    try:
+        max_buffer_size: int
+        for max_buffer_size in MAX_BUFFER_SIZES:
+            state_directory: str
+            with tempfile.TemporaryDirectory(prefix="ipops-benchmark-") as state_directory:
+                try:
+                    result: CodecResult = _run_measurement(max_buffer_size, state_directory)
+                except ValueError as e:
+                    sys.stderr.write(f"{e}\n")
+                    return 1
+
+            previous_result: Mapping[str, float] = previous_results.get(max_buffer_size, {})
+            encode_change: str = _format_change(
+                result.encode_ms_per_page, previous_result.get("encode_ms_per_page")
+            )
+            decode_change: str = _format_change(
+                result.decode_ms_per_page, previous_result.get("decode_ms_per_page")
+            )
+            sys.stdout.write(
+                f"{result.max_buffer_size:>7} {result.pages_count:>6} "
+                f"{result.payload_bytes_per_sheet:>16.0f} {result.pdf_size / 1024:>8.1f} "
+                f"{result.encode_ms_per_page:>15.1f} {encode_change} "
+                f"{result.decode_ms_per_page:>15.1f} {decode_change}\n"
+            )
+            results.append(result)
+
+    finally:
+        os.environ.clear()
+        os.environ.update(original_environment)
+
+    sys.stdout.write("\nTime per page by stage, in ms\n")
+    sys.stdout.write(
+        f"{'buffer':>7} {'pack':>7} {'dmtx encode':>12} {'resize':>7} {'rasterize':>10} "
+        f"{'dmtx decode':>12} {'parse':>7} {'state':>7}\n"
+    )
+
+    for result in results:
+        sys.stdout.write(
+            f"{result.max_buffer_size:>7} {result.symbol_pack_ms_per_page:>7.2f} "
+            f"{result.dmtx_encode_ms_per_page:>12.1f} {result.resize_ms_per_page:>7.2f} "
+            f"{result.rasterize_ms_per_page:>10.1f} {result.dmtx_decode_ms_per_page:>12.1f} "
+            f"{result.parse_ms_per_page:>7.2f} {result.state_ms_per_page:>7.2f}\n"
+        )
+
+    RESULTS_FILE_PATH.write_text(
+        json.dumps(
+            {"trace_size": TRACE_SIZE, "results": [result._asdict() for result in results]},
+            indent=2,
+        )
+    )
+    sys.stdout.write(f"\nSaved results to {RESULTS_FILE_PATH}\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,208 @@
+""""""
+
+import io
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple
+
+from printer import pdf
+from printer.config import ColourMode, settings
+from scanner import colour, console, decoder, ingest
+from scanner import utils as scanner_utils
+from scanner.header import HeaderVersion
+from scanner.symbol_codec import SymbolCodec
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Final
+
+    from PIL import Image
+
+__all__: Sequence[str] = ()
+
+
+PAGES_COUNT: Final[int] = 2
+SCAN_FILE_FORMAT: Final[str] = "tiff"
+STARTING_PAGE_NUMBER: Final[int] = 0
+BASELINE_COLOUR_MODE: Final[ColourMode] = ColourMode.MONOCHROME
+
+# NOTE: Real paper is not pure white, and real inks each darken the other channels too
+SIMULATED_PAPER_COLOUR: Final[tuple[int, int, int]] = (240, 236, 225)
+SIMULATED_INK_COLOURS: Final[Sequence[tuple[int, int, int]]] = (
+    (40, 160, 225),
+    (215, 45, 140),
+    (245, 225, 50),
+)
+
+
+class ColourModeResult(NamedTuple):
+    """"""
+
+    colour_mode: ColourMode
+    pages_count: int
+    payload_bytes_per_sheet: float
+    encode_ms_per_page: float
+    decode_ms_per_sheet: float
+
+
+def _simulate_inks(scanned_sheet: Image.Image) -> Image.Image:
+    # NOTE: Each rendered channel gives how much of its ink covers a pixel, and every ink
+    # darkens the paper by its own amount in each channel of the simulated scan
+    conversion_matrix: list[float] = []
+
+    channel: int
+    for channel in range(3):
+        ink_darkening: Sequence[int] = [
+            SIMULATED_PAPER_COLOUR[channel] - ink_colour[channel]
+            for ink_colour in SIMULATED_INK_COLOURS
+        ]
+        conversion_matrix.extend(darkening / 255 for darkening in ink_darkening)
+        conversion_matrix.append(SIMULATED_PAPER_COLOUR[channel] - sum(ink_darkening))
+
+    return scanned_sheet.convert("RGB").convert("RGB", matrix=tuple(conversion_matrix))
+
+
+def _measure() -> ColourModeResult:
+    # NOTE: Runs in a fresh worker process, with its settings and scanner state directory
+    # taken from the environment, and random bytes so that compression cannot help
+    random_generator: random.Random = random.Random(0)  # noqa: S311
+    content: bytes = random_generator.randbytes(
+        PAGES_COUNT * pdf.get_page_capacity(STARTING_PAGE_NUMBER)
+    )
+
+    start_time: float = time.perf_counter()
+    rendered_pdf: pdf.RenderedPDF = pdf.bytes_into_pdf(content, STARTING_PAGE_NUMBER)
+    encode_duration: float = time.perf_counter() - start_time
+    pdf.shutdown_encoder_pools()
+
+    # NOTE: The simulated scans go through the same file ingest path as a real scan file,
+    # so they are read back with the colour handling the scanner itself uses
+    simulated_scan_file: io.BytesIO = io.BytesIO()
+    simulated_sheets: Sequence[Image.Image] = [
+        _simulate_inks(rendered_sheet)
+        for rendered_sheet in ingest.load_scan_file(
+            io.BytesIO(rendered_pdf.pdf_bytes), colour.ColourMode.CMY
+        )
+    ]
+    simulated_sheets[0].save(
+        simulated_scan_file,
+        format=SCAN_FILE_FORMAT,
+        save_all=True,
+        append_images=simulated_sheets[1:],
+    )
+    simulated_scan_file.seek(0)
+
+    scanner_colour_mode: colour.ColourMode = colour.ColourMode[settings.COLOUR_MODE.name]
+    scanned_sheets: Sequence[Image.Image] = ingest.load_scan_file(
+        simulated_scan_file, scanner_colour_mode
+    )
+
+    try:
+        start_time = time.perf_counter()
+        pages: Mapping[int, bytes] = console._decode_sheets(  # noqa: SLF001
+            scanned_sheets,
+            console._DecodeOptions(  # noqa: SLF001
+                pdf_data_format=console.PDFDataFormat.DATA_MATRIX,
+                colour_mode=scanner_colour_mode,
+                symbol_codec=SymbolCodec[settings.SYMBOL_CODEC.name],
+                header_version=HeaderVersion.AUTO,
+                stream_id=settings.STREAM_ID,
+                decode_workers=None,
+            ),
+        )
+        decode_duration: float = time.perf_counter() - start_time
+    finally:
+        decoder.shutdown_decoder_pools()
+
+    page_number: int
+    page_record: bytes
+    for page_number, page_record in pages.items():
+        scanner_utils.save_data_for_page(page_number, page_record)
+
+    if scanner_utils.send_lowest_contiguous_block(STARTING_PAGE_NUMBER) != content:
+        ROUND_TRIP_FAILED_MESSAGE: Final[str] = (
+            f"The content did not round-trip with COLOUR_MODE {settings.COLOUR_MODE.name}."
+        )
+        raise ValueError(ROUND_TRIP_FAILED_MESSAGE)
+
+    pages_count: int = rendered_pdf.pages_count
+    return ColourModeResult(
+        colour_mode=settings.COLOUR_MODE,
+        pages_count=pages_count,
+        payload_bytes_per_sheet=len(content) / pages_count,
+        encode_ms_per_page=1000 * encode_duration / pages_count,
+        decode_ms_per_sheet=1000 * decode_duration / len(scanned_sheets),
+    )
+
+
+def _run_measurement(colour_mode: ColourMode, state_directory: str) -> ColourModeResult:
+    os.environ["IPOPS_PRINTER_COLOUR_MODE"] = colour_mode.name
+    os.environ["XDG_STATE_HOME"] = state_directory
+
+    # NOTE: Spawned workers inherit the environment as it is when they start, and import
+    # the printer settings and scanner state paths afresh
+    executor: ProcessPoolExecutor
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(_measure).result()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv:
+        sys.stderr.write("Command line arguments not recognized\n")
+        return -1
+
+    sys.stdout.write(
+        f"Printing and scanning {PAGES_COUNT} full pages of random bytes "
+        "with each colour mode, through simulated inks\n"
+    )
+
+    results: dict[ColourMode, ColourModeResult] = {}
+    original_environment: Mapping[str, str] = dict(os.environ)
+    try:
+        colour_mode: ColourMode
+        for colour_mode in ColourMode:
+            state_directory: str
+            with tempfile.TemporaryDirectory(prefix="ipops-benchmark-") as state_directory:
+                try:
+                    results[colour_mode] = _run_measurement(colour_mode, state_directory)
+                except ValueError as e:
+                    sys.stderr.write(f"{e}\n")
+                    return 1
+
+    finally:
+        os.environ.clear()
+        os.environ.update(original_environment)
+
+    baseline_result: ColourModeResult = results[BASELINE_COLOUR_MODE]
+
+    sys.stdout.write(
+        f"{'mode':>11} {'pages':>6} {'payload B/sheet':>16} {'density':>8} "
+        f"{'encode ms/page':>15} {'decode ms/sheet':>16}\n"
+    )
+
+    result: ColourModeResult
+    for result in results.values():
+        density: float = (
+            result.payload_bytes_per_sheet / baseline_result.payload_bytes_per_sheet
+        )
+        sys.stdout.write(
+            f"{result.colour_mode.name:>11} {result.pages_count:>6} "
+            f"{result.payload_bytes_per_sheet:>16.0f} {density:>8.1%} "
+            f"{result.encode_ms_per_page:>15.1f} {result.decode_ms_per_sheet:>16.1f}\n"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,183 @@
+""""""
+
+import io
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple
+
+from printer import pdf
+from printer.config import PDFDataFormat, settings
+from scanner import decoder, ingest, ocr
+from scanner import utils as scanner_utils
+from scanner.colour import ColourMode
+from scanner.header import HeaderVersion
+from scanner.symbol_codec import SymbolCodec
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Final
+
+    from PIL import Image
+
+__all__: Sequence[str] = ()
+
+
+PAGES_COUNT: Final[int] = 2
+STARTING_PAGE_NUMBER: Final[int] = 0
+BASELINE_PDF_DATA_FORMAT: Final[PDFDataFormat] = PDFDataFormat.DATA_MATRIX
+
+
+class DataFormatResult(NamedTuple):
+    """"""
+
+    pdf_data_format: PDFDataFormat
+    pages_count: int
+    payload_bytes_per_sheet: float
+    encode_ms_per_page: float
+    decode_ms_per_sheet: float
+
+
+def _decode_sheet(scanned_sheet: Image.Image) -> Sequence[bytes]:
+    match settings.PDF_DATA_FORMAT:
+        case PDFDataFormat.DATA_MATRIX:
+            return decoder.decode_page(scanned_sheet)
+
+        case PDFDataFormat.TEXT:
+            return [ocr.decode_text_page(scanned_sheet)]
+
+        case _:
+            UNKNOWN_PDF_DATA_FORMAT_MESSAGE: Final[str] = (
+                f"Unrecognized PDF data format: {settings.PDF_DATA_FORMAT}"
+            )
+            raise ValueError(UNKNOWN_PDF_DATA_FORMAT_MESSAGE)
+
+
+def _measure() -> DataFormatResult:
+    # NOTE: Runs in a fresh worker process, with its settings and scanner state directory
+    # taken from the environment, and random bytes so that compression cannot help
+    random_generator: random.Random = random.Random(0)  # noqa: S311
+    content: bytes = random_generator.randbytes(
+        PAGES_COUNT * pdf.get_page_capacity(STARTING_PAGE_NUMBER)
+    )
+
+    start_time: float = time.perf_counter()
+    rendered_pdf: pdf.RenderedPDF = pdf.bytes_into_pdf(content, STARTING_PAGE_NUMBER)
+    encode_duration: float = time.perf_counter() - start_time
+    pdf.shutdown_encoder_pools()
+
+    scanned_sheets: Sequence[Image.Image] = ingest.load_scan_file(
+        io.BytesIO(rendered_pdf.pdf_bytes), ColourMode.MONOCHROME
+    )
+
+    try:
+        start_time = time.perf_counter()
+        raw_symbols_data: Sequence[bytes] = [
+            raw_data
+            for scanned_sheet in scanned_sheets
+            for raw_data in _decode_sheet(scanned_sheet)
+        ]
+        decode_duration: float = time.perf_counter() - start_time
+    finally:
+        decoder.shutdown_decoder_pools()
+        ocr.shutdown_ocr_pools()
+
+    page_number: int
+    page_record: bytes
+    for page_number, page_record in scanner_utils.assemble_pages(
+        scanner_utils.parse_symbol_payload(
+            raw_data, SymbolCodec[settings.SYMBOL_CODEC.name], HeaderVersion.AUTO
+        )
+        for raw_data in raw_symbols_data
+    ).items():
+        scanner_utils.save_data_for_page(page_number, page_record)
+
+    if scanner_utils.send_lowest_contiguous_block(STARTING_PAGE_NUMBER) != content:
+        ROUND_TRIP_FAILED_MESSAGE: Final[str] = (
+            "The content did not round-trip with PDF_DATA_FORMAT "
+            f"{settings.PDF_DATA_FORMAT.name}."
+        )
+        raise ValueError(ROUND_TRIP_FAILED_MESSAGE)
+
+    pages_count: int = rendered_pdf.pages_count
+    return DataFormatResult(
+        pdf_data_format=settings.PDF_DATA_FORMAT,
+        pages_count=pages_count,
+        payload_bytes_per_sheet=len(content) / pages_count,
+        encode_ms_per_page=1000 * encode_duration / pages_count,
+        decode_ms_per_sheet=1000 * decode_duration / len(scanned_sheets),
+    )
+
+
+def _run_measurement(pdf_data_format: PDFDataFormat, state_directory: str) -> DataFormatResult:
+    os.environ["IPOPS_PRINTER_PDF_DATA_FORMAT"] = pdf_data_format.name
+    os.environ["XDG_STATE_HOME"] = state_directory
+
+    # NOTE: Spawned workers inherit the environment as it is when they start, and import
+    # the printer settings and scanner state paths afresh
+    executor: ProcessPoolExecutor
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(_measure).result()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv:
+        sys.stderr.write("Command line arguments not recognized\n")
+        return -1
+
+    sys.stdout.write(
+        f"Printing and scanning {PAGES_COUNT} full pages of random bytes "
+        "with each PDF data format\n"
+    )
+
+    results: dict[PDFDataFormat, DataFormatResult] = {}
+    original_environment: Mapping[str, str] = dict(os.environ)
+    try:
+        pdf_data_format: PDFDataFormat
+        for pdf_data_format in PDFDataFormat:
+            state_directory: str
+            with tempfile.TemporaryDirectory(prefix="ipops-benchmark-") as state_directory:
+                try:
+                    results[pdf_data_format] = _run_measurement(
+                        pdf_data_format, state_directory
+                    )
+                except ValueError as e:
+                    sys.stderr.write(f"{e}\n")
+                    return 1
+
+    finally:
+        os.environ.clear()
+        os.environ.update(original_environment)
+
+    baseline_result: DataFormatResult = results[BASELINE_PDF_DATA_FORMAT]
+
+    sys.stdout.write(
+        f"{'format':>12} {'pages':>6} {'payload B/sheet':>16} {'density':>8} "
+        f"{'encode ms/page':>15} {'decode ms/sheet':>16}\n"
+    )
+
+    result: DataFormatResult
+    for result in results.values():
+        density: float = (
+            result.payload_bytes_per_sheet / baseline_result.payload_bytes_per_sheet
+        )
+        sys.stdout.write(
+            f"{result.pdf_data_format.name:>12} {result.pages_count:>6} "
+            f"{result.payload_bytes_per_sheet:>16.0f} {density:>8.1%} "
+            f"{result.encode_ms_per_page:>15.1f} {result.decode_ms_per_sheet:>16.1f}\n"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
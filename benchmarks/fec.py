@@ -0,0 +1,147 @@
+""""""
+
+import functools
+import itertools
+import random
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from printer import fec as printer_fec
+from scanner import fec as scanner_fec
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ()
+
+
+PAGE_RECORD_SIZE: Final[int] = 8 * 1024
+GROUP_SIZES: Final[Sequence[tuple[int, int]]] = ((4, 1), (8, 2), (16, 4))
+REPEATS: Final[int] = 5
+
+# NOTE: Parity pages are a wire format between the printer and the scanner, so both are
+# checked against these fixed parity shards before anything is timed
+KNOWN_DATA_RECORDS: Final[Sequence[bytes]] = (b"IPoPS", b"", bytes(range(250, 256)))
+KNOWN_PARITY_SHARDS: Final[Sequence[bytes]] = (
+    bytes.fromhex("0000000536cbd9cdcfff"),
+    bytes.fromhex("000000477e45f84403a4"),
+)
+
+
+def _check_known_vector() -> str | None:
+    parity_shards: Sequence[bytes] = printer_fec.encode_parity_shards(
+        printer_fec.pad_shards(KNOWN_DATA_RECORDS), len(KNOWN_PARITY_SHARDS)
+    )
+    if list(parity_shards) != list(KNOWN_PARITY_SHARDS):
+        return "The printer's parity shards do not match the known vector"
+
+    lost_data_indices: Sequence[int]
+    for lost_data_indices in itertools.combinations(
+        range(len(KNOWN_DATA_RECORDS)), len(KNOWN_PARITY_SHARDS)
+    ):
+        recovered_data_records: Mapping[int, bytes] = scanner_fec.recover_data_records(
+            {
+                data_index: data_record
+                for data_index, data_record in enumerate(KNOWN_DATA_RECORDS)
+                if data_index not in lost_data_indices
+            },
+            dict(enumerate(KNOWN_PARITY_SHARDS)),
+            len(KNOWN_DATA_RECORDS),
+        )
+        if any(
+            recovered_data_records[data_index] != KNOWN_DATA_RECORDS[data_index]
+            for data_index in lost_data_indices
+        ):
+            return (
+                "The scanner did not rebuild pages "
+                f"{', '.join(map(str, lost_data_indices))} of the known vector"
+            )
+
+    return None
+
+
+def _time_call(function: Callable[[], object]) -> float:
+    best_duration: float = float("inf")
+    for _ in range(REPEATS):
+        start_time: float = time.perf_counter()
+        function()
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv:
+        sys.stderr.write("Command line arguments not recognized\n")
+        return -1
+
+    known_vector_error: str | None = _check_known_vector()
+    if known_vector_error is not None:
+        sys.stderr.write(f"{known_vector_error}\n")
+        return 1
+
+    sys.stdout.write(
+        f"Encoding parity for groups of {PAGE_RECORD_SIZE} byte pages "
+        f"and rebuilding the most pages each group can lose (best of {REPEATS})\n"
+    )
+    sys.stdout.write(
+        f"{'data':>5} {'parity':>7} {'encode ms/group':>16} {'rebuild ms/group':>17}\n"
+    )
+
+    random_generator: random.Random = random.Random(0)  # noqa: S311
+
+    data_pages_count: int
+    parity_pages_count: int
+    for data_pages_count, parity_pages_count in GROUP_SIZES:
+        data_records: Sequence[bytes] = [
+            random_generator.randbytes(random_generator.randrange(1, PAGE_RECORD_SIZE + 1))
+            for _ in range(data_pages_count)
+        ]
+        data_shards: Sequence[bytes] = printer_fec.pad_shards(data_records)
+        parity_shards: Mapping[int, bytes] = dict(
+            enumerate(printer_fec.encode_parity_shards(data_shards, parity_pages_count))
+        )
+
+        # NOTE: The first pages of the group are lost, as many as its parity pages can rebuild
+        received_data_records: Mapping[int, bytes] = dict(
+            enumerate(data_records[parity_pages_count:], start=parity_pages_count)
+        )
+        recovered_data_records: Mapping[int, bytes] = scanner_fec.recover_data_records(
+            received_data_records, parity_shards, data_pages_count
+        )
+        if list(recovered_data_records.values()) != data_records[:parity_pages_count]:
+            sys.stderr.write(
+                f"A group of {data_pages_count} data pages and {parity_pages_count} "
+                "parity pages did not round-trip\n"
+            )
+            return 1
+
+        encode_duration: float = _time_call(
+            functools.partial(
+                printer_fec.encode_parity_shards, data_shards, parity_pages_count
+            )
+        )
+        rebuild_duration: float = _time_call(
+            functools.partial(
+                scanner_fec.recover_data_records,
+                received_data_records,
+                parity_shards,
+                data_pages_count,
+            )
+        )
+
+        sys.stdout.write(
+            f"{data_pages_count:>5} {parity_pages_count:>7} "
+            f"{1000 * encode_duration:>16.1f} {1000 * rebuild_duration:>17.1f}\n"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+""""""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import TYPE_CHECKING
+
+from printer.framing import PACKET_LENGTH_SIZE, PacketFramer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import BinaryIO, Final
+
+__all__: Sequence[str] = ()
+
+
+STREAM_SIZE: Final[int] = 16 * 1024 * 1024
+PACKET_SIZES: Final[range] = range(40, 1501)
+FRAME_SIZES: Final[Sequence[int]] = (4 * 1024, 64 * 1024, 512 * 1024, 4 * 1024 * 1024)
+REPEATS: Final[int] = 5
+
+
+def _make_packet_stream() -> bytes:
+    random_generator: random.Random = random.Random(0)  # noqa: S311
+
+    packet_stream: bytearray = bytearray()
+    while len(packet_stream) < STREAM_SIZE:
+        packet: bytes = random_generator.randbytes(random_generator.choice(PACKET_SIZES))
+        packet_stream += len(packet).to_bytes(PACKET_LENGTH_SIZE, byteorder="big") + packet
+
+    return bytes(packet_stream)
+
+
+def _read_frame_recursively(stream: BinaryIO, existing_data: bytes, frame_size: int) -> bytes:
+    # NOTE: A copy of the printer's previous frame reader, without its stdin polling
+    packet_size: int = int.from_bytes(stream.read(PACKET_LENGTH_SIZE), byteorder="big")
+    if packet_size == 0:
+        return existing_data
+
+    existing_data += stream.read(packet_size)
+    if len(existing_data) < frame_size:
+        return _read_frame_recursively(stream, existing_data, frame_size)
+
+    return existing_data
+
+
+def _read_frames_recursively(stream_fd: int, frame_size: int) -> int:
+    os.lseek(stream_fd, 0, os.SEEK_SET)
+
+    stream: BinaryIO
+    with os.fdopen(stream_fd, "rb", closefd=False) as stream:
+        frames_count: int = 0
+        while _read_frame_recursively(stream, b"", frame_size):
+            frames_count += 1
+
+    return frames_count
+
+
+def _read_frames_with_framer(stream_fd: int, frame_size: int) -> int:
+    os.lseek(stream_fd, 0, os.SEEK_SET)
+
+    packet_framer: PacketFramer = PacketFramer(stream_fd)
+    frames_count: int = 0
+    ipops_frame: bytearray = bytearray()
+    try:
+        while True:
+            packet: memoryview | None = packet_framer.read_packet(None)
+            if packet is None:
+                continue
+
+            ipops_frame += packet
+            if len(ipops_frame) >= frame_size:
+                bytes(ipops_frame)
+                ipops_frame.clear()
+                frames_count += 1
+
+    except EOFError:
+        frames_count += bool(ipops_frame)
+
+    finally:
+        packet_framer.close()
+
+    return frames_count
+
+
+def _time_reader(reader: Callable[[int, int], int], stream_fd: int, frame_size: int) -> float:
+    best_duration: float = float("inf")
+    for _ in range(REPEATS):
+        start_time: float = time.perf_counter()
+        reader(stream_fd, frame_size)
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv:
+        sys.stderr.write("Command line arguments not recognized\n")
+        return -1
+
+    packet_stream: bytes = _make_packet_stream()
+
+    sys.stdout.write(
+        f"Framing {len(packet_stream) / 1e6:.1f} MB of {PACKET_SIZES.start} to "
+        f"{PACKET_SIZES.stop - 1} byte packets (best of {REPEATS})\n"
+    )
+    sys.stdout.write(
+        f"{'frame size':>11} {'recursive MB/s':>15} {'framer MB/s':>12} {'speedup':>8}\n"
+    )
+
+    stream_file: BinaryIO
+    with tempfile.TemporaryFile(prefix="ipops-benchmark-") as stream_file:
+        stream_file.write(packet_stream)
+        stream_file.flush()
+
+        frame_size: int
+        for frame_size in FRAME_SIZES:
+            framer_duration: float = _time_reader(
+                _read_frames_with_framer, stream_file.fileno(), frame_size
+            )
+
+            # NOTE: The recursive reader needs one stack frame per packet in a frame
+            try:
+                recursive_duration: float = _time_reader(
+                    _read_frames_recursively, stream_file.fileno(), frame_size
+                )
+            except RecursionError:
+                sys.stdout.write(
+                    f"{frame_size:>11} {'overflow':>15} "
+                    f"{len(packet_stream) / framer_duration / 1e6:>12.1f} {'-':>8}\n"
+                )
+                continue
+
+            sys.stdout.write(
+                f"{frame_size:>11} {len(packet_stream) / recursive_duration / 1e6:>15.1f} "
+                f"{len(packet_stream) / framer_duration / 1e6:>12.1f} "
+                f"{recursive_duration / framer_duration:>7.2f}x\n"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
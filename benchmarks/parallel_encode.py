@@ -0,0 +1,87 @@
+""""""
+
+import base64
+import os
+import random
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from printer import pdf
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ()
+
+
+SYMBOLS_COUNT: Final[int] = 48
+CHUNK_SIZE: Final[int] = 1000
+REPEATS: Final[int] = 3
+
+
+def _get_workers_counts() -> Sequence[int]:
+    cpu_count: int = os.cpu_count() or 1
+
+    workers_counts: list[int] = [1]
+    while workers_counts[-1] * 2 <= cpu_count:
+        workers_counts.append(workers_counts[-1] * 2)
+
+    if workers_counts[-1] != cpu_count:
+        workers_counts.append(cpu_count)
+
+    return workers_counts
+
+
+def _time_encode_symbols(symbols_data: Sequence[bytes], workers: int) -> float:
+    # NOTE: Warm up the pool first, so that worker start-up time is not measured
+    pdf.encode_symbols(symbols_data[: workers * 2], workers=workers)
+
+    best_duration: float = float("inf")
+    for _ in range(REPEATS):
+        start_time: float = time.perf_counter()
+        pdf.encode_symbols(symbols_data, workers=workers)
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv:
+        sys.stderr.write("Command line arguments not recognized\n")
+        return -1
+
+    random_generator: random.Random = random.Random(0)  # noqa: S311
+    symbols_data: Sequence[bytes] = [
+        base64.b85encode(random_generator.randbytes(CHUNK_SIZE)) for _ in range(SYMBOLS_COUNT)
+    ]
+
+    sys.stdout.write(
+        f"Encoding {SYMBOLS_COUNT} symbols of {CHUNK_SIZE} bytes (best of {REPEATS})\n"
+    )
+    sys.stdout.write(f"{'workers':>8} {'seconds':>9} {'symbols/s':>10} {'speedup':>8}\n")
+
+    serial_duration: float | None = None
+    try:
+        workers: int
+        for workers in _get_workers_counts():
+            duration: float = _time_encode_symbols(symbols_data, workers)
+            if serial_duration is None:
+                serial_duration = duration
+
+            sys.stdout.write(
+                f"{workers:>8} {duration:>9.3f} {SYMBOLS_COUNT / duration:>10.1f} "
+                f"{serial_duration / duration:>7.2f}x\n"
+            )
+    finally:
+        pdf.shutdown_encoder_pools()
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
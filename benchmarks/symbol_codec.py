@@ -0,0 +1,158 @@
+""""""
+
+import functools
+import random
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from printer.config import HeaderVersion, SymbolCodec
+from printer.header import SymbolHeader, pack_symbol
+from printer.layout import DATA_MATRIX_SQUARE_SYMBOL_SIZES
+from printer.symbol_codec import BASE256_SHORT_LENGTH_LIMIT, encode_symbol_data
+from scanner import header as scanner_header
+from scanner import symbol_codec as scanner_symbol_codec
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ()
+
+
+SAMPLE_SIZE: Final[int] = 4096
+REPEATS: Final[int] = 20
+PAGE_NUMBER: Final[int] = 200
+ZERO_BYTE_PROBABILITY: Final[float] = 0.5
+
+
+def _make_samples() -> Mapping[str, bytes]:
+    random_generator: random.Random = random.Random(0)  # noqa: S311
+
+    return {
+        "random": random_generator.randbytes(SAMPLE_SIZE),
+        "text": (b"GET /index.html HTTP/1.1\r\nHost: example.org\r\n\r\n" * SAMPLE_SIZE)[
+            :SAMPLE_SIZE
+        ],
+        "zeros": bytes(
+            0
+            if random_generator.random() < ZERO_BYTE_PROBABILITY
+            else random_generator.randrange(1, 256)
+            for _ in range(SAMPLE_SIZE)
+        ),
+    }
+
+
+def _count_codewords(symbol_codec: SymbolCodec, symbol_data: bytes) -> int:
+    match symbol_codec:
+        case SymbolCodec.BASE85:
+            # NOTE: ASCII mode stores bytes above 127 as an upper shift and a codeword
+            return len(symbol_data) + sum(byte > 127 for byte in symbol_data)
+
+        case SymbolCodec.BASE256:
+            return (
+                1
+                + (1 if len(symbol_data) <= BASE256_SHORT_LENGTH_LIMIT else 2)
+                + len(symbol_data)
+            )
+
+
+def _encode_symbol(symbol_codec: SymbolCodec, chunk: bytes) -> bytes:
+    raw_prefix: bytes
+    symbol_data: bytes
+    raw_prefix, symbol_data = pack_symbol(
+        HeaderVersion.V2,
+        SymbolHeader(page_number=PAGE_NUMBER, slot=0, slots_count=1, page_flags=0),
+        chunk,
+    )
+    return encode_symbol_data(symbol_codec, symbol_data, raw_prefix)
+
+
+def _get_bytes_per_symbol(symbol_codec: SymbolCodec, sample: bytes) -> int:
+    largest_symbol_codewords: int = DATA_MATRIX_SQUARE_SYMBOL_SIZES[-1][1]
+
+    low: int = 0
+    high: int = len(sample)
+    while low < high:
+        chunk_size: int = (low + high + 1) // 2
+        symbol_data: bytes = _encode_symbol(symbol_codec, sample[:chunk_size])
+        if _count_codewords(symbol_codec, symbol_data) <= largest_symbol_codewords:
+            low = chunk_size
+        else:
+            high = chunk_size - 1
+
+    return low
+
+
+def _time_call(function: Callable[[], object]) -> float:
+    best_duration: float = float("inf")
+    for _ in range(REPEATS):
+        start_time: float = time.perf_counter()
+        function()
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv:
+        sys.stderr.write("Command line arguments not recognized\n")
+        return -1
+
+    sys.stdout.write(
+        f"Packing {SAMPLE_SIZE} byte samples into {DATA_MATRIX_SQUARE_SYMBOL_SIZES[-1][0]}x"
+        f"{DATA_MATRIX_SQUARE_SYMBOL_SIZES[-1][0]} symbols (best of {REPEATS})\n"
+    )
+    sys.stdout.write(
+        f"{'codec':>8} {'sample':>7} {'bytes/symbol':>13} {'overhead':>9} "
+        f"{'encode MB/s':>12} {'decode MB/s':>12}\n"
+    )
+
+    sample_name: str
+    sample: bytes
+    for sample_name, sample in _make_samples().items():
+        symbol_codec: SymbolCodec
+        for symbol_codec in SymbolCodec:
+            symbol_data: bytes = _encode_symbol(symbol_codec, sample)
+            scanner_codec: scanner_symbol_codec.SymbolCodec = scanner_symbol_codec.SymbolCodec[
+                symbol_codec.name
+            ]
+            if (
+                scanner_header.unpack_symbol(
+                    scanner_header.HeaderVersion.V2, scanner_codec, symbol_data
+                )[1]
+                != sample
+            ):
+                sys.stderr.write(
+                    f"{symbol_codec.name} did not round-trip {sample_name} data\n"
+                )
+                return 1
+
+            encode_duration: float = _time_call(
+                functools.partial(_encode_symbol, symbol_codec, sample)
+            )
+            decode_duration: float = _time_call(
+                functools.partial(
+                    scanner_header.unpack_symbol,
+                    scanner_header.HeaderVersion.V2,
+                    scanner_codec,
+                    symbol_data,
+                )
+            )
+
+            sys.stdout.write(
+                f"{symbol_codec.name:>8} {sample_name:>7} "
+                f"{_get_bytes_per_symbol(symbol_codec, sample):>13} "
+                f"{_count_codewords(symbol_codec, symbol_data) / len(sample) - 1:>9.1%} "
+                f"{len(sample) / encode_duration / 1e6:>12.1f} "
+                f"{len(sample) / decode_duration / 1e6:>12.1f}\n"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,197 @@
+""""""
+
+import random
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from PIL import Image, ImageFilter
+
+from printer.layout import PageLayout
+from scanner import decoder
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ()
+
+
+PAPER_WIDTH: Final[float] = 210.0
+PAPER_HEIGHT: Final[float] = 297.0
+PAGE_MARGIN: Final[float] = 10.0
+MILLIMETRES_PER_INCH: Final[float] = 25.4
+DMTX_MARGIN_MODULES: Final[int] = 2
+SCAN_BLUR_RADIUS: Final[float] = 0.7
+MIN_MODULE_PIXELS: Final[float] = 2.0
+DARK_MODULE_RATIO: Final[float] = 0.5
+SCAN_RESOLUTIONS: Final[Sequence[int]] = (150, 200, 300, 600)
+
+# NOTE: Pairs of (module size in millimetres, modules per side), starting with the defaults
+SYMBOL_LAYOUTS: Final[Sequence[tuple[float, int]]] = (
+    (0.5, 120),
+    (0.5, 64),
+    (0.4, 144),
+    (0.3, 40),
+)
+
+
+def _make_symbol(symbol_modules: int, random_generator: random.Random) -> Image.Image:
+    last_module: int = symbol_modules - 1
+    symbol_image: Image.Image = Image.new("L", (symbol_modules, symbol_modules), 255)
+
+    # NOTE: Only the finder and timing edges matter to the locator, so the data is random
+    x: int
+    y: int
+    for y in range(1, last_module):
+        for x in range(1, last_module):
+            if random_generator.random() < DARK_MODULE_RATIO:
+                symbol_image.putpixel((x, y), 0)
+
+    position: int
+    for position in range(symbol_modules):
+        symbol_image.putpixel((0, position), 0)
+        symbol_image.putpixel((position, last_module), 0)
+
+        if position % 2 == 0:
+            symbol_image.putpixel((position, 0), 0)
+            symbol_image.putpixel((last_module, last_module - position), 0)
+
+    return symbol_image
+
+
+def _to_pixels(millimetres: float, resolution: int) -> int:
+    return round(millimetres * resolution / MILLIMETRES_PER_INCH)
+
+
+def _make_scanned_sheet(
+    page_layout: PageLayout, symbol_modules: int, resolution: int
+) -> tuple[Image.Image, Sequence[decoder.SymbolRegion]]:
+    random_generator: random.Random = random.Random(0)  # noqa: S311
+    scanned_sheet: Image.Image = Image.new(
+        "L", (_to_pixels(PAPER_WIDTH, resolution), _to_pixels(PAPER_HEIGHT, resolution)), 255
+    )
+    symbol_size: int = _to_pixels(symbol_modules * page_layout.module_size, resolution)
+    symbol_bounds: list[decoder.SymbolRegion] = []
+
+    # NOTE: Like the printer, each symbol keeps libdmtx's margin inside its slot,
+    # so neighbouring symbols are that margin plus the layout's quiet zone apart
+    symbol_index: int
+    for symbol_index in range(page_layout.slots_per_page):
+        left: int = _to_pixels(
+            page_layout.locate(symbol_index).x + DMTX_MARGIN_MODULES * page_layout.module_size,
+            resolution,
+        )
+        top: int = _to_pixels(
+            page_layout.locate(symbol_index).y + DMTX_MARGIN_MODULES * page_layout.module_size,
+            resolution,
+        )
+        scanned_sheet.paste(
+            _make_symbol(symbol_modules, random_generator).resize(
+                (symbol_size, symbol_size), Image.Resampling.NEAREST
+            ),
+            (left, top),
+        )
+        symbol_bounds.append(
+            decoder.SymbolRegion(left, top, left + symbol_size, top + symbol_size)
+        )
+
+    return scanned_sheet.filter(ImageFilter.GaussianBlur(SCAN_BLUR_RADIUS)), symbol_bounds
+
+
+def _holds_symbol(
+    symbol_region: decoder.SymbolRegion, symbol_bound: decoder.SymbolRegion
+) -> bool:
+    return (
+        symbol_region.left <= symbol_bound.left
+        and symbol_region.top <= symbol_bound.top
+        and symbol_bound.right <= symbol_region.right
+        and symbol_bound.bottom <= symbol_region.bottom
+    )
+
+
+def _count_located_slots(
+    symbol_regions: Sequence[decoder.SymbolRegion],
+    symbol_bounds: Sequence[decoder.SymbolRegion],
+) -> int:
+    held_symbols_counts: Sequence[int] = [
+        sum(_holds_symbol(symbol_region, symbol_bound) for symbol_bound in symbol_bounds)
+        for symbol_region in symbol_regions
+    ]
+
+    # NOTE: A slot only counts once exactly one region holds its whole symbol,
+    # and that region holds no other symbol
+    return sum(
+        [
+            held_symbols_count
+            for symbol_region, held_symbols_count in zip(
+                symbol_regions, held_symbols_counts, strict=True
+            )
+            if _holds_symbol(symbol_region, symbol_bound)
+        ]
+        == [1]
+        for symbol_bound in symbol_bounds
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv:
+        sys.stderr.write("Command line arguments not recognized\n")
+        return -1
+
+    sys.stdout.write(
+        f"Locating every symbol on a synthetic {PAPER_WIDTH:.0f}x{PAPER_HEIGHT:.0f}mm sheet\n"
+    )
+    sys.stdout.write(
+        f"{'module mm':>9} {'modules':>7} {'dpi':>4} "
+        f"{'slots':>5} {'found':>5} {'ms/sheet':>9}\n"
+    )
+
+    is_complete: bool = True
+
+    module_size: float
+    symbol_modules: int
+    for module_size, symbol_modules in SYMBOL_LAYOUTS:
+        page_layout: PageLayout = PageLayout(
+            PAPER_WIDTH, PAPER_HEIGHT, PAGE_MARGIN, module_size, symbol_modules
+        )
+
+        resolution: int
+        for resolution in SCAN_RESOLUTIONS:
+            # NOTE: Below two pixels per module, libdmtx could not read the symbols anyway
+            if module_size * resolution / MILLIMETRES_PER_INCH < MIN_MODULE_PIXELS:
+                continue
+
+            scanned_sheet: Image.Image
+            symbol_bounds: Sequence[decoder.SymbolRegion]
+            scanned_sheet, symbol_bounds = _make_scanned_sheet(
+                page_layout, symbol_modules, resolution
+            )
+
+            start_time: float = time.perf_counter()
+            symbol_regions: Sequence[decoder.SymbolRegion] = decoder.locate_symbol_regions(
+                scanned_sheet
+            )
+            locate_duration: float = time.perf_counter() - start_time
+
+            located_slots_count: int = _count_located_slots(symbol_regions, symbol_bounds)
+            is_complete = is_complete and located_slots_count == page_layout.slots_per_page
+
+            sys.stdout.write(
+                f"{module_size:>9.1f} {symbol_modules:>7} {resolution:>4} "
+                f"{page_layout.slots_per_page:>5} {located_slots_count:>5} "
+                f"{1000 * locate_duration:>9.1f}\n"
+            )
+
+    if not is_complete:
+        sys.stderr.write("Some sheets did not yield a region for every slot\n")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
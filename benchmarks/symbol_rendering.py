@@ -0,0 +1,93 @@
+""""""
+
+import random
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from printer import pdf
+from printer.config import SymbolRendering
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ()
+
+
+PAGES_COUNT: Final[int] = 4
+STARTING_PAGE_NUMBER: Final[int] = 0
+REPEATS: Final[int] = 3
+BASELINE_SYMBOL_RENDERING: Final[SymbolRendering] = SymbolRendering.RASTER
+
+
+def _time_bytes_into_pdf(
+    content: bytes, symbol_rendering: SymbolRendering
+) -> tuple[float, pdf.RenderedPDF]:
+    # NOTE: Render once first, so that encoder pool start-up time is not measured
+    rendered_pdf: pdf.RenderedPDF = pdf.bytes_into_pdf(
+        content, STARTING_PAGE_NUMBER, symbol_rendering=symbol_rendering
+    )
+
+    best_duration: float = float("inf")
+    for _ in range(REPEATS):
+        start_time: float = time.perf_counter()
+        pdf.bytes_into_pdf(content, STARTING_PAGE_NUMBER, symbol_rendering=symbol_rendering)
+        best_duration = min(best_duration, time.perf_counter() - start_time)
+
+    return best_duration, rendered_pdf
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv:
+        sys.stderr.write("Command line arguments not recognized\n")
+        return -1
+
+    # NOTE: Random bytes do not compress, so every rendering prints the same full pages
+    random_generator: random.Random = random.Random(0)  # noqa: S311
+    content: bytes = random_generator.randbytes(
+        PAGES_COUNT * pdf.get_page_capacity(STARTING_PAGE_NUMBER)
+    )
+
+    sys.stdout.write(
+        f"Rendering {len(content)} bytes with each symbol rendering (best of {REPEATS})\n"
+    )
+
+    try:
+        results: Mapping[SymbolRendering, tuple[float, pdf.RenderedPDF]] = {
+            symbol_rendering: _time_bytes_into_pdf(content, symbol_rendering)
+            for symbol_rendering in SymbolRendering
+        }
+    finally:
+        pdf.shutdown_encoder_pools()
+
+    baseline_duration: float
+    baseline_rendered_pdf: pdf.RenderedPDF
+    baseline_duration, baseline_rendered_pdf = results[BASELINE_SYMBOL_RENDERING]
+
+    sys.stdout.write(
+        f"{'rendering':>10} {'pages':>6} {'ms/page':>8} {'KiB/page':>9} "
+        f"{'speedup':>8} {'size':>7}\n"
+    )
+
+    symbol_rendering: SymbolRendering
+    duration: float
+    rendered_pdf: pdf.RenderedPDF
+    for symbol_rendering, (duration, rendered_pdf) in results.items():
+        pages_count: int = rendered_pdf.pages_count
+        pdf_size: int = len(rendered_pdf.pdf_bytes)
+        sys.stdout.write(
+            f"{symbol_rendering.name:>10} {pages_count:>6} "
+            f"{duration / pages_count * 1000:>8.1f} {pdf_size / pages_count / 1024:>9.1f} "
+            f"{baseline_duration / duration:>7.2f}x "
+            f"{pdf_size / len(baseline_rendered_pdf.pdf_bytes):>7.1%}\n"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,267 @@
+""""""
+
+import hashlib
+import os
+import random
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple, Protocol
+
+from printer import tun as printer_tun
+from printer.framing import PACKET_LENGTH_SIZE, PacketFramer
+from scanner import framing as scanner_framing
+from scanner import tun as scanner_tun
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ()
+
+
+PACKETS_COUNT: Final[int] = 20000
+PACKET_SIZES: Final[range] = range(40, 1501)
+REPEATS: Final[int] = 3
+
+
+class TunBackendResult(NamedTuple):
+    """"""
+
+    direction: str
+    relayed_packets_per_second: float
+    direct_packets_per_second: float
+
+
+class _DirectionMeasurement(Protocol):
+    def __call__(self, packets: Sequence[bytes], *, is_relayed: bool) -> float: ...
+
+
+def _make_packets() -> Sequence[bytes]:
+    random_generator: random.Random = random.Random(0)  # noqa: S311
+    return [
+        random_generator.randbytes(random_generator.choice(PACKET_SIZES))
+        for _ in range(PACKETS_COUNT)
+    ]
+
+
+def _get_packets_digest(packets: Sequence[bytes]) -> bytes:
+    packets_hash: hashlib._Hash = hashlib.sha256()
+
+    packet: bytes
+    for packet in packets:
+        packets_hash.update(len(packet).to_bytes(PACKET_LENGTH_SIZE, byteorder="big"))
+        packets_hash.update(packet)
+
+    return packets_hash.digest()
+
+
+def _receive_packets(
+    packet_framer: PacketFramer | printer_tun.TunPacketReader, packets_count: int
+) -> bytes:
+    packets_hash: hashlib._Hash = hashlib.sha256()
+
+    for _ in range(packets_count):
+        packet: memoryview | None = packet_framer.read_packet(None)
+        while packet is None:
+            packet = packet_framer.read_packet(None)
+
+        packets_hash.update(len(packet).to_bytes(PACKET_LENGTH_SIZE, byteorder="big"))
+        packets_hash.update(packet)
+
+    return packets_hash.digest()
+
+
+def _send_packets(fd: int, packets: Sequence[bytes]) -> None:
+    packet: bytes
+    for packet in packets:
+        os.write(fd, packet)
+
+
+def _relay_outbound(tun_fd: int, pipe_fd: int, packets_count: int) -> None:
+    # NOTE: A stand-in for tunclient, which writes each packet's length and then the packet
+    tun_packet_reader: printer_tun.TunPacketReader = printer_tun.TunPacketReader(tun_fd)
+    try:
+        for _ in range(packets_count):
+            packet: memoryview | None = tun_packet_reader.read_packet(None)
+            while packet is None:
+                packet = tun_packet_reader.read_packet(None)
+
+            os.write(pipe_fd, len(packet).to_bytes(PACKET_LENGTH_SIZE, byteorder="big"))
+            os.write(pipe_fd, packet)
+
+    finally:
+        tun_packet_reader.close()
+        os.close(pipe_fd)
+
+
+def _relay_inbound(pipe_fd: int, tun_fd: int, packets_count: int) -> None:
+    # NOTE: A stand-in for tunclient, which injects each packet it reads from the FIFO
+    packet_framer: PacketFramer = PacketFramer(pipe_fd)
+    try:
+        for _ in range(packets_count):
+            packet: memoryview | None = packet_framer.read_packet(None)
+            while packet is None:
+                packet = packet_framer.read_packet(None)
+
+            scanner_tun.inject_packets(tun_fd, (bytes(packet),))
+
+    finally:
+        packet_framer.close()
+        os.close(pipe_fd)
+
+
+def _measure_outbound(packets: Sequence[bytes], *, is_relayed: bool) -> float:
+    device_fd: int
+    kernel_fd: int
+    device_fd, kernel_fd = printer_tun.open_mock_tun_device()
+
+    threads: list[threading.Thread] = [
+        threading.Thread(target=_send_packets, args=(kernel_fd, packets))
+    ]
+    read_fd: int | None = None
+    if is_relayed:
+        write_fd: int
+        read_fd, write_fd = os.pipe()
+        threads.append(
+            threading.Thread(target=_relay_outbound, args=(device_fd, write_fd, len(packets)))
+        )
+        packet_framer: PacketFramer | printer_tun.TunPacketReader = PacketFramer(read_fd)
+    else:
+        packet_framer = printer_tun.TunPacketReader(device_fd)
+
+    start_time: float = time.perf_counter()
+    try:
+        thread: threading.Thread
+        for thread in threads:
+            thread.start()
+
+        packets_digest: bytes = _receive_packets(packet_framer, len(packets))
+        duration: float = time.perf_counter() - start_time
+
+        for thread in threads:
+            thread.join()
+
+    finally:
+        packet_framer.close()
+        os.close(kernel_fd)
+        if read_fd is not None:
+            os.close(read_fd)
+
+    if packets_digest != _get_packets_digest(packets):
+        ROUND_TRIP_FAILED_MESSAGE: Final[str] = "Outbound packets did not arrive intact."
+        raise ValueError(ROUND_TRIP_FAILED_MESSAGE)
+
+    return duration
+
+
+def _measure_inbound(packets: Sequence[bytes], *, is_relayed: bool) -> float:
+    device_fd: int
+    kernel_fd: int
+    device_fd, kernel_fd = scanner_tun.open_mock_tun_device()
+
+    packets_digests: list[bytes] = []
+    kernel_packet_reader: printer_tun.TunPacketReader = printer_tun.TunPacketReader(kernel_fd)
+    threads: list[threading.Thread] = [
+        threading.Thread(
+            target=lambda: packets_digests.append(
+                _receive_packets(kernel_packet_reader, len(packets))
+            )
+        )
+    ]
+    write_fd: int | None = None
+    if is_relayed:
+        read_fd: int
+        read_fd, write_fd = os.pipe()
+        threads.append(
+            threading.Thread(target=_relay_inbound, args=(read_fd, device_fd, len(packets)))
+        )
+
+    start_time: float = time.perf_counter()
+    try:
+        thread: threading.Thread
+        for thread in threads:
+            thread.start()
+
+        if write_fd is not None:
+            # NOTE: The scanner writes every length-prefixed packet to the FIFO at once
+            os.write(write_fd, scanner_framing.frame_packets(packets))
+        else:
+            scanner_tun.inject_packets(device_fd, packets)
+
+        for thread in threads:
+            thread.join()
+
+        duration: float = time.perf_counter() - start_time
+
+    finally:
+        kernel_packet_reader.close()
+        os.close(device_fd)
+        if write_fd is not None:
+            os.close(write_fd)
+
+    if packets_digests != [_get_packets_digest(packets)]:
+        ROUND_TRIP_FAILED_MESSAGE: Final[str] = "Inbound packets did not arrive intact."
+        raise ValueError(ROUND_TRIP_FAILED_MESSAGE)
+
+    return duration
+
+
+def _time_direction(
+    measure: _DirectionMeasurement, packets: Sequence[bytes], *, is_relayed: bool
+) -> float:
+    return min(measure(packets, is_relayed=is_relayed) for _ in range(REPEATS))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv:
+        sys.stderr.write("Command line arguments not recognized\n")
+        return -1
+
+    packets: Sequence[bytes] = _make_packets()
+
+    sys.stdout.write(
+        f"Passing {len(packets)} packets of {PACKET_SIZES.start} to {PACKET_SIZES.stop - 1} "
+        f"bytes through a mock TUN device (best of {REPEATS})\n"
+    )
+
+    results: list[TunBackendResult] = []
+
+    direction: str
+    measure: _DirectionMeasurement
+    for direction, measure in (("outbound", _measure_outbound), ("inbound", _measure_inbound)):
+        try:
+            relayed_duration: float = _time_direction(measure, packets, is_relayed=True)
+            direct_duration: float = _time_direction(measure, packets, is_relayed=False)
+        except ValueError as e:
+            sys.stderr.write(f"{e}\n")
+            return 1
+
+        results.append(
+            TunBackendResult(
+                direction=direction,
+                relayed_packets_per_second=len(packets) / relayed_duration,
+                direct_packets_per_second=len(packets) / direct_duration,
+            )
+        )
+
+    sys.stdout.write(
+        f"{'direction':>9} {'relayed packets/s':>18} {'direct packets/s':>17} {'speedup':>8}\n"
+    )
+
+    result: TunBackendResult
+    for result in results:
+        sys.stdout.write(
+            f"{result.direction:>9} {result.relayed_packets_per_second:>18.0f} "
+            f"{result.direct_packets_per_second:>17.0f} "
+            f"{result.direct_packets_per_second / result.relayed_packets_per_second:>7.2f}x\n"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -65,14 +65,63 @@ void size_to_big_endian_bytes(u_int8_t *buf, ssize_t n) {
     buf[2] = (n & 0x0000ff);
 }
 
+size_t big_endian_bytes_to_size(const u_int8_t *buf) {
+    return ((size_t) buf[0] << 16) | ((size_t) buf[1] << 8) | (size_t) buf[2];
+}
+
 #define TUN_MTU 1500
+#define PACKET_LENGTH_SIZE 3
+#define MAX_PACKET_SIZE 0xffff
+#define IPC_INPUT_BUFFER_SIZE (64 * 1024 + PACKET_LENGTH_SIZE + MAX_PACKET_SIZE)
+
+ssize_t inject_packets(int tun_fd, const u_int8_t *buf, size_t n_bytes, int *n_packets_ptr) {
+    // inject_packets writes every whole length-prefixed packet at the start of buf to the TUN
+    // device, one write per packet as the TUN device takes exactly one packet per write.
+    // the number of packets written is placed in n_packets_ptr. returns the number of bytes
+    // used up, which leaves any trailing partial packet for the next call, or -1 if a packet
+    // length is invalid, in which case the packet boundaries have been lost
+    size_t offset = 0;
+    size_t packet_size;
+    int n_packets = 0;
+
+    while (n_bytes - offset >= PACKET_LENGTH_SIZE) {
+        packet_size = big_endian_bytes_to_size(buf + offset);
+        if (packet_size == 0 || packet_size > MAX_PACKET_SIZE) {
+            *n_packets_ptr = n_packets;
+            return -1;
+        }
+
+        if (n_bytes - offset - PACKET_LENGTH_SIZE < packet_size) {
+            break;
+        }
+
+        // a packet that the kernel refuses is dropped on its own, without losing the rest
+        if (write(tun_fd, buf + offset + PACKET_LENGTH_SIZE, packet_size) < 0) {
+            perror("write to tun");
+        } else {
+            n_packets += 1;
+        }
+
+        offset += PACKET_LENGTH_SIZE + packet_size;
+    }
+
+    *n_packets_ptr = n_packets;
+    return (ssize_t) offset;
+}
 
 int tun_readloop(int tun_fd, int downstream_fd, int ipc_input_fd) {
-    ssize_t n_bytes_read, n_bytes_written;
+    ssize_t n_bytes_read, n_bytes_written, n_bytes_used;
     char buf[TUN_MTU];
     u_int8_t len_notify[3];
     struct pollfd poll_fds[2];
 
+    // the IPC input carries the same 3-byte length-prefixed packets as the downstream pipe.
+    // it is reassembled here, as a read may end part way through a packet, and always has
+    // room left for the rest of the largest possible packet
+    static u_int8_t ipc_buf[IPC_INPUT_BUFFER_SIZE];
+    size_t ipc_buf_len = 0;
+    int n_packets;
+
 #define IDX_TUN 0
 #define IDX_IPC_IN 1
 
@@ -115,19 +164,27 @@ int tun_readloop(int tun_fd, int downstream_fd, int ipc_input_fd) {
         }
 
         if (poll_fds[IDX_IPC_IN].revents & POLLIN) {
-            n_bytes_read = read(poll_fds[IDX_IPC_IN].fd, buf, sizeof(buf));
-            if (n_bytes_read < 0) {
+            n_bytes_read = read(poll_fds[IDX_IPC_IN].fd, ipc_buf + ipc_buf_len,
+                                sizeof(ipc_buf) - ipc_buf_len);
+            if (n_bytes_read < 0 && errno != EAGAIN) {
                 perror("read from IPC input");
                 return n_bytes_read;
             }
-            printf("IPC input: read %zd bytes\n", n_bytes_read);
 
             if (n_bytes_read > 0) {
-                if ((n_bytes_written = write(poll_fds[IDX_TUN].fd, buf, n_bytes_read)) < 0) {
-                    perror("write to tun");
-                    return n_bytes_written;
+                printf("IPC input: read %zd bytes\n", n_bytes_read);
+                ipc_buf_len += n_bytes_read;
+
+                n_bytes_used = inject_packets(poll_fds[IDX_TUN].fd, ipc_buf, ipc_buf_len, &n_packets);
+                if (n_bytes_used < 0) {
+                    fprintf(stderr, "IPC input: invalid packet length, dropped %zu buffered bytes\n",
+                            ipc_buf_len);
+                    ipc_buf_len = 0;
+                } else {
+                    memmove(ipc_buf, ipc_buf + n_bytes_used, ipc_buf_len - n_bytes_used);
+                    ipc_buf_len -= n_bytes_used;
                 }
-                printf("tun: wrote %zd bytes\n", n_bytes_written);
+                printf("tun: wrote %d packets\n", n_packets);
             }
         }
     }
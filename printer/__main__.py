@@ -1,16 +1,19 @@
 """"""
 
 import logging
-import re
-import select
 import shutil
-import subprocess
 import sys
+import time
 from subprocess import CalledProcessError
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
-from . import config, pdf, utils
+from . import config, metrics, pdf, tun, utils
+from .aggregation import get_frame_aggregator
 from .config import settings
+from .dedup import PacketDeduplicator
+from .framing import PacketFramer
+from .spool import PrintSpool
+from .tun import TunPacketReader
 from .utils import GracefulTerminationHandler, PerformGracefulTermination
 
 if TYPE_CHECKING:
@@ -18,6 +21,8 @@ if TYPE_CHECKING:
     from logging import Logger
     from typing import Final
 
+    from .aggregation import FrameAggregator
+
 
 __all__: Sequence[str] = ()
 
@@ -25,88 +30,140 @@ __all__: Sequence[str] = ()
 logger: Final[Logger] = logging.getLogger("ipops-printer")
 
 
-def _get_ipops_frames(existing_data: bytes) -> bytes:
-    if existing_data:
-        if not select.select([sys.stdin], [], [], settings.CONTIGUOUS_DATA_TIMEOUT)[0]:
-            logger.debug("Timed-out while waiting for further IP packets")
-            return existing_data
-    else:
-        while not select.select([sys.stdin], [], [], settings.NEW_FRAME_POLLING_RATE)[0]:
-            if GracefulTerminationHandler.EXIT_NOW:
-                raise PerformGracefulTermination
+class _FrameReader(NamedTuple):
+    packet_framer: PacketFramer | TunPacketReader
+    frame_aggregator: FrameAggregator
+    packet_deduplicator: PacketDeduplicator
+
 
-    logger.debug("Ready to accept IP packet from stdin")
+def _wait_for_first_packet(frame_reader: _FrameReader, print_spool: PrintSpool) -> memoryview:
+    while True:
+        packet: memoryview | None = frame_reader.packet_framer.read_packet(
+            settings.NEW_FRAME_POLLING_RATE
+        )
+        if packet is not None and not packet:
+            logger.info("Skipping packet: size was %d bytes", len(packet))
+        elif packet is not None and not frame_reader.packet_deduplicator.is_duplicate(
+            packet, time.monotonic()
+        ):
+            return packet
 
-    frame_size: int = int.from_bytes(sys.stdin.buffer.read(3), byteorder="big")
+        if GracefulTerminationHandler.EXIT_NOW or print_spool.is_failed:
+            raise PerformGracefulTermination
 
-    if frame_size == 0:
-        logger.info("Skipping packet: size was %d bytes", frame_size)
-        return existing_data
 
-    if frame_size < 0:
-        NEGATIVE_FRAME_SIZE_MESSAGE: Final[str] = f"Negative packet size: {frame_size} bytes."
-        raise ValueError(NEGATIVE_FRAME_SIZE_MESSAGE)
+def _read_next_packet(
+    frame_reader: _FrameReader, frame_size: int, timeout: float
+) -> memoryview | None:
+    deadline: float = time.monotonic() + timeout
 
-    logger.debug("Reading packet from stdin: size %d bytes", frame_size)
+    while True:
+        packet: memoryview | None = frame_reader.packet_framer.read_packet(
+            max(deadline - time.monotonic(), 0)
+        )
+        if packet is None:
+            logger.debug("Timed-out while waiting for further IP packets")
+            return None
 
-    existing_data += sys.stdin.buffer.read(frame_size)
+        if not packet:
+            logger.info("Skipping packet: size was %d bytes", len(packet))
+            return None
 
-    logger.debug("Current IPoPS frame buffer size: %d", len(existing_data))
+        if not frame_reader.frame_aggregator.accepts_packet(frame_size, len(packet)):
+            logger.debug("Flushing IPoPS frame: next packet does not fit onto the page")
+            frame_reader.packet_framer.unread_packet()
+            return None
 
-    if len(existing_data) < settings.MIN_CONTIGUOUS_BUFFER_SIZE:
-        logger.debug("Attempting to add more IP packets into a single IPoPS frame")
-        return _get_ipops_frames(existing_data)
+        # NOTE: The duplicate check comes last, so a packet handed back to the framer
+        # is not mistaken for a duplicate when it starts the next frame
+        if not frame_reader.packet_deduplicator.is_duplicate(packet, time.monotonic()):
+            return packet
 
-    logger.debug("IPoPS frame buffer filled")
-    return existing_data
 
+def _get_ipops_frame(frame_reader: _FrameReader, print_spool: PrintSpool) -> bytes:
+    ipops_frame: bytearray = bytearray()
 
-def _run_print_loop(lp_executable: str, starting_page_number: int) -> int:
     try:
-        ipops_frames_data: bytes = _get_ipops_frames(existing_data=b"")
-    except PerformGracefulTermination:
-        return starting_page_number
+        packet: memoryview | None = _wait_for_first_packet(frame_reader, print_spool)
+        frame_reader.frame_aggregator.start_frame(time.monotonic())
 
-    logger.debug("Byte reading completed successfully")
+        while packet is not None:
+            logger.debug("Read packet: size %d bytes", len(packet))
 
-    if not ipops_frames_data:
-        logger.debug("Skipping printing empty IPoPS frame")
-        return starting_page_number
+            # NOTE: The packet is a view into the framer's buffer, so it is copied
+            # exactly once, straight into the frame
+            ipops_frame += packet
+            metrics.PACKETS_RECEIVED.inc()
+            metrics.BYTES_RECEIVED.inc(len(packet))
 
-    pdf_bytes: bytearray
-    pdf_pages_count: int
-    pdf_bytes, pdf_pages_count = pdf.bytes_into_pdf(
-        ipops_frames_data, starting_page_number=starting_page_number
-    )
+            logger.debug("Current IPoPS frame buffer size: %d", len(ipops_frame))
 
-    completed_print_subprocess_stdout: str = subprocess.run(
-        (lp_executable,),
-        check=True,
-        input=pdf_bytes,
-        stdout=subprocess.PIPE,
-        text=False,
-        timeout=None,
-    ).stdout.decode()
-    if completed_print_subprocess_stdout:
-        known_stdout_match: re.Match[str] | None = re.fullmatch(
-            r"\Arequest id is (?P<job_id>[\w-]+) \((?P<files_count>\d+) file\(s\)\)\n\Z",
-            completed_print_subprocess_stdout,
-        )
-        if known_stdout_match is not None:
-            logger.debug(
-                "Printed %s file(s) with job ID '%s'",
-                known_stdout_match.group("files_count"),
-                known_stdout_match.group("job_id"),
-            )
-        else:
-            logger.warning(
-                "Subprocess call to 'lp' had stdout: %s",
-                repr(completed_print_subprocess_stdout),
+            wait_timeout: float | None = frame_reader.frame_aggregator.add_packet(
+                len(ipops_frame), time.monotonic()
             )
+            if wait_timeout is None:
+                logger.debug("IPoPS frame buffer filled")
+                break
+
+            logger.debug("Attempting to add more IP packets into a single IPoPS frame")
+            packet = _read_next_packet(frame_reader, len(ipops_frame), wait_timeout)
+
+    except EOFError:
+        # NOTE: A partial frame is still printed, as the next read reaches the end again
+        if not ipops_frame:
+            logger.info("Packet source was closed, no more IP packets will arrive")
+            raise PerformGracefulTermination from None
+
+    return bytes(ipops_frame)
+
+
+def _should_stop_submitting() -> bool:
+    return GracefulTerminationHandler.EXIT_NOW
+
+
+def _run_read_loop(
+    frame_reader: _FrameReader,
+    print_spool: PrintSpool,
+    spooled_frames: Sequence[bytes],
+) -> Sequence[bytes]:
+    # NOTE: Returns every frame that could not be handed to the print spool before exiting
+    frame_index: int
+    spooled_frame: bytes
+    for frame_index, spooled_frame in enumerate(spooled_frames):
+        if not print_spool.submit(spooled_frame, _should_stop_submitting):
+            return spooled_frames[frame_index:]
+
+    while not GracefulTerminationHandler.EXIT_NOW and not print_spool.is_failed:
+        try:
+            ipops_frames_data: bytes = _get_ipops_frame(frame_reader, print_spool)
+        except PerformGracefulTermination:
+            break
+
+        logger.debug("Byte reading completed successfully")
+
+        if not ipops_frames_data:
+            logger.debug("Skipping printing empty IPoPS frame")
+            continue
+
+        if not print_spool.submit(ipops_frames_data, _should_stop_submitting):
+            return (ipops_frames_data,)
+
+    return ()
+
 
-    logger.debug("Printing PDF completed successfully")
+def _open_packet_framer() -> PacketFramer | TunPacketReader | None:
+    # NOTE: Without a TUN device, packets arrive on stdin from tunclient, length-prefixed
+    if settings.TUN_DEVICE is None:
+        return PacketFramer(sys.stdin.fileno())
 
-    return starting_page_number + pdf_pages_count
+    try:
+        tun_fd: int = tun.open_tun_device(settings.TUN_DEVICE)
+    except OSError as e:
+        logger.error("Could not open the TUN device %r: %s", settings.TUN_DEVICE, e)
+        return None
+
+    logger.info("Reading IP packets from the TUN device %r", settings.TUN_DEVICE)
+    return TunPacketReader(tun_fd)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -120,7 +177,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         return -1
 
     lp_executable: str | None = shutil.which("lp")
-    if lp_executable is None:
+    if lp_executable is None and settings.OUTPUT_DIRECTORY is None:
         logger.error("The 'lp' executable could not be found.")
         logger.info(
             "Ensure CUPS is installed on your Linux system "
@@ -128,29 +185,84 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
         return 1
 
-    starting_page_number: int = utils.load_starting_page_number()
+    packet_framer: PacketFramer | TunPacketReader | None = _open_packet_framer()
+    if packet_framer is None:
+        return 1
+
+    print_spool: PrintSpool = PrintSpool(
+        lp_executable, utils.load_starting_page_number(), settings.SPOOL_DEPTH
+    )
+
+    frame_reader: _FrameReader = _FrameReader(
+        packet_framer=packet_framer,
+        frame_aggregator=get_frame_aggregator(
+            pdf.get_frame_capacity(print_spool.next_page_number)
+        ),
+        packet_deduplicator=PacketDeduplicator(
+            settings.DEDUP_WINDOW, settings.DEDUP_CACHE_SIZE, settings.DEDUP_EXEMPT_PROTOCOLS
+        ),
+    )
+
+    metrics_exporter: metrics.MetricsExporter = metrics.MetricsExporter(
+        metrics.REGISTRY, settings.METRICS_PORT, settings.METRICS_FILE, logger
+    )
+    try:
+        metrics_exporter.start()
+    except OSError as e:
+        logger.error("Could not start the metrics exporter: %s", e)
+        return 2
 
     logger.info("Starting listener loop")
 
     GracefulTerminationHandler.setup()
 
-    try:
-        while not GracefulTerminationHandler.EXIT_NOW:
-            starting_page_number = _run_print_loop(lp_executable, starting_page_number)
+    print_spool.start()
 
-    except CalledProcessError as e:
-        logger.error("Subrocess call to 'lp' failed with exit code %d", e.returncode)
-        logger.info("Subprocess call to 'lp' had stderr: %s", repr(e.stderr))
-        logger.info("Subprocess call to 'lp' had stdout: %s", repr(e.stdout))
-        return 3
+    unsubmitted_frames: Sequence[bytes] = ()
+    try:
+        unsubmitted_frames = _run_read_loop(
+            frame_reader, print_spool, utils.load_spooled_frames()
+        )
 
     except ValueError as e:
         logger.error(str(e).strip("\n\r\t ."))
         return 2
 
-    logger.info("Ended listener loop")
+    finally:
+        frame_reader.packet_framer.close()
+        logger.info("Draining print spool")
+        utils.save_spooled_frames((*print_spool.shutdown(), *unsubmitted_frames))
+        utils.save_starting_page_number(print_spool.printed_page_number)
+        pdf.shutdown_encoder_pools()
+        metrics_exporter.stop()
+
+        if frame_reader.packet_deduplicator.suppressed_packets_count:
+            logger.info(
+                "Suppressed %d duplicate packet(s), totalling %d bytes",
+                frame_reader.packet_deduplicator.suppressed_packets_count,
+                frame_reader.packet_deduplicator.suppressed_bytes_count,
+            )
+
+    match print_spool.error:
+        case None:
+            pass
 
-    utils.save_starting_page_number(starting_page_number)
+        case CalledProcessError() as print_error:
+            logger.error(
+                "Subrocess call to 'lp' failed with exit code %d", print_error.returncode
+            )
+            logger.info("Subprocess call to 'lp' had stderr: %s", repr(print_error.stderr))
+            logger.info("Subprocess call to 'lp' had stdout: %s", repr(print_error.stdout))
+            return 3
+
+        case ValueError() as print_error:
+            logger.error(str(print_error).strip("\n\r\t ."))
+            return 2
+
+        case print_error:
+            raise print_error
+
+    logger.info("Ended listener loop")
 
     logger.info("Exiting")
 
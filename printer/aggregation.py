@@ -0,0 +1,148 @@
+""""""
+
+import abc
+import logging
+from typing import TYPE_CHECKING, override
+
+from .config import AggregationPolicy, settings
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from logging import Logger
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "AdaptiveFrameAggregator",
+    "FixedFrameAggregator",
+    "FrameAggregator",
+    "get_frame_aggregator",
+)
+
+
+logger: Final[Logger] = logging.getLogger("ipops-printer")
+
+
+# NOTE: Smoothing gains and variation multiplier of the TCP retransmission timer (RFC 6298)
+INTERVAL_GAIN: Final[float] = 1 / 8
+INTERVAL_VARIATION_GAIN: Final[float] = 1 / 4
+INTERVAL_VARIATION_MULTIPLIER: Final[int] = 4
+MIN_IDLE_TIMEOUT: Final[float] = 0.01
+
+
+class FrameAggregator(abc.ABC):
+    """"""
+
+    def start_frame(self, arrival_time: float) -> None:  # noqa: B027
+        """"""
+
+    def accepts_packet(self, frame_size: int, packet_size: int) -> bool:  # noqa: ARG002
+        """"""
+        return True
+
+    @abc.abstractmethod
+    def add_packet(self, frame_size: int, arrival_time: float) -> float | None:
+        """"""
+
+
+class FixedFrameAggregator(FrameAggregator):
+    """"""
+
+    @override
+    def add_packet(self, frame_size: int, arrival_time: float) -> float | None:
+        if frame_size >= settings.MIN_CONTIGUOUS_BUFFER_SIZE:
+            return None
+
+        contiguous_data_timeout: float = settings.CONTIGUOUS_DATA_TIMEOUT
+        return contiguous_data_timeout
+
+
+class AdaptiveFrameAggregator(FrameAggregator):
+    """"""
+
+    def __init__(self, frame_capacity: int) -> None:
+        """"""
+        # NOTE: The capacity is counted in uncompressed frame bytes, measured once for the
+        # first page to be printed. Compression only ever shrinks a frame, so a full frame
+        # still fits onto its pages, but it may not fill them once compressed
+        self.frame_capacity: int = frame_capacity
+        self.smoothed_interval: float | None = None
+        self.interval_variation: float = 0.0
+
+        self._frame_deadline: float = 0.0
+        self._last_arrival_time: float | None = None
+
+    @property
+    def idle_timeout(self) -> float:
+        """"""
+        contiguous_data_timeout: float = settings.CONTIGUOUS_DATA_TIMEOUT
+        if self.smoothed_interval is None:
+            return contiguous_data_timeout
+
+        return min(
+            max(
+                self.smoothed_interval
+                + INTERVAL_VARIATION_MULTIPLIER * self.interval_variation,
+                MIN_IDLE_TIMEOUT,
+            ),
+            contiguous_data_timeout,
+        )
+
+    def _record_interval(self, interval: float) -> None:
+        if self.smoothed_interval is None:
+            self.smoothed_interval = interval
+            self.interval_variation = interval / 2
+            return
+
+        self.interval_variation += INTERVAL_VARIATION_GAIN * (
+            abs(self.smoothed_interval - interval) - self.interval_variation
+        )
+        self.smoothed_interval += INTERVAL_GAIN * (interval - self.smoothed_interval)
+
+    @override
+    def start_frame(self, arrival_time: float) -> None:
+        self._frame_deadline = arrival_time + settings.FRAME_DEADLINE
+
+        # NOTE: Gaps between frames include idle periods and spool back-pressure,
+        # so only gaps between packets of the same frame are learnt from
+        self._last_arrival_time = None
+
+    @override
+    def accepts_packet(self, frame_size: int, packet_size: int) -> bool:
+        # NOTE: A packet that would spill onto a mostly empty extra page starts the next
+        # frame instead, unless it is too large to fit into any single frame
+        return not frame_size or frame_size + packet_size <= self.frame_capacity
+
+    @override
+    def add_packet(self, frame_size: int, arrival_time: float) -> float | None:
+        if self._last_arrival_time is not None:
+            self._record_interval(arrival_time - self._last_arrival_time)
+        self._last_arrival_time = arrival_time
+
+        if frame_size >= self.frame_capacity:
+            logger.debug("Flushing IPoPS frame: uncompressed frame capacity reached")
+            return None
+
+        if arrival_time >= self._frame_deadline:
+            logger.debug("Flushing IPoPS frame: frame deadline reached")
+            return None
+
+        # NOTE: Waiting longer than the learnt packet spacing for the next packet means the
+        # arrival rate has dropped, so the frame is flushed instead of waiting for more
+        return min(self.idle_timeout, self._frame_deadline - arrival_time)
+
+
+def get_frame_aggregator(frame_capacity: int) -> FrameAggregator:
+    """"""
+    match settings.AGGREGATION_POLICY:
+        case AggregationPolicy.FIXED:
+            return FixedFrameAggregator()
+
+        case AggregationPolicy.ADAPTIVE:
+            logger.debug("Aggregating IPoPS frames of up to %d bytes", frame_capacity)
+            return AdaptiveFrameAggregator(frame_capacity)
+
+        case _:
+            UNKNOWN_AGGREGATION_POLICY_MESSAGE: Final[str] = (
+                f"Unrecognized aggregation policy: {settings.AGGREGATION_POLICY}"
+            )
+            raise ValueError(UNKNOWN_AGGREGATION_POLICY_MESSAGE)
@@ -0,0 +1,72 @@
+""""""
+
+import bz2
+import enum
+import logging
+import lzma
+import zlib
+from typing import TYPE_CHECKING
+
+from .config import CompressionCodec, settings
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from logging import Logger
+    from typing import Final
+
+__all__: Sequence[str] = ("FrameCodec", "compress_frame")
+
+
+logger: Final[Logger] = logging.getLogger("ipops-printer")
+
+
+class FrameCodec(enum.IntEnum):
+    """"""
+
+    NONE = 0
+    ZLIB = 1
+    LZMA = 2
+    BZ2 = 3
+
+
+def _compress(frame_codec: FrameCodec, content: bytes, level: int) -> bytes:
+    match frame_codec:
+        case FrameCodec.NONE:
+            return content
+        case FrameCodec.ZLIB:
+            return zlib.compress(content, level=level)
+        case FrameCodec.LZMA:
+            return lzma.compress(content, format=lzma.FORMAT_ALONE, preset=level)
+        case FrameCodec.BZ2:
+            return bz2.compress(content, compresslevel=max(level, 1))
+
+
+def compress_frame(content: bytes) -> tuple[FrameCodec, bytes]:
+    """"""
+    candidate_codecs: Sequence[FrameCodec]
+    match settings.COMPRESSION_CODEC:
+        case CompressionCodec.NONE:
+            return FrameCodec.NONE, content
+        case CompressionCodec.AUTO:
+            candidate_codecs = (FrameCodec.ZLIB, FrameCodec.LZMA, FrameCodec.BZ2)
+        case compression_codec:
+            candidate_codecs = (FrameCodec[compression_codec.name],)
+
+    best_codec: FrameCodec = FrameCodec.NONE
+    best_content: bytes = content
+
+    frame_codec: FrameCodec
+    for frame_codec in candidate_codecs:
+        compressed_content: bytes = _compress(frame_codec, content, settings.COMPRESSION_LEVEL)
+        if len(compressed_content) < len(best_content):
+            best_codec = frame_codec
+            best_content = compressed_content
+
+    logger.debug(
+        "Compressed IPoPS frame from %d to %d bytes using %s",
+        len(content),
+        len(best_content),
+        best_codec.name,
+    )
+
+    return best_codec, best_content
@@ -6,17 +6,25 @@ import logging
 import os
 import re
 from enum import Enum
+from pathlib import Path
 from typing import TYPE_CHECKING, cast, final, override
 
 if TYPE_CHECKING:
-    from collections.abc import Collection, Sequence
+    from collections.abc import Collection, Mapping, Sequence
     from logging import Logger
     from typing import Any, ClassVar, Final, LiteralString
 
 
 __all__: Sequence[str] = (
+    "AggregationPolicy",
+    "ColourMode",
+    "CompressionCodec",
+    "HeaderVersion",
     "ImproperlyConfiguredError",
+    "OutputFormat",
     "PDFDataFormat",
+    "SymbolCodec",
+    "SymbolRendering",
     "run_setup",
     "settings",
 )
@@ -33,6 +41,13 @@ LOG_LEVEL_VALUES: Final[Collection[LiteralString]] = (
     "CRITICAL",
 )
 ENVIRONMENT_VARIABLE_PREFIX: Final[LiteralString] = "IPOPS_PRINTER_"
+PAPER_SIZE_VALUES: Final[Collection[LiteralString]] = ("a3", "a4", "a5", "letter", "legal")
+IP_PROTOCOL_NUMBERS: Final[Mapping[LiteralString, int]] = {
+    "icmp": 1,
+    "tcp": 6,
+    "udp": 17,
+    "icmpv6": 58,
+}
 
 
 class ImproperlyConfiguredError(Exception):
@@ -55,6 +70,59 @@ class PDFDataFormat(Enum):
     DATA_MATRIX = enum.auto()
 
 
+class OutputFormat(Enum):
+    """"""
+
+    PDF = enum.auto()
+    POSTSCRIPT = enum.auto()
+
+
+class CompressionCodec(Enum):
+    """"""
+
+    NONE = enum.auto()
+    ZLIB = enum.auto()
+    LZMA = enum.auto()
+    BZ2 = enum.auto()
+    AUTO = enum.auto()
+
+
+class SymbolCodec(Enum):
+    """"""
+
+    BASE85 = enum.auto()
+    BASE256 = enum.auto()
+
+
+class SymbolRendering(Enum):
+    """"""
+
+    VECTOR = enum.auto()
+    BITMAP = enum.auto()
+    RASTER = enum.auto()
+
+
+class ColourMode(Enum):
+    """"""
+
+    MONOCHROME = enum.auto()
+    CMY = enum.auto()
+
+
+class HeaderVersion(Enum):
+    """"""
+
+    V1 = 1
+    V2 = 2
+
+
+class AggregationPolicy(Enum):
+    """"""
+
+    FIXED = enum.auto()
+    ADAPTIVE = enum.auto()
+
+
 class Settings(abc.ABC):
     """
     Settings class that provides access to all settings values.
@@ -236,6 +304,25 @@ class Settings(abc.ABC):
 
         cls._settings["NEW_FRAME_POLLING_RATE"] = new_frame_polling_rate
 
+    @classmethod
+    def _setup_tun_device(cls) -> None:
+        tun_device: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}TUN_DEVICE", default=""
+        ).strip()
+
+        if not tun_device:
+            cls._settings["TUN_DEVICE"] = None
+            return
+
+        if not re.fullmatch(r"[A-Za-z0-9_.-]{1,15}", tun_device):
+            INVALID_TUN_DEVICE_MESSAGE: Final[str] = (
+                f"{ENVIRONMENT_VARIABLE_PREFIX}TUN_DEVICE must be a network interface name "
+                "of at most 15 letters, digits, dots, dashes or underscores."
+            )
+            raise ImproperlyConfiguredError(INVALID_TUN_DEVICE_MESSAGE)
+
+        cls._settings["TUN_DEVICE"] = tun_device
+
     @classmethod
     def _setup_pdf_data_format(cls) -> None:
         pdf_data_format: str = (
@@ -263,6 +350,584 @@ class Settings(abc.ABC):
         }PDF_DATA_FORMAT must be either 'data-matrix' or 'text'."
         raise ImproperlyConfiguredError(INVALID_PDF_DATA_FORMAT_MESSAGE)
 
+    @classmethod
+    def _setup_output_format(cls) -> None:
+        output_format: str = (
+            os.getenv(f"{ENVIRONMENT_VARIABLE_PREFIX}OUTPUT_FORMAT", default="")
+            .strip()
+            .upper()
+        )
+
+        if not output_format:
+            cls._settings["OUTPUT_FORMAT"] = OutputFormat.PDF
+            return
+
+        if output_format not in OutputFormat.__members__:
+            INVALID_OUTPUT_FORMAT_MESSAGE: Final[str] = f"{
+                ENVIRONMENT_VARIABLE_PREFIX
+            }OUTPUT_FORMAT must be one of: {
+                ', '.join(repr(name.lower()) for name in OutputFormat.__members__)
+            }."
+            raise ImproperlyConfiguredError(INVALID_OUTPUT_FORMAT_MESSAGE)
+
+        if (
+            OutputFormat[output_format] is OutputFormat.POSTSCRIPT
+            and cls._settings["PDF_DATA_FORMAT"] is not PDFDataFormat.DATA_MATRIX
+        ):
+            UNSUPPORTED_OUTPUT_FORMAT_MESSAGE: Final[str] = (
+                f"{ENVIRONMENT_VARIABLE_PREFIX}OUTPUT_FORMAT 'postscript' can only be used "
+                f"with {ENVIRONMENT_VARIABLE_PREFIX}PDF_DATA_FORMAT 'data_matrix'."
+            )
+            raise ImproperlyConfiguredError(UNSUPPORTED_OUTPUT_FORMAT_MESSAGE)
+
+        cls._settings["OUTPUT_FORMAT"] = OutputFormat[output_format]
+
+    @classmethod
+    def _setup_output_directory(cls) -> None:
+        raw_output_directory: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}OUTPUT_DIRECTORY", default=""
+        ).strip()
+
+        if not raw_output_directory:
+            cls._settings["OUTPUT_DIRECTORY"] = None
+            return
+
+        output_directory: Path = Path(raw_output_directory).expanduser()
+        if not output_directory.is_dir():
+            INVALID_OUTPUT_DIRECTORY_MESSAGE: Final[str] = (
+                f"{ENVIRONMENT_VARIABLE_PREFIX}OUTPUT_DIRECTORY must be an existing directory."
+            )
+            raise ImproperlyConfiguredError(INVALID_OUTPUT_DIRECTORY_MESSAGE)
+
+        cls._settings["OUTPUT_DIRECTORY"] = output_directory
+
+    @classmethod
+    def _setup_paper_size(cls) -> None:
+        paper_size: str = (
+            os.getenv(f"{ENVIRONMENT_VARIABLE_PREFIX}PAPER_SIZE", default="").strip().lower()
+        )
+
+        if not paper_size:
+            cls._settings["PAPER_SIZE"] = "a4"
+            return
+
+        if paper_size not in PAPER_SIZE_VALUES:
+            INVALID_PAPER_SIZE_MESSAGE: Final[str] = f"{
+                ENVIRONMENT_VARIABLE_PREFIX
+            }PAPER_SIZE must be one of: {', '.join(map(repr, PAPER_SIZE_VALUES))}."
+            raise ImproperlyConfiguredError(INVALID_PAPER_SIZE_MESSAGE)
+
+        cls._settings["PAPER_SIZE"] = paper_size
+
+    @classmethod
+    def _setup_page_margin(cls) -> None:
+        raw_page_margin: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}PAGE_MARGIN", default=""
+        ).strip()
+
+        if not raw_page_margin:
+            cls._settings["PAGE_MARGIN"] = 10.0
+            return
+
+        INVALID_PAGE_MARGIN_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }PAGE_MARGIN must be a float between & including 0 to 50."
+
+        try:
+            page_margin: float = float(raw_page_margin)
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_PAGE_MARGIN_MESSAGE) from e
+
+        if not 0 <= page_margin <= 50:
+            raise ImproperlyConfiguredError(INVALID_PAGE_MARGIN_MESSAGE)
+
+        cls._settings["PAGE_MARGIN"] = page_margin
+
+    @classmethod
+    def _setup_module_size(cls) -> None:
+        raw_module_size: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}MODULE_SIZE", default=""
+        ).strip()
+
+        if not raw_module_size:
+            cls._settings["MODULE_SIZE"] = 0.5
+            return
+
+        INVALID_MODULE_SIZE_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }MODULE_SIZE must be a float between & including 0.1 to 5."
+
+        try:
+            module_size: float = float(raw_module_size)
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_MODULE_SIZE_MESSAGE) from e
+
+        if not 0.1 <= module_size <= 5:  # noqa: PLR2004
+            raise ImproperlyConfiguredError(INVALID_MODULE_SIZE_MESSAGE)
+
+        cls._settings["MODULE_SIZE"] = module_size
+
+    @classmethod
+    def _setup_encode_workers(cls) -> None:
+        raw_encode_workers: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}ENCODE_WORKERS", default=""
+        ).strip()
+
+        if not raw_encode_workers:
+            cls._settings["ENCODE_WORKERS"] = 1
+            return
+
+        INVALID_ENCODE_WORKERS_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }ENCODE_WORKERS must be an integer between & including 1 to 256."
+
+        try:
+            encode_workers: int = int(raw_encode_workers)
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_ENCODE_WORKERS_MESSAGE) from e
+
+        if not 1 <= encode_workers <= 256:
+            raise ImproperlyConfiguredError(INVALID_ENCODE_WORKERS_MESSAGE)
+
+        cls._settings["ENCODE_WORKERS"] = encode_workers
+
+    @classmethod
+    def _setup_compression_codec(cls) -> None:
+        compression_codec: str = (
+            os.getenv(f"{ENVIRONMENT_VARIABLE_PREFIX}COMPRESSION_CODEC", default="")
+            .strip()
+            .upper()
+        )
+
+        if not compression_codec:
+            cls._settings["COMPRESSION_CODEC"] = CompressionCodec.AUTO
+            return
+
+        if compression_codec not in CompressionCodec.__members__:
+            INVALID_COMPRESSION_CODEC_MESSAGE: Final[str] = f"{
+                ENVIRONMENT_VARIABLE_PREFIX
+            }COMPRESSION_CODEC must be one of: {
+                ', '.join(repr(name.lower()) for name in CompressionCodec.__members__)
+            }."
+            raise ImproperlyConfiguredError(INVALID_COMPRESSION_CODEC_MESSAGE)
+
+        cls._settings["COMPRESSION_CODEC"] = CompressionCodec[compression_codec]
+
+    @classmethod
+    def _setup_compression_level(cls) -> None:
+        raw_compression_level: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}COMPRESSION_LEVEL", default=""
+        ).strip()
+
+        if not raw_compression_level:
+            cls._settings["COMPRESSION_LEVEL"] = 9
+            return
+
+        INVALID_COMPRESSION_LEVEL_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }COMPRESSION_LEVEL must be an integer between & including 0 to 9."
+
+        try:
+            compression_level: int = int(raw_compression_level)
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_COMPRESSION_LEVEL_MESSAGE) from e
+
+        if not 0 <= compression_level <= 9:
+            raise ImproperlyConfiguredError(INVALID_COMPRESSION_LEVEL_MESSAGE)
+
+        cls._settings["COMPRESSION_LEVEL"] = compression_level
+
+    @classmethod
+    def _setup_symbol_codec(cls) -> None:
+        symbol_codec: str = (
+            os.getenv(f"{ENVIRONMENT_VARIABLE_PREFIX}SYMBOL_CODEC", default="").strip().upper()
+        )
+
+        if not symbol_codec:
+            cls._settings["SYMBOL_CODEC"] = SymbolCodec.BASE256
+            return
+
+        if symbol_codec not in SymbolCodec.__members__:
+            INVALID_SYMBOL_CODEC_MESSAGE: Final[str] = f"{
+                ENVIRONMENT_VARIABLE_PREFIX
+            }SYMBOL_CODEC must be one of: {
+                ', '.join(repr(name.lower()) for name in SymbolCodec.__members__)
+            }."
+            raise ImproperlyConfiguredError(INVALID_SYMBOL_CODEC_MESSAGE)
+
+        cls._settings["SYMBOL_CODEC"] = SymbolCodec[symbol_codec]
+
+    @classmethod
+    def _setup_symbol_rendering(cls) -> None:
+        symbol_rendering: str = (
+            os.getenv(f"{ENVIRONMENT_VARIABLE_PREFIX}SYMBOL_RENDERING", default="")
+            .strip()
+            .upper()
+        )
+
+        if not symbol_rendering:
+            cls._settings["SYMBOL_RENDERING"] = SymbolRendering.VECTOR
+            return
+
+        if symbol_rendering not in SymbolRendering.__members__:
+            INVALID_SYMBOL_RENDERING_MESSAGE: Final[str] = f"{
+                ENVIRONMENT_VARIABLE_PREFIX
+            }SYMBOL_RENDERING must be one of: {
+                ', '.join(repr(name.lower()) for name in SymbolRendering.__members__)
+            }."
+            raise ImproperlyConfiguredError(INVALID_SYMBOL_RENDERING_MESSAGE)
+
+        cls._settings["SYMBOL_RENDERING"] = SymbolRendering[symbol_rendering]
+
+    @classmethod
+    def _setup_colour_mode(cls) -> None:
+        colour_mode: str = (
+            os.getenv(f"{ENVIRONMENT_VARIABLE_PREFIX}COLOUR_MODE", default="").strip().upper()
+        )
+
+        if not colour_mode:
+            cls._settings["COLOUR_MODE"] = ColourMode.MONOCHROME
+            return
+
+        if colour_mode not in ColourMode.__members__:
+            INVALID_COLOUR_MODE_MESSAGE: Final[str] = f"{
+                ENVIRONMENT_VARIABLE_PREFIX
+            }COLOUR_MODE must be one of: {
+                ', '.join(repr(name.lower()) for name in ColourMode.__members__)
+            }."
+            raise ImproperlyConfiguredError(INVALID_COLOUR_MODE_MESSAGE)
+
+        if ColourMode[colour_mode] is ColourMode.CMY and (
+            cls._settings["PDF_DATA_FORMAT"] is not PDFDataFormat.DATA_MATRIX
+            or cls._settings["OUTPUT_FORMAT"] is not OutputFormat.PDF
+        ):
+            UNSUPPORTED_COLOUR_MODE_MESSAGE: Final[str] = (
+                f"{ENVIRONMENT_VARIABLE_PREFIX}COLOUR_MODE 'cmy' can only be used "
+                f"with {ENVIRONMENT_VARIABLE_PREFIX}PDF_DATA_FORMAT 'data_matrix' "
+                f"and {ENVIRONMENT_VARIABLE_PREFIX}OUTPUT_FORMAT 'pdf'."
+            )
+            raise ImproperlyConfiguredError(UNSUPPORTED_COLOUR_MODE_MESSAGE)
+
+        cls._settings["COLOUR_MODE"] = ColourMode[colour_mode]
+
+    @classmethod
+    def _setup_header_version(cls) -> None:
+        header_version: str = (
+            os.getenv(f"{ENVIRONMENT_VARIABLE_PREFIX}HEADER_VERSION", default="")
+            .strip()
+            .upper()
+            .removeprefix("V")
+        )
+
+        if not header_version:
+            cls._settings["HEADER_VERSION"] = HeaderVersion.V2
+            return
+
+        if f"V{header_version}" not in HeaderVersion.__members__:
+            INVALID_HEADER_VERSION_MESSAGE: Final[str] = f"{
+                ENVIRONMENT_VARIABLE_PREFIX
+            }HEADER_VERSION must be one of: {
+                ', '.join(repr(name.lower()) for name in HeaderVersion.__members__)
+            }."
+            raise ImproperlyConfiguredError(INVALID_HEADER_VERSION_MESSAGE)
+
+        cls._settings["HEADER_VERSION"] = HeaderVersion[f"V{header_version}"]
+
+    @classmethod
+    def _setup_stream_id(cls) -> None:
+        raw_stream_id: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}STREAM_ID", default=""
+        ).strip()
+
+        if not raw_stream_id:
+            cls._settings["STREAM_ID"] = 0
+            return
+
+        INVALID_STREAM_ID_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }STREAM_ID must be an integer between & including 0 to 4294967295."
+
+        try:
+            stream_id: int = int(raw_stream_id)
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_STREAM_ID_MESSAGE) from e
+
+        if not 0 <= stream_id <= 0xFFFFFFFF:
+            raise ImproperlyConfiguredError(INVALID_STREAM_ID_MESSAGE)
+
+        cls._settings["STREAM_ID"] = stream_id
+
+    @classmethod
+    def _setup_spool_depth(cls) -> None:
+        raw_spool_depth: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}SPOOL_DEPTH", default=""
+        ).strip()
+
+        if not raw_spool_depth:
+            cls._settings["SPOOL_DEPTH"] = 4
+            return
+
+        INVALID_SPOOL_DEPTH_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }SPOOL_DEPTH must be an integer between & including 1 to 1024."
+
+        try:
+            spool_depth: int = int(raw_spool_depth)
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_SPOOL_DEPTH_MESSAGE) from e
+
+        if not 1 <= spool_depth <= 1024:
+            raise ImproperlyConfiguredError(INVALID_SPOOL_DEPTH_MESSAGE)
+
+        cls._settings["SPOOL_DEPTH"] = spool_depth
+
+    @classmethod
+    def _setup_fec_data_pages(cls) -> None:
+        raw_fec_data_pages: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}FEC_DATA_PAGES", default=""
+        ).strip()
+
+        if not raw_fec_data_pages:
+            cls._settings["FEC_DATA_PAGES"] = 4
+            return
+
+        INVALID_FEC_DATA_PAGES_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }FEC_DATA_PAGES must be an integer between & including 1 to 128."
+
+        try:
+            fec_data_pages: int = int(raw_fec_data_pages)
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_FEC_DATA_PAGES_MESSAGE) from e
+
+        if not 1 <= fec_data_pages <= 128:
+            raise ImproperlyConfiguredError(INVALID_FEC_DATA_PAGES_MESSAGE)
+
+        cls._settings["FEC_DATA_PAGES"] = fec_data_pages
+
+    @classmethod
+    def _setup_fec_parity_pages(cls) -> None:
+        raw_fec_parity_pages: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}FEC_PARITY_PAGES", default=""
+        ).strip()
+
+        if not raw_fec_parity_pages:
+            cls._settings["FEC_PARITY_PAGES"] = 0
+            return
+
+        INVALID_FEC_PARITY_PAGES_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }FEC_PARITY_PAGES must be an integer between & including 0 to 128."
+
+        try:
+            fec_parity_pages: int = int(raw_fec_parity_pages)
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_FEC_PARITY_PAGES_MESSAGE) from e
+
+        if not 0 <= fec_parity_pages <= 128:
+            raise ImproperlyConfiguredError(INVALID_FEC_PARITY_PAGES_MESSAGE)
+
+        cls._settings["FEC_PARITY_PAGES"] = fec_parity_pages
+
+    @classmethod
+    def _setup_aggregation_policy(cls) -> None:
+        aggregation_policy: str = (
+            os.getenv(f"{ENVIRONMENT_VARIABLE_PREFIX}AGGREGATION_POLICY", default="")
+            .strip()
+            .upper()
+        )
+
+        if not aggregation_policy:
+            cls._settings["AGGREGATION_POLICY"] = AggregationPolicy.ADAPTIVE
+            return
+
+        if aggregation_policy not in AggregationPolicy.__members__:
+            INVALID_AGGREGATION_POLICY_MESSAGE: Final[str] = f"{
+                ENVIRONMENT_VARIABLE_PREFIX
+            }AGGREGATION_POLICY must be one of: {
+                ', '.join(repr(name.lower()) for name in AggregationPolicy.__members__)
+            }."
+            raise ImproperlyConfiguredError(INVALID_AGGREGATION_POLICY_MESSAGE)
+
+        cls._settings["AGGREGATION_POLICY"] = AggregationPolicy[aggregation_policy]
+
+    @classmethod
+    def _setup_frame_deadline(cls) -> None:
+        raw_frame_deadline: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}FRAME_DEADLINE", default=""
+        ).strip()
+
+        if not raw_frame_deadline:
+            cls._settings["FRAME_DEADLINE"] = 5.0
+            return
+
+        INVALID_FRAME_DEADLINE_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }FRAME_DEADLINE must be a float between & including 0.01 to 1000."
+
+        try:
+            frame_deadline: float = float(raw_frame_deadline)
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_FRAME_DEADLINE_MESSAGE) from e
+
+        if not 0.01 <= frame_deadline <= 1000:  # noqa: PLR2004
+            raise ImproperlyConfiguredError(INVALID_FRAME_DEADLINE_MESSAGE)
+
+        cls._settings["FRAME_DEADLINE"] = frame_deadline
+
+    @classmethod
+    def _setup_header_compression(cls) -> None:
+        header_compression: str = (
+            os.getenv(f"{ENVIRONMENT_VARIABLE_PREFIX}HEADER_COMPRESSION", default="")
+            .strip()
+            .lower()
+        )
+
+        if not header_compression:
+            cls._settings["HEADER_COMPRESSION"] = True
+            return
+
+        if header_compression in ("true", "t", "yes", "y", "on", "1"):
+            cls._settings["HEADER_COMPRESSION"] = True
+            return
+
+        if header_compression in ("false", "f", "no", "n", "off", "0"):
+            cls._settings["HEADER_COMPRESSION"] = False
+            return
+
+        INVALID_HEADER_COMPRESSION_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }HEADER_COMPRESSION must be either 'true' or 'false'."
+        raise ImproperlyConfiguredError(INVALID_HEADER_COMPRESSION_MESSAGE)
+
+    @classmethod
+    def _setup_dedup_window(cls) -> None:
+        raw_dedup_window: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}DEDUP_WINDOW", default=""
+        ).strip()
+
+        if not raw_dedup_window:
+            cls._settings["DEDUP_WINDOW"] = 0.0
+            return
+
+        INVALID_DEDUP_WINDOW_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }DEDUP_WINDOW must be a float between & including 0 to 86400."
+
+        try:
+            dedup_window: float = float(raw_dedup_window)
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_DEDUP_WINDOW_MESSAGE) from e
+
+        if not 0 <= dedup_window <= 86400:
+            raise ImproperlyConfiguredError(INVALID_DEDUP_WINDOW_MESSAGE)
+
+        cls._settings["DEDUP_WINDOW"] = dedup_window
+
+    @classmethod
+    def _setup_dedup_cache_size(cls) -> None:
+        raw_dedup_cache_size: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}DEDUP_CACHE_SIZE", default=""
+        ).strip()
+
+        if not raw_dedup_cache_size:
+            cls._settings["DEDUP_CACHE_SIZE"] = 65536
+            return
+
+        INVALID_DEDUP_CACHE_SIZE_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }DEDUP_CACHE_SIZE must be an integer between & including 1 to 10000000."
+
+        try:
+            dedup_cache_size: int = int(raw_dedup_cache_size)
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_DEDUP_CACHE_SIZE_MESSAGE) from e
+
+        if not 1 <= dedup_cache_size <= 10000000:
+            raise ImproperlyConfiguredError(INVALID_DEDUP_CACHE_SIZE_MESSAGE)
+
+        cls._settings["DEDUP_CACHE_SIZE"] = dedup_cache_size
+
+    @classmethod
+    def _setup_dedup_exempt_protocols(cls) -> None:
+        raw_dedup_exempt_protocols: Sequence[str] = [
+            raw_protocol.strip().lower()
+            for raw_protocol in os.getenv(
+                f"{ENVIRONMENT_VARIABLE_PREFIX}DEDUP_EXEMPT_PROTOCOLS", default=""
+            ).split(",")
+            if raw_protocol.strip()
+        ]
+
+        INVALID_DEDUP_EXEMPT_PROTOCOLS_MESSAGE: Final[str] = (
+            f"{ENVIRONMENT_VARIABLE_PREFIX}DEDUP_EXEMPT_PROTOCOLS must be a comma-separated "
+            "list of IP protocol numbers between & including 0 to 255, or any of: "
+            f"{', '.join(map(repr, IP_PROTOCOL_NUMBERS))}."
+        )
+
+        dedup_exempt_protocols: set[int] = set()
+
+        raw_protocol: str
+        for raw_protocol in raw_dedup_exempt_protocols:
+            if raw_protocol in IP_PROTOCOL_NUMBERS:
+                dedup_exempt_protocols.add(IP_PROTOCOL_NUMBERS[raw_protocol])
+                continue
+
+            try:
+                protocol: int = int(raw_protocol)
+            except ValueError as e:
+                raise ImproperlyConfiguredError(INVALID_DEDUP_EXEMPT_PROTOCOLS_MESSAGE) from e
+
+            if not 0 <= protocol <= 255:
+                raise ImproperlyConfiguredError(INVALID_DEDUP_EXEMPT_PROTOCOLS_MESSAGE)
+
+            dedup_exempt_protocols.add(protocol)
+
+        cls._settings["DEDUP_EXEMPT_PROTOCOLS"] = frozenset(dedup_exempt_protocols)
+
+    @classmethod
+    def _setup_metrics_port(cls) -> None:
+        raw_metrics_port: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}METRICS_PORT", default=""
+        ).strip()
+
+        if not raw_metrics_port:
+            cls._settings["METRICS_PORT"] = None
+            return
+
+        INVALID_METRICS_PORT_MESSAGE: Final[str] = f"{
+            ENVIRONMENT_VARIABLE_PREFIX
+        }METRICS_PORT must be an integer between & including 1 to 65535."
+
+        try:
+            metrics_port: int = int(raw_metrics_port)
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_METRICS_PORT_MESSAGE) from e
+
+        if not 1 <= metrics_port <= 65535:
+            raise ImproperlyConfiguredError(INVALID_METRICS_PORT_MESSAGE)
+
+        cls._settings["METRICS_PORT"] = metrics_port
+
+    @classmethod
+    def _setup_metrics_file(cls) -> None:
+        raw_metrics_file: str = os.getenv(
+            f"{ENVIRONMENT_VARIABLE_PREFIX}METRICS_FILE", default=""
+        ).strip()
+
+        if not raw_metrics_file:
+            cls._settings["METRICS_FILE"] = None
+            return
+
+        metrics_file: Path = Path(raw_metrics_file).expanduser()
+        if not metrics_file.parent.is_dir():
+            INVALID_METRICS_FILE_MESSAGE: Final[str] = (
+                f"{ENVIRONMENT_VARIABLE_PREFIX}METRICS_FILE must be a path "
+                "inside an existing directory."
+            )
+            raise ImproperlyConfiguredError(INVALID_METRICS_FILE_MESSAGE)
+
+        cls._settings["METRICS_FILE"] = metrics_file
+
     @classmethod
     def _setup_env_variables(cls) -> None:
         """
@@ -280,7 +945,32 @@ class Settings(abc.ABC):
         cls._setup_min_contiguous_buffer_size()
         cls._setup_contiguous_data_timeout()
         cls._setup_new_frame_polling_rate()
+        cls._setup_tun_device()
         cls._setup_pdf_data_format()
+        cls._setup_output_format()
+        cls._setup_output_directory()
+        cls._setup_paper_size()
+        cls._setup_page_margin()
+        cls._setup_module_size()
+        cls._setup_encode_workers()
+        cls._setup_compression_codec()
+        cls._setup_compression_level()
+        cls._setup_header_compression()
+        cls._setup_symbol_codec()
+        cls._setup_symbol_rendering()
+        cls._setup_colour_mode()
+        cls._setup_header_version()
+        cls._setup_stream_id()
+        cls._setup_spool_depth()
+        cls._setup_fec_data_pages()
+        cls._setup_fec_parity_pages()
+        cls._setup_aggregation_policy()
+        cls._setup_frame_deadline()
+        cls._setup_dedup_window()
+        cls._setup_dedup_cache_size()
+        cls._setup_dedup_exempt_protocols()
+        cls._setup_metrics_port()
+        cls._setup_metrics_file()
 
         cls._is_env_variables_setup = True
 
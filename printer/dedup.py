@@ -0,0 +1,78 @@
+""""""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from . import metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from collections.abc import Set as AbstractSet
+    from logging import Logger
+    from typing import Final
+
+__all__: Sequence[str] = ("PacketDeduplicator",)
+
+
+logger: Final[Logger] = logging.getLogger("ipops-printer")
+
+
+PACKET_DIGEST_SIZE: Final[int] = 16
+IPV4_PROTOCOL_OFFSET: Final[int] = 9
+IPV6_NEXT_HEADER_OFFSET: Final[int] = 6
+
+
+def _get_ip_protocol(packet: memoryview) -> int | None:
+    match packet[0] >> 4:
+        case 4 if len(packet) > IPV4_PROTOCOL_OFFSET:
+            return packet[IPV4_PROTOCOL_OFFSET]
+        case 6 if len(packet) > IPV6_NEXT_HEADER_OFFSET:
+            return packet[IPV6_NEXT_HEADER_OFFSET]
+        case _:
+            return None
+
+
+class PacketDeduplicator:
+    """"""
+
+    def __init__(
+        self, window: float, max_entries: int, exempt_protocols: AbstractSet[int]
+    ) -> None:
+        """"""
+        self.window: float = window
+        self.max_entries: int = max_entries
+        self.exempt_protocols: AbstractSet[int] = exempt_protocols
+        self.suppressed_packets_count: int = 0
+        self.suppressed_bytes_count: int = 0
+
+        # NOTE: Digests are kept in the order they were first scheduled, so the oldest
+        # entries are always evicted first, whether by age or by the size bound
+        self._scheduled_times: OrderedDict[bytes, float] = OrderedDict()
+
+    def _evict(self, now: float) -> None:
+        while self._scheduled_times and (
+            len(self._scheduled_times) > self.max_entries
+            or now - next(iter(self._scheduled_times.values())) > self.window
+        ):
+            self._scheduled_times.popitem(last=False)
+
+    def is_duplicate(self, packet: memoryview, now: float) -> bool:
+        """"""
+        if not self.window or _get_ip_protocol(packet) in self.exempt_protocols:
+            return False
+
+        self._evict(now)
+
+        packet_digest: bytes = hashlib.blake2b(packet, digest_size=PACKET_DIGEST_SIZE).digest()
+        if packet_digest in self._scheduled_times:
+            self.suppressed_packets_count += 1
+            self.suppressed_bytes_count += len(packet)
+            metrics.DUPLICATE_PACKETS.inc()
+            logger.debug("Suppressed duplicate packet: size %d bytes", len(packet))
+            return True
+
+        self._scheduled_times[packet_digest] = now
+        self._evict(now)
+        return False
@@ -0,0 +1,59 @@
+""""""
+
+from typing import TYPE_CHECKING
+
+from shared.fec import (
+    SHARD_LENGTH_PREFIX_SIZE,
+    get_cauchy_coefficient,
+    get_multiplication_table,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ("SHARD_LENGTH_PREFIX_SIZE", "encode_parity_shards", "pad_shards")
+
+
+def pad_shards(records: Sequence[bytes]) -> Sequence[bytes]:
+    """"""
+    shard_length: int = SHARD_LENGTH_PREFIX_SIZE + max(len(record) for record in records)
+
+    return [
+        (len(record).to_bytes(SHARD_LENGTH_PREFIX_SIZE, byteorder="big") + record).ljust(
+            shard_length, b"\x00"
+        )
+        for record in records
+    ]
+
+
+def encode_parity_shards(data_shards: Sequence[bytes], parity_count: int) -> Sequence[bytes]:
+    """"""
+    if len(data_shards) + parity_count > 256:
+        TOO_MANY_SHARDS_MESSAGE: Final[str] = (
+            f"Cannot encode {len(data_shards)} data shards with {parity_count} parity shards: "
+            "at most 256 shards fit into GF(256)."
+        )
+        raise ValueError(TOO_MANY_SHARDS_MESSAGE)
+
+    shard_length: int = len(data_shards[0])
+    parity_shards: list[bytes] = []
+
+    parity_index: int
+    for parity_index in range(parity_count):
+        parity_value: int = 0
+
+        data_index: int
+        data_shard: bytes
+        for data_index, data_shard in enumerate(data_shards):
+            parity_value ^= int.from_bytes(
+                data_shard.translate(
+                    get_multiplication_table(
+                        get_cauchy_coefficient(parity_index, data_index, len(data_shards))
+                    )
+                )
+            )
+
+        parity_shards.append(parity_value.to_bytes(shard_length))
+
+    return parity_shards
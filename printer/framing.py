@@ -0,0 +1,163 @@
+""""""
+
+import io
+import selectors
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ("PACKET_LENGTH_SIZE", "PacketFramer", "split_packets")
+
+
+PACKET_LENGTH_SIZE: Final[int] = 3
+DEFAULT_BUFFER_SIZE: Final[int] = 64 * 1024
+IPV4_HEADER_SIZE: Final[int] = 20
+IPV6_HEADER_SIZE: Final[int] = 40
+
+
+class PacketFramer:
+    """"""
+
+    def __init__(self, fd: int, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """"""
+        # NOTE: Raw reads return whatever is available, unlike a buffered reader
+        # which hides data from select() and may block until its whole buffer fills
+        self._stream: io.FileIO = io.FileIO(fd, mode="rb", closefd=False)
+        self._buffer: bytearray = bytearray(buffer_size)
+        self._view: memoryview = memoryview(self._buffer)
+        self._start: int = 0
+        self._end: int = 0
+        self._last_packet_start: int | None = None
+
+        self._selector: selectors.BaseSelector | None = selectors.DefaultSelector()
+        try:
+            self._selector.register(fd, selectors.EVENT_READ)
+        except PermissionError:
+            # NOTE: Regular files cannot be polled, but are always ready to read
+            self._selector.close()
+            self._selector = None
+
+    def _get_required_size(self) -> int:
+        if self._end - self._start < PACKET_LENGTH_SIZE:
+            return PACKET_LENGTH_SIZE
+
+        return PACKET_LENGTH_SIZE + int.from_bytes(
+            self._view[self._start : self._start + PACKET_LENGTH_SIZE], byteorder="big"
+        )
+
+    def _make_room(self, required_size: int) -> None:
+        pending_size: int = self._end - self._start
+
+        if required_size > len(self._buffer):
+            # NOTE: Only a packet larger than the whole buffer forces a reallocation,
+            # and packets returned before it keep the old buffer alive until dropped
+            self._buffer = self._buffer[self._start : self._end] + bytearray(
+                required_size - pending_size
+            )
+            self._view = memoryview(self._buffer)
+
+        elif self._start:
+            self._view[:pending_size] = self._view[self._start : self._end]
+
+        self._start = 0
+        self._end = pending_size
+
+    def _wait_readable(self, timeout: float | None) -> bool:
+        if self._selector is None:
+            return True
+
+        return bool(self._selector.select(timeout))
+
+    def _fill(self) -> None:
+        bytes_read: int | None = self._stream.readinto(self._view[self._end :])
+        if not bytes_read:
+            END_OF_STREAM_MESSAGE: Final[str] = "Packet stream was closed."
+            raise EOFError(END_OF_STREAM_MESSAGE)
+
+        self._end += bytes_read
+
+    def read_packet(self, timeout: float | None) -> memoryview | None:
+        """"""
+        deadline: float | None = None
+        self._last_packet_start = None
+
+        while True:
+            required_size: int = self._get_required_size()
+            if self._start + required_size <= self._end:
+                packet: memoryview = self._view[
+                    self._start + PACKET_LENGTH_SIZE : self._start + required_size
+                ]
+                self._last_packet_start = self._start
+                self._start += required_size
+                return packet
+
+            # NOTE: The space of already-returned packets is only reclaimed once the
+            # incomplete packet would run past the end of the buffer
+            if self._start + required_size > len(self._buffer):
+                self._make_room(required_size)
+
+            if deadline is None and timeout is not None:
+                deadline = time.monotonic() + timeout
+
+            remaining_timeout: float | None = (
+                None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+            if not self._wait_readable(remaining_timeout):
+                return None
+
+            self._fill()
+
+    def unread_packet(self) -> None:
+        """"""
+        if self._last_packet_start is None:
+            NO_PACKET_TO_UNREAD_MESSAGE: Final[str] = (
+                "Only the packet returned by the latest read can be unread."
+            )
+            raise RuntimeError(NO_PACKET_TO_UNREAD_MESSAGE)
+
+        # NOTE: The buffer is only compacted during a read, so the packet is still in place
+        self._start = self._last_packet_start
+        self._last_packet_start = None
+
+    def close(self) -> None:
+        """"""
+        if self._selector is not None:
+            self._selector.close()
+
+
+def _get_packet_size(content: bytes, offset: int) -> int | None:
+    match content[offset] >> 4:
+        case 4 if len(content) - offset >= IPV4_HEADER_SIZE:
+            packet_size: int = int.from_bytes(
+                content[offset + 2 : offset + 4], byteorder="big"
+            )
+            return packet_size if packet_size >= IPV4_HEADER_SIZE else None
+
+        case 6 if len(content) - offset >= IPV6_HEADER_SIZE:
+            return IPV6_HEADER_SIZE + int.from_bytes(
+                content[offset + 4 : offset + 6], byteorder="big"
+            )
+
+        case _:
+            return None
+
+
+def split_packets(content: bytes) -> tuple[Sequence[bytes], bytes]:
+    """"""
+    # NOTE: Frames carry whole IP packets back to back, so each packet's own length field
+    # marks where the next one starts, and anything after the last whole packet is returned
+    packets: list[bytes] = []
+    offset: int = 0
+
+    while offset < len(content):
+        packet_size: int | None = _get_packet_size(content, offset)
+        if packet_size is None or offset + packet_size > len(content):
+            break
+
+        packets.append(content[offset : offset + packet_size])
+        offset += packet_size
+
+    return packets, content[offset:]
@@ -0,0 +1,107 @@
+""""""
+
+import zlib
+from typing import TYPE_CHECKING, NamedTuple
+
+from .config import HeaderVersion
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "HEADER_V2_MAGIC",
+    "SymbolHeader",
+    "encode_varint",
+    "get_max_header_size",
+    "pack_symbol",
+)
+
+
+HEADER_V2_MAGIC: Final[int] = 0xE2
+HEADER_V1_SIZE: Final[int] = 4
+HEADER_CHECKSUM_SIZE: Final[int] = 4
+MAX_SLOTS_VARINT_SIZE: Final[int] = 2
+
+
+class SymbolHeader(NamedTuple):
+    """"""
+
+    page_number: int
+    slot: int
+    slots_count: int
+    page_flags: int
+    stream_id: int = 0
+
+
+def encode_varint(value: int) -> bytes:
+    """"""
+    if value < 0:
+        NEGATIVE_VARINT_MESSAGE: Final[str] = f"Cannot encode negative varint: {value}."
+        raise ValueError(NEGATIVE_VARINT_MESSAGE)
+
+    encoded_value: bytearray = bytearray()
+    while value > 0x7F:
+        encoded_value.append(value & 0x7F | 0x80)
+        value >>= 7
+
+    encoded_value.append(value)
+    return bytes(encoded_value)
+
+
+def get_max_header_size(
+    header_version: HeaderVersion,
+    starting_page_number: int,
+    stream_id: int,
+    max_chunk_size: int,
+) -> int:
+    """"""
+    match header_version:
+        case HeaderVersion.V1:
+            return HEADER_V1_SIZE
+        case HeaderVersion.V2:
+            # NOTE: One spare page number byte covers a frame crossing the next varint boundary
+            return (
+                1
+                + len(encode_varint(starting_page_number))
+                + 1
+                + len(encode_varint(stream_id))
+                + 2 * MAX_SLOTS_VARINT_SIZE
+                + 1
+                + len(encode_varint(max_chunk_size))
+                + HEADER_CHECKSUM_SIZE
+            )
+
+
+def pack_symbol(
+    header_version: HeaderVersion, symbol_header: SymbolHeader, chunk: bytes
+) -> tuple[bytes, bytes]:
+    """"""
+    match header_version:
+        case HeaderVersion.V1:
+            # NOTE: The version 1 page byte is returned separately, as the raw symbol prefix
+            return symbol_header.page_number.to_bytes(length=1, byteorder="big"), bytes(
+                (symbol_header.slot, symbol_header.slots_count, symbol_header.page_flags)
+            ) + chunk
+
+        case HeaderVersion.V2:
+            header_fields: bytes = b"".join(
+                (
+                    bytes((HEADER_V2_MAGIC,)),
+                    encode_varint(symbol_header.page_number),
+                    encode_varint(symbol_header.stream_id),
+                    encode_varint(symbol_header.slot),
+                    encode_varint(symbol_header.slots_count),
+                    bytes((symbol_header.page_flags,)),
+                    encode_varint(len(chunk)),
+                )
+            )
+            return b"", b"".join(
+                (
+                    header_fields,
+                    zlib.crc32(chunk, zlib.crc32(header_fields)).to_bytes(
+                        length=HEADER_CHECKSUM_SIZE, byteorder="big"
+                    ),
+                    chunk,
+                )
+            )
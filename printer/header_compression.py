@@ -0,0 +1,150 @@
+""""""
+
+import logging
+from typing import TYPE_CHECKING
+
+from shared.header_compression import (
+    FieldKind,
+    RecordKind,
+    fill_inferred_fields,
+    get_header_fields,
+)
+
+from .framing import split_packets
+from .header import encode_varint
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from logging import Logger
+    from typing import Final
+
+    from shared.header_compression import HeaderField
+
+__all__: Sequence[str] = ("compress_packet_headers",)
+
+
+logger: Final[Logger] = logging.getLogger("ipops-printer")
+
+
+def _is_compressible(packet: bytes, header_fields: Sequence[HeaderField]) -> bool:
+    header_size: int = header_fields[-1].offset + header_fields[-1].size
+    header: bytearray = bytearray(packet[:header_size])
+
+    # NOTE: Fields are only left out when the decompressor would rebuild them exactly,
+    # so packets with unusual lengths or bad IPv4 checksums are kept as they are
+    try:
+        fill_inferred_fields(header, header_fields, len(packet))
+    except OverflowError:
+        return False
+
+    return header == packet[:header_size]
+
+
+def _encode_field_delta(previous_value: bytes, value: bytes) -> bytes:
+    value_bits: int = 8 * len(value)
+    delta: int = (
+        int.from_bytes(value, byteorder="big")
+        - int.from_bytes(previous_value, byteorder="big")
+    ) % (1 << value_bits)
+    if delta >= 1 << (value_bits - 1):
+        delta -= 1 << value_bits
+
+    # NOTE: Zigzag encoding keeps small negative deltas, such as retransmissions, short
+    return encode_varint(2 * delta if delta >= 0 else -2 * delta - 1)
+
+
+def _encode_delta_record(
+    context_id: int,
+    header_fields: Sequence[HeaderField],
+    context_header: bytes,
+    packet: bytes,
+) -> bytes:
+    changed_fields_mask: int = 0
+    changed_fields_data: bytearray = bytearray()
+
+    field_index: int = 0
+    header_field: HeaderField
+    for header_field in header_fields:
+        if header_field.kind not in (FieldKind.VERBATIM, FieldKind.DELTA):
+            continue
+
+        field_end: int = header_field.offset + header_field.size
+        previous_value: bytes = context_header[header_field.offset : field_end]
+        value: bytes = packet[header_field.offset : field_end]
+        if value != previous_value:
+            changed_fields_mask |= 1 << field_index
+            changed_fields_data += (
+                _encode_field_delta(previous_value, value)
+                if header_field.kind is FieldKind.DELTA
+                else value
+            )
+
+        field_index += 1
+
+    payload: bytes = packet[len(context_header) :]
+    return b"".join(
+        (
+            bytes((RecordKind.DELTA,)),
+            encode_varint(context_id),
+            encode_varint(changed_fields_mask),
+            changed_fields_data,
+            encode_varint(len(payload)),
+            payload,
+        )
+    )
+
+
+def compress_packet_headers(content: bytes) -> bytes | None:
+    """"""
+    packets: Sequence[bytes]
+    unframed_content: bytes
+    packets, unframed_content = split_packets(content)
+    if unframed_content:
+        logger.debug("Frame is not a sequence of IP packets, so headers stay uncompressed")
+        return None
+
+    contexts: dict[tuple[Sequence[HeaderField], bytes], tuple[int, bytes]] = {}
+    compressed_content: bytearray = bytearray()
+
+    packet: bytes
+    for packet in packets:
+        header_fields: Sequence[HeaderField] | None = get_header_fields(packet)
+        if header_fields is None or not _is_compressible(packet, header_fields):
+            compressed_content.append(RecordKind.RAW)
+            compressed_content += encode_varint(len(packet)) + packet
+            continue
+
+        header_size: int = header_fields[-1].offset + header_fields[-1].size
+        flow_key: tuple[Sequence[HeaderField], bytes] = (
+            tuple(header_fields),
+            b"".join(
+                packet[header_field.offset : header_field.offset + header_field.size]
+                for header_field in header_fields
+                if header_field.kind is FieldKind.STATIC
+            ),
+        )
+
+        context: tuple[int, bytes] | None = contexts.get(flow_key)
+        if context is None:
+            contexts[flow_key] = (len(contexts), packet[:header_size])
+            compressed_content.append(RecordKind.FULL)
+            compressed_content += encode_varint(len(packet)) + packet
+            continue
+
+        context_id: int
+        context_header: bytes
+        context_id, context_header = context
+        compressed_content += _encode_delta_record(
+            context_id, header_fields, context_header, packet
+        )
+        contexts[flow_key] = (context_id, packet[:header_size])
+
+    logger.debug(
+        "Compressed the headers of %d packets in %d flows from %d to %d bytes",
+        len(packets),
+        len(contexts),
+        len(content),
+        len(compressed_content),
+    )
+
+    return bytes(compressed_content)
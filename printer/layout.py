@@ -0,0 +1,182 @@
+""""""
+
+import logging
+import math
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from logging import Logger
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "DATA_MATRIX_SQUARE_SYMBOL_SIZES",
+    "FOOTER_HEIGHT",
+    "QUIET_ZONE_MODULES",
+    "PageLayout",
+    "SymbolSlot",
+    "get_grid_size",
+    "get_symbol_modules",
+)
+
+
+logger: Final[Logger] = logging.getLogger("ipops-printer")
+
+
+# NOTE: Pairs of (modules per side, data codewords) for every square ECC200 symbol size
+DATA_MATRIX_SQUARE_SYMBOL_SIZES: Final[Sequence[tuple[int, int]]] = (
+    (10, 3),
+    (12, 5),
+    (14, 8),
+    (16, 12),
+    (18, 18),
+    (20, 22),
+    (22, 30),
+    (24, 36),
+    (26, 44),
+    (32, 62),
+    (36, 86),
+    (40, 114),
+    (44, 144),
+    (48, 174),
+    (52, 204),
+    (64, 280),
+    (72, 368),
+    (80, 456),
+    (88, 576),
+    (96, 696),
+    (104, 816),
+    (120, 1050),
+    (132, 1304),
+    (144, 1558),
+)
+QUIET_ZONE_MODULES: Final[int] = 2
+FOOTER_HEIGHT: Final[float] = 15.0
+
+
+def get_symbol_modules(codewords_count: int) -> int:
+    """"""
+    modules: int
+    capacity: int
+    for modules, capacity in DATA_MATRIX_SQUARE_SYMBOL_SIZES:
+        if codewords_count <= capacity:
+            return modules
+
+    logger.warning(
+        "No data matrix symbol can hold %d codewords, sizing layout for the largest symbol",
+        codewords_count,
+    )
+    return DATA_MATRIX_SQUARE_SYMBOL_SIZES[-1][0]
+
+
+def _get_usable_area(
+    paper_width: float, paper_height: float, margin: float
+) -> tuple[float, float]:
+    return paper_width - 2 * margin, paper_height - 2 * margin - FOOTER_HEIGHT
+
+
+def _get_cell_size(module_size: float, symbol_modules: int) -> float:
+    return (symbol_modules + 2 * QUIET_ZONE_MODULES) * module_size
+
+
+def get_grid_size(
+    paper_width: float,
+    paper_height: float,
+    margin: float,
+    module_size: float,
+    symbol_modules: int,
+) -> tuple[int, int]:
+    """"""
+    usable_width: float
+    usable_height: float
+    usable_width, usable_height = _get_usable_area(paper_width, paper_height, margin)
+    cell_size: float = _get_cell_size(module_size, symbol_modules)
+
+    return (
+        max(math.floor(usable_width / cell_size), 0),
+        max(math.floor(usable_height / cell_size), 0),
+    )
+
+
+class SymbolSlot(NamedTuple):
+    """"""
+
+    page: int
+    slot: int
+    x: float
+    y: float
+    size: float
+
+
+class PageLayout:
+    """"""
+
+    def __init__(
+        self,
+        paper_width: float,
+        paper_height: float,
+        margin: float,
+        module_size: float,
+        symbol_modules: int,
+    ) -> None:
+        """"""
+        self.margin: float = margin
+        self.module_size: float = module_size
+        self.cell_size: float = _get_cell_size(module_size, symbol_modules)
+
+        self.columns: int
+        self.rows: int
+        self.columns, self.rows = get_grid_size(
+            paper_width, paper_height, margin, module_size, symbol_modules
+        )
+
+        if not self.slots_per_page:
+            SYMBOL_TOO_LARGE_MESSAGE: Final[str] = (
+                f"A symbol of {symbol_modules} modules at {module_size}mm per module "
+                "does not fit onto a single page."
+            )
+            raise ValueError(SYMBOL_TOO_LARGE_MESSAGE)
+
+        usable_width: float = _get_usable_area(paper_width, paper_height, margin)[0]
+        self.x_offset: float = margin + (usable_width - self.columns * self.cell_size) / 2
+        self.y_offset: float = margin
+
+        logger.debug(
+            "Page layout: %dx%d grid of %.1fmm symbol cells",
+            self.columns,
+            self.rows,
+            self.cell_size,
+        )
+
+    @property
+    def slots_per_page(self) -> int:
+        """"""
+        return self.columns * self.rows
+
+    def pages_needed(self, symbols_count: int) -> int:
+        """"""
+        return -(-symbols_count // self.slots_per_page)
+
+    def locate(self, symbol_index: int) -> SymbolSlot:
+        """"""
+        if symbol_index < 0:
+            NEGATIVE_SYMBOL_INDEX_MESSAGE: Final[str] = (
+                f"Cannot locate negative symbol index: {symbol_index}."
+            )
+            raise ValueError(NEGATIVE_SYMBOL_INDEX_MESSAGE)
+
+        page: int
+        slot: int
+        page, slot = divmod(symbol_index, self.slots_per_page)
+
+        row: int
+        column: int
+        row, column = divmod(slot, self.columns)
+
+        return SymbolSlot(
+            page=page,
+            slot=slot,
+            x=self.x_offset + column * self.cell_size,
+            y=self.y_offset + row * self.cell_size,
+            size=self.cell_size,
+        )
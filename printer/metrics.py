@@ -0,0 +1,76 @@
+""""""
+
+from typing import TYPE_CHECKING
+
+from shared.metrics import Counter, Gauge, Histogram, MetricsExporter, MetricsRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "BYTES_RECEIVED",
+    "DUPLICATE_PACKETS",
+    "ENCODE_SECONDS",
+    "FRAMES_SPOOLED",
+    "LP_SECONDS",
+    "PACKETS_RECEIVED",
+    "PAGES_PRINTED",
+    "PAGE_FILL_RATIO",
+    "PAGE_PACKING_EFFICIENCY",
+    "PRINT_QUEUE_DEPTH",
+    "REGISTRY",
+    "SPOOL_DEPTH",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsExporter",
+    "MetricsRegistry",
+)
+
+
+LATENCY_BUCKETS: Final[Sequence[float]] = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+FILL_RATIO_BUCKETS: Final[Sequence[float]] = (0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 1)
+
+
+REGISTRY: Final[MetricsRegistry] = MetricsRegistry()
+
+PACKETS_RECEIVED: Final[Counter] = REGISTRY.counter(
+    "ipops_printer_packets_received_total", "IP packets added to IPoPS frames."
+)
+BYTES_RECEIVED: Final[Counter] = REGISTRY.counter(
+    "ipops_printer_received_bytes_total", "Bytes of IP packets added to IPoPS frames."
+)
+DUPLICATE_PACKETS: Final[Counter] = REGISTRY.counter(
+    "ipops_printer_duplicate_packets_total", "Duplicate IP packets that were not printed."
+)
+FRAMES_SPOOLED: Final[Counter] = REGISTRY.counter(
+    "ipops_printer_frames_spooled_total", "IPoPS frames handed to the print spool."
+)
+PAGES_PRINTED: Final[Counter] = REGISTRY.counter(
+    "ipops_printer_pages_printed_total", "Pages submitted to 'lp'."
+)
+PAGE_FILL_RATIO: Final[Histogram] = REGISTRY.histogram(
+    "ipops_printer_page_fill_ratio",
+    "Share of each printed page's data capacity that was used.",
+    FILL_RATIO_BUCKETS,
+)
+PAGE_PACKING_EFFICIENCY: Final[Histogram] = REGISTRY.histogram(
+    "ipops_printer_page_packing_efficiency",
+    "Share of the data codewords in each printed page's symbols that carried payload bytes.",
+    FILL_RATIO_BUCKETS,
+)
+ENCODE_SECONDS: Final[Histogram] = REGISTRY.histogram(
+    "ipops_printer_encode_seconds",
+    "Time taken to encode each IPoPS frame into a PDF.",
+    LATENCY_BUCKETS,
+)
+LP_SECONDS: Final[Histogram] = REGISTRY.histogram(
+    "ipops_printer_lp_seconds", "Time taken by each call to 'lp'.", LATENCY_BUCKETS
+)
+SPOOL_DEPTH: Final[Gauge] = REGISTRY.gauge(
+    "ipops_printer_spool_depth_frames", "IPoPS frames waiting to be encoded."
+)
+PRINT_QUEUE_DEPTH: Final[Gauge] = REGISTRY.gauge(
+    "ipops_printer_print_queue_depth_jobs", "Encoded print jobs waiting for 'lp'."
+)
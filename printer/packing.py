@@ -0,0 +1,143 @@
+""""""
+
+import functools
+import logging
+from typing import TYPE_CHECKING, NamedTuple
+
+from .layout import DATA_MATRIX_SQUARE_SYMBOL_SIZES, get_grid_size
+from .symbol_codec import get_symbol_codewords
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from logging import Logger
+    from typing import Final
+
+    from .config import SymbolCodec
+
+__all__: Sequence[str] = (
+    "SymbolPacking",
+    "choose_symbol_packing",
+    "get_chunk_capacity",
+    "get_packing_efficiency",
+)
+
+
+logger: Final[Logger] = logging.getLogger("ipops-printer")
+
+
+class SymbolPacking(NamedTuple):
+    """"""
+
+    symbol_modules: int
+    chunk_size: int
+    slots_per_page: int
+
+    @property
+    def page_capacity(self) -> int:
+        """"""
+        return self.slots_per_page * self.chunk_size
+
+
+def get_chunk_capacity(
+    symbol_codec: SymbolCodec, header_size: int, symbol_codewords: int
+) -> int:
+    """"""
+    # NOTE: Every codec spends at least one codeword per byte, so the search is bounded
+    # by the codeword count, and the codewords needed only ever grow with the chunk size
+    lower_bound: int = 0
+    upper_bound: int = symbol_codewords
+    while lower_bound < upper_bound:
+        chunk_size: int = (lower_bound + upper_bound + 1) // 2
+        if get_symbol_codewords(symbol_codec, header_size + chunk_size) <= symbol_codewords:
+            lower_bound = chunk_size
+        else:
+            upper_bound = chunk_size - 1
+
+    return lower_bound
+
+
+@functools.cache
+def choose_symbol_packing(
+    symbol_codec: SymbolCodec,
+    header_size: int,
+    max_chunk_size: int,
+    paper_width: float,
+    paper_height: float,
+    margin: float,
+    module_size: float,
+) -> SymbolPacking:
+    """"""
+    best_symbol_packing: SymbolPacking | None = None
+
+    # NOTE: Every square symbol size is tried with chunks filling its data codewords,
+    # as a smaller symbol often fits enough extra symbols onto the page to carry more data
+    symbol_modules: int
+    symbol_codewords: int
+    for symbol_modules, symbol_codewords in DATA_MATRIX_SQUARE_SYMBOL_SIZES:
+        chunk_size: int = min(
+            max_chunk_size, get_chunk_capacity(symbol_codec, header_size, symbol_codewords)
+        )
+        if chunk_size < 1:
+            continue
+
+        columns: int
+        rows: int
+        columns, rows = get_grid_size(
+            paper_width, paper_height, margin, module_size, symbol_modules
+        )
+        if not columns * rows:
+            break
+
+        symbol_packing: SymbolPacking = SymbolPacking(
+            symbol_modules=symbol_modules, chunk_size=chunk_size, slots_per_page=columns * rows
+        )
+        # NOTE: A tie goes to the smaller symbol, as it wastes fewer modules on the page
+        if (
+            best_symbol_packing is None
+            or symbol_packing.page_capacity > best_symbol_packing.page_capacity
+        ):
+            best_symbol_packing = symbol_packing
+
+    if best_symbol_packing is None:
+        NO_SYMBOL_FITS_MESSAGE: Final[str] = (
+            f"No data matrix symbol at {module_size}mm per module fits onto a single page "
+            "with room for any data."
+        )
+        raise ValueError(NO_SYMBOL_FITS_MESSAGE)
+
+    logger.debug(
+        "Packing chunks of up to %d bytes into %d %dx%d module symbols per page",
+        best_symbol_packing.chunk_size,
+        best_symbol_packing.slots_per_page,
+        best_symbol_packing.symbol_modules,
+        best_symbol_packing.symbol_modules,
+    )
+
+    return best_symbol_packing
+
+
+def _get_symbol_data_codewords(codewords_count: int) -> int:
+    symbol_codewords: int
+    for _, symbol_codewords in DATA_MATRIX_SQUARE_SYMBOL_SIZES:
+        if codewords_count <= symbol_codewords:
+            return symbol_codewords
+
+    return DATA_MATRIX_SQUARE_SYMBOL_SIZES[-1][1]
+
+
+def get_packing_efficiency(
+    symbol_codec: SymbolCodec, header_size: int, chunk_sizes: Sequence[int]
+) -> float:
+    """"""
+    # NOTE: This is the share of the printed symbols' data codewords that carry payload
+    # bytes, rather than symbol headers, codec overhead or padding up to the symbol size
+    symbols_codewords: int = sum(
+        _get_symbol_data_codewords(
+            get_symbol_codewords(symbol_codec, header_size + chunk_size)
+        )
+        for chunk_size in chunk_sizes
+    )
+    if not symbols_codewords:
+        return 0.0
+
+    return sum(chunk_sizes) / symbols_codewords
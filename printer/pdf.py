@@ -1,35 +1,89 @@
 """"""
 
-import base64
+import functools
 import itertools
 import logging
-from typing import TYPE_CHECKING, override
+import math
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple, override
 
 from fpdf import FPDF
-from fpdf.enums import WrapMode
-from PIL import Image
+from PIL import Image, ImageChops
 from pylibdmtx import pylibdmtx
 
-from .config import PDFDataFormat, settings
+from . import compression, fec, header_compression
+from .config import ColourMode, PDFDataFormat, SymbolRendering, settings
+from .header import SymbolHeader, get_max_header_size, pack_symbol
+from .layout import FOOTER_HEIGHT, PageLayout
+from .packing import choose_symbol_packing, get_chunk_capacity, get_packing_efficiency
+from .symbol_codec import DMTX_ENCODING_SCHEMES, encode_symbol_data
+from .text_codec import TEXT_LINE_OVERHEAD, encode_text_lines, get_text_lines_capacity
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
     from logging import Logger
-    from pathlib import Path
     from typing import Final, Literal
 
-__all__: Sequence[str] = ("bytes_into_pdf",)
+    from .compression import FrameCodec
+    from .config import SymbolCodec
+    from .layout import SymbolSlot
+    from .packing import SymbolPacking
+
+__all__: Sequence[str] = (
+    "RenderedPDF",
+    "RenderedPostScript",
+    "RenderedSymbol",
+    "bytes_into_pdf",
+    "bytes_into_postscript",
+    "encode_symbols",
+    "get_frame_capacity",
+    "get_page_capacity",
+    "get_symbol_packing",
+    "shutdown_encoder_pools",
+)
 
 
 logger: Final[Logger] = logging.getLogger("ipops-printer")
 
 
-def _encode_bytes_base64_for_ocr(content: bytes) -> str:
-    return base64.standard_b64encode(content).decode()
+DMTX_MODULE_PIXEL_SIZE: Final[int] = 5
+FRAME_END_PAGE_FLAG: Final[int] = 0x80
+FEC_PAGE_FLAG: Final[int] = 0x40
+PARITY_PAGE_FLAG: Final[int] = 0x20
+HEADER_COMPRESSION_PAGE_FLAG: Final[int] = 0x10
+FEC_PAGE_HEADER_SIZE: Final[int] = 3
+POINTS_PER_MILLIMETRE: Final[float] = 72 / 25.4
+POSTSCRIPT_FOOTER_FONT_SIZE: Final[int] = 16
+POSTSCRIPT_FOOTER_X_OFFSET: Final[float] = 12.5
+POSTSCRIPT_FOOTER_Y_OFFSET: Final[float] = 8.0
+POSTSCRIPT_HEX_LINE_LENGTH: Final[int] = 128
+TEXT_FONT_FAMILY: Final[str] = "Courier"
+TEXT_FONT_SIZE: Final[int] = 12
+TEXT_LINE_SPACING: Final[float] = 1.6
+TEXT_DATA_CHARACTERS_MULTIPLE: Final[int] = 8
+CALIBRATION_PATCH_SIZE: Final[float] = 8.0
+CALIBRATION_PATCH_GAP: Final[float] = 2.0
+DARK_MODULE_RUN_PATTERN: Final[re.Pattern[bytes]] = re.compile(rb"\x00+")
+
+# NOTE: Each colour channel carries its own symbol, printed with the ink that darkens only
+# that channel of a scan: cyan for red, magenta for green and yellow for blue
+COLOUR_MODE_CHANNELS: Final[Mapping[ColourMode, int]] = {
+    ColourMode.MONOCHROME: 1,
+    ColourMode.CMY: 3,
+}
+CALIBRATION_PATCH_COLOURS: Final[Sequence[tuple[int, int, int]]] = (
+    (0, 255, 255),
+    (255, 0, 255),
+    (255, 255, 0),
+)
+
+# NOTE: A parity page carries its own header plus a length-prefixed copy of the largest
+# data page record (page flags, data page header and data)
+FEC_PAGE_OVERHEAD: Final[int] = 2 * FEC_PAGE_HEADER_SIZE + 1 + fec.SHARD_LENGTH_PREFIX_SIZE
 
 
-def _get_font_location(font_name: str) -> Path:
-    raise NotImplementedError
+_encoder_pools: Final[dict[int, ProcessPoolExecutor]] = {}
 
 
 class _IPoPS_PDF(FPDF):
@@ -49,61 +103,645 @@ class _IPoPS_PDF(FPDF):
 
     @override
     def footer(self) -> None:
+        if settings.COLOUR_MODE is ColourMode.CMY:
+            self._draw_calibration_patches()
+
         self.set_y(-15)
         self.set_x(-15)
-        self.set_font(
-            "IPoPS-custom-font"
-            if settings.PDF_DATA_FORMAT is PDFDataFormat.TEXT
-            else "Courier",
-            size=16,
-        )
+        self.set_font("Courier", size=16)
         self.cell(0, 10, str(self.starting_page_number + self.page_no()), align="C")
 
+    def _draw_calibration_patches(self) -> None:
+        # NOTE: The scanner measures how each ink was printed and scanned from these patches,
+        # which sit in the footer below the grid of symbols
+        patch_index: int
+        patch_colour: tuple[int, int, int]
+        for patch_index, patch_colour in enumerate(CALIBRATION_PATCH_COLOURS):
+            self.set_fill_color(*patch_colour)
+            self.rect(
+                settings.PAGE_MARGIN
+                + patch_index * (CALIBRATION_PATCH_SIZE + CALIBRATION_PATCH_GAP),
+                self.h - 15,
+                CALIBRATION_PATCH_SIZE,
+                CALIBRATION_PATCH_SIZE,
+                style="F",
+            )
+
 
 def resize(img):
     base_width = 500
     wpercent = (base_width / float(img.size[0]))
     hsize = int((float(img.size[1]) * float(wpercent)))
     return img.resize((base_width, hsize), Image.Resampling.NEAREST)
-    
 
 
-def bytes_into_pdf(content: bytes, starting_page_number: int) -> tuple[bytearray, int]:
+class RenderedSymbol(NamedTuple):
+    """"""
+
+    image: Image.Image
+    modules: int
+
+
+class RenderedPDF(NamedTuple):
+    """"""
+
+    pdf_bytes: bytearray
+    pages_count: int
+    page_fill_ratios: Sequence[float]
+    page_packing_efficiencies: Sequence[float]
+
+
+class RenderedPostScript(NamedTuple):
+    """"""
+
+    postscript_bytes: bytes
+    pages_count: int
+    page_fill_ratios: Sequence[float]
+    page_packing_efficiencies: Sequence[float]
+
+
+class _TextLayout(NamedTuple):
+    lines_per_page: int
+    data_characters_per_line: int
+    line_height: float
+    chunk_size: int
+
+
+class _EncodedFrame(NamedTuple):
+    module_size: float
+    placed_symbols: Sequence[tuple[SymbolSlot, RenderedSymbol]]
+    page_fill_ratios: Sequence[float]
+    page_packing_efficiencies: Sequence[float]
+
+
+def _render_symbol(symbol_data: bytes, encoding_scheme: str) -> RenderedSymbol:
+    encoded_datamatrix: pylibdmtx.Encoded = pylibdmtx.encode(
+        symbol_data, scheme=encoding_scheme, size="SquareAuto"
+    )
+    modules: int = encoded_datamatrix.width // DMTX_MODULE_PIXEL_SIZE
+
+    # NOTE: The symbol is kept as a 1-bit image with one pixel per module,
+    # sampled from the centre of each module that libdmtx drew
+    return RenderedSymbol(
+        image=Image.frombytes(
+            "RGB",
+            (encoded_datamatrix.width, encoded_datamatrix.height),
+            encoded_datamatrix.pixels,
+        )
+        .convert("L")
+        .resize((modules, modules), Image.Resampling.NEAREST)
+        .convert("1", dither=Image.Dither.NONE),
+        modules=modules,
+    )
+
+
+def _draw_symbol_modules(
+    pdf: FPDF, symbol_image: Image.Image, x: float, y: float, module_size: float
+) -> None:
+    symbol_pixels: bytes = symbol_image.convert("L").tobytes()
+
+    # NOTE: Each horizontal run of dark modules becomes one filled rectangle,
+    # which grows downwards for as long as the same run repeats on the following rows
+    open_runs: dict[tuple[int, int], int] = {}
+
+    row: int
+    for row in range(symbol_image.height + 1):
+        row_start: int = row * symbol_image.width
+        row_runs: set[tuple[int, int]] = (
+            {
+                (run_match.start() - row_start, run_match.end() - run_match.start())
+                for run_match in DARK_MODULE_RUN_PATTERN.finditer(
+                    symbol_pixels, row_start, row_start + symbol_image.width
+                )
+            }
+            if row < symbol_image.height
+            else set()
+        )
+
+        run: tuple[int, int]
+        for run in open_runs.keys() - row_runs:
+            run_start_row: int = open_runs.pop(run)
+            pdf.rect(
+                x + run[0] * module_size,
+                y + run_start_row * module_size,
+                run[1] * module_size,
+                (row - run_start_row) * module_size,
+                style="F",
+            )
+
+        for run in row_runs - open_runs.keys():
+            open_runs[run] = row
+
+
+def _combine_channel_symbols(
+    channel_symbols: Sequence[RenderedSymbol], channels: int
+) -> RenderedSymbol:
+    if channels == 1:
+        return channel_symbols[0]
+
+    # NOTE: Every channel symbol starts in the top left corner, like a lone symbol in a slot,
+    # and a channel with no symbol of its own is left blank
+    modules: int = max(channel_symbol.modules for channel_symbol in channel_symbols)
+    channel_images: Sequence[Image.Image] = [
+        Image.new("L", (modules, modules), 255) for _ in range(len(CALIBRATION_PATCH_COLOURS))
+    ]
+
+    channel_image: Image.Image
+    channel_symbol: RenderedSymbol
+    for channel_image, channel_symbol in zip(channel_images, channel_symbols, strict=False):
+        channel_image.paste(channel_symbol.image.convert("L"), (0, 0))
+
+    return RenderedSymbol(image=Image.merge("RGB", channel_images), modules=modules)
+
+
+def _get_symbol_colour_masks(
+    symbol_image: Image.Image,
+) -> Sequence[tuple[tuple[int, int, int], Image.Image]]:
+    # NOTE: Each module's colour is numbered by which of its channels are dark,
+    # and every colour that appears gets a mask with its own modules dark
+    colour_numbers: Image.Image = Image.new("L", symbol_image.size, 0)
+
+    channel: int
+    channel_image: Image.Image
+    for channel, channel_image in enumerate(symbol_image.split()):
+        colour_numbers = ImageChops.add(
+            colour_numbers,
+            channel_image.point(lambda value, channel=channel: 0 if value else 1 << channel),
+        )
+
+    return [
+        (
+            (
+                0 if colour_number & 1 else 255,
+                0 if colour_number & 2 else 255,
+                0 if colour_number & 4 else 255,
+            ),
+            colour_numbers.point(
+                lambda value, colour_number=colour_number: 0 if value == colour_number else 255
+            ),
+        )
+        for colour_number in sorted(set(colour_numbers.tobytes()) - {0})
+    ]
+
+
+def _get_encoder_pool(workers: int) -> ProcessPoolExecutor:
+    if workers not in _encoder_pools:
+        logger.debug("Starting data matrix encoder pool with %d workers", workers)
+        _encoder_pools[workers] = ProcessPoolExecutor(max_workers=workers)
+
+    return _encoder_pools[workers]
+
+
+def encode_symbols(
+    symbols_data: Sequence[bytes],
+    workers: int | None = None,
+    symbol_codec: SymbolCodec | None = None,
+) -> Sequence[RenderedSymbol]:
+    """"""
+    if workers is None:
+        workers = settings.ENCODE_WORKERS
+
+    if symbol_codec is None:
+        symbol_codec = settings.SYMBOL_CODEC
+
+    render_symbol: functools.partial[RenderedSymbol] = functools.partial(
+        _render_symbol, encoding_scheme=DMTX_ENCODING_SCHEMES[symbol_codec]
+    )
+
+    if workers <= 1 or len(symbols_data) <= 1:
+        return [render_symbol(symbol_data) for symbol_data in symbols_data]
+
+    # NOTE: Executor.map() yields results in submission order, so pages stay in sequence
+    return list(_get_encoder_pool(workers).map(render_symbol, symbols_data))
+
+
+def shutdown_encoder_pools() -> None:
+    """"""
+    pool: ProcessPoolExecutor
+    for pool in _encoder_pools.values():
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    _encoder_pools.clear()
+
+
+def _place_symbol(
+    pdf: FPDF,
+    rendered_symbol: RenderedSymbol,
+    symbol_slot: SymbolSlot,
+    module_size: float,
+    symbol_rendering: SymbolRendering,
+) -> None:
+    symbol_size: float = rendered_symbol.modules * module_size
+
+    match symbol_rendering:
+        case SymbolRendering.VECTOR if rendered_symbol.image.mode == "RGB":
+            colour: tuple[int, int, int]
+            colour_mask: Image.Image
+            for colour, colour_mask in _get_symbol_colour_masks(rendered_symbol.image):
+                pdf.set_fill_color(*colour)
+                _draw_symbol_modules(
+                    pdf, colour_mask, symbol_slot.x, symbol_slot.y, module_size
+                )
+
+        case SymbolRendering.VECTOR:
+            pdf.set_fill_color(0)
+            _draw_symbol_modules(
+                pdf, rendered_symbol.image, symbol_slot.x, symbol_slot.y, module_size
+            )
+
+        case SymbolRendering.BITMAP:
+            # NOTE: Embedded images are not interpolated, so every module stays a sharp square
+            pdf.image(
+                rendered_symbol.image,
+                x=symbol_slot.x,
+                y=symbol_slot.y,
+                w=symbol_size,
+                h=symbol_size,
+            )
+
+        case SymbolRendering.RASTER:
+            pdf.image(
+                resize(rendered_symbol.image.convert("RGB")),
+                x=symbol_slot.x,
+                y=symbol_slot.y,
+                w=symbol_size,
+                h=symbol_size,
+            )
+
+
+def _get_max_header_size(starting_page_number: int) -> int:
+    return get_max_header_size(
+        settings.HEADER_VERSION,
+        starting_page_number,
+        settings.STREAM_ID,
+        settings.MAX_BUFFER_SIZE,
+    )
+
+
+def _get_symbol_packing(
+    paper_width: float, paper_height: float, starting_page_number: int
+) -> SymbolPacking:
+    return choose_symbol_packing(
+        settings.SYMBOL_CODEC,
+        _get_max_header_size(starting_page_number),
+        settings.MAX_BUFFER_SIZE,
+        paper_width,
+        paper_height,
+        settings.PAGE_MARGIN,
+        settings.MODULE_SIZE,
+    )
+
+
+def get_symbol_packing(starting_page_number: int) -> SymbolPacking:
+    """"""
+    paper: FPDF = FPDF(format=settings.PAPER_SIZE)
+    return _get_symbol_packing(paper.w, paper.h, starting_page_number)
+
+
+def _get_text_layout(pdf: FPDF, starting_page_number: int) -> _TextLayout:
+    pdf.set_font(TEXT_FONT_FAMILY, size=TEXT_FONT_SIZE)
+
+    # NOTE: Courier is monospaced, so every character is as wide as the first one
+    characters_per_line: int = math.floor(
+        (pdf.w - 2 * settings.PAGE_MARGIN) / pdf.get_string_width("0")
+    )
+    data_characters_per_line: int = (
+        (characters_per_line - TEXT_LINE_OVERHEAD)
+        // TEXT_DATA_CHARACTERS_MULTIPLE
+        * TEXT_DATA_CHARACTERS_MULTIPLE
+    )
+    line_height: float = TEXT_FONT_SIZE * TEXT_LINE_SPACING / pdf.k
+    lines_per_page: int = math.floor(
+        (pdf.h - 2 * settings.PAGE_MARGIN - FOOTER_HEIGHT) / line_height
+    )
+
+    if data_characters_per_line < 1 or lines_per_page < 1:
+        TEXT_TOO_LARGE_MESSAGE: Final[str] = (
+            f"No line of {TEXT_FONT_SIZE}pt text data fits onto a single page."
+        )
+        raise ValueError(TEXT_TOO_LARGE_MESSAGE)
+
+    # NOTE: Each page holds a single symbol's worth of data, spread over its text lines
+    text_capacity: int = get_text_lines_capacity(lines_per_page, data_characters_per_line)
+    return _TextLayout(
+        lines_per_page=lines_per_page,
+        data_characters_per_line=data_characters_per_line,
+        line_height=line_height,
+        chunk_size=get_chunk_capacity(
+            settings.SYMBOL_CODEC,
+            get_max_header_size(
+                settings.HEADER_VERSION,
+                starting_page_number,
+                settings.STREAM_ID,
+                text_capacity,
+            ),
+            text_capacity,
+        ),
+    )
+
+
+def get_page_capacity(starting_page_number: int) -> int:
+    """"""
+    page_capacity: int
+    match settings.PDF_DATA_FORMAT:
+        case PDFDataFormat.TEXT:
+            page_capacity = _get_text_layout(
+                FPDF(format=settings.PAPER_SIZE), starting_page_number
+            ).chunk_size
+        case PDFDataFormat.DATA_MATRIX:
+            page_capacity = (
+                get_symbol_packing(starting_page_number).page_capacity
+                * COLOUR_MODE_CHANNELS[settings.COLOUR_MODE]
+            )
+
+    return page_capacity - (FEC_PAGE_OVERHEAD if settings.FEC_PARITY_PAGES else 0)
+
+
+def get_frame_capacity(starting_page_number: int) -> int:
+    """"""
+    # NOTE: Parity pages are added to each frame on its own, so a frame is sized to fill a
+    # whole forward error correction group rather than a single data page
+    fec_data_pages: int = settings.FEC_DATA_PAGES
+    return get_page_capacity(starting_page_number) * (
+        fec_data_pages if settings.FEC_PARITY_PAGES else 1
+    )
+
+
+def _paginate_frame(
+    frame_flags: int, content: bytes, page_capacity: int
+) -> Sequence[tuple[int, bytes]]:
+    fec_parity_pages: int = settings.FEC_PARITY_PAGES
+    data_capacity: int = page_capacity - (FEC_PAGE_OVERHEAD if fec_parity_pages else 0)
+    if data_capacity < 1:
+        PAGE_TOO_SMALL_MESSAGE: Final[str] = (
+            f"A page holding {page_capacity} bytes is too small to carry any data."
+        )
+        raise ValueError(PAGE_TOO_SMALL_MESSAGE)
+
+    pages_content: Sequence[bytes] = [
+        content[offset : offset + data_capacity]
+        for offset in range(0, len(content), data_capacity)
+    ]
+
+    pages_flags: Sequence[int] = [
+        frame_flags
+        | (FEC_PAGE_FLAG if fec_parity_pages else 0)
+        | (FRAME_END_PAGE_FLAG if page_offset == len(pages_content) - 1 else 0)
+        for page_offset in range(len(pages_content))
+    ]
+
+    if not fec_parity_pages:
+        return list(zip(pages_flags, pages_content, strict=True))
+
+    pages: list[tuple[int, bytes]] = []
+
+    group_start: int
+    for group_start in range(0, len(pages_content), settings.FEC_DATA_PAGES):
+        group_end: int = min(group_start + settings.FEC_DATA_PAGES, len(pages_content))
+        group_pages: Sequence[tuple[int, bytes]] = [
+            (
+                pages_flags[page_offset],
+                bytes((page_offset - group_start, group_end - group_start, fec_parity_pages))
+                + pages_content[page_offset],
+            )
+            for page_offset in range(group_start, group_end)
+        ]
+        pages.extend(group_pages)
+
+        # NOTE: Parity covers each page's flags too, so a rebuilt page keeps its frame markers
+        parity_shards: Sequence[bytes] = fec.encode_parity_shards(
+            fec.pad_shards(
+                [bytes((page_flags,)) + page_data for page_flags, page_data in group_pages]
+            ),
+            fec_parity_pages,
+        )
+        pages.extend(
+            (
+                FEC_PAGE_FLAG | PARITY_PAGE_FLAG,
+                bytes((len(group_pages) + parity_index, len(group_pages), fec_parity_pages))
+                + parity_shard,
+            )
+            for parity_index, parity_shard in enumerate(parity_shards)
+        )
+
+    return pages
+
+
+def _compress_frame(content: bytes) -> tuple[int, bytes]:
+    frame_flags: int = 0
+    if settings.HEADER_COMPRESSION:
+        compressed_headers_content: bytes | None = header_compression.compress_packet_headers(
+            content
+        )
+        # NOTE: Like frame compression, header compression is only used when it saves space
+        if compressed_headers_content is not None and len(compressed_headers_content) < len(
+            content
+        ):
+            frame_flags |= HEADER_COMPRESSION_PAGE_FLAG
+            content = compressed_headers_content
+
+    frame_codec: FrameCodec
+    frame_codec, content = compression.compress_frame(content)
+    return frame_flags | frame_codec, content
+
+
+def _pack_page_symbols(
+    page_index: int, page_flags: int, page_data: bytes, chunk_size: int
+) -> Sequence[bytes]:
+    page_chunks: Sequence[Sequence[int]] = list(
+        itertools.batched(page_data, chunk_size, strict=False)
+    )
+    symbols_data: list[bytes] = []
+
+    slot: int
+    content_chunk: Sequence[int]
+    for slot, content_chunk in enumerate(page_chunks):
+        raw_prefix: bytes
+        symbol_data: bytes
+        raw_prefix, symbol_data = pack_symbol(
+            settings.HEADER_VERSION,
+            SymbolHeader(
+                page_number=page_index,
+                slot=slot,
+                slots_count=len(page_chunks),
+                page_flags=page_flags,
+                stream_id=settings.STREAM_ID,
+            ),
+            bytes(content_chunk),
+        )
+        symbols_data.append(encode_symbol_data(settings.SYMBOL_CODEC, symbol_data, raw_prefix))
+
+    return symbols_data
+
+
+def _encode_frame(
+    content: bytes, starting_page_number: int, paper_width: float, paper_height: float
+) -> _EncodedFrame:
+    symbol_packing: SymbolPacking = _get_symbol_packing(
+        paper_width, paper_height, starting_page_number
+    )
+    page_layout: PageLayout = PageLayout(
+        paper_width=paper_width,
+        paper_height=paper_height,
+        margin=settings.PAGE_MARGIN,
+        module_size=settings.MODULE_SIZE,
+        symbol_modules=symbol_packing.symbol_modules,
+    )
+
+    frame_flags: int
+    frame_flags, content = _compress_frame(content)
+
+    channels: int = COLOUR_MODE_CHANNELS[settings.COLOUR_MODE]
+    page_capacity: int = symbol_packing.page_capacity * channels
+    pages: Sequence[tuple[int, bytes]] = _paginate_frame(frame_flags, content, page_capacity)
+    page_fill_ratios: Sequence[float] = [
+        len(page_data) / page_capacity for _, page_data in pages
+    ]
+    page_packing_efficiencies: Sequence[float] = [
+        get_packing_efficiency(
+            settings.SYMBOL_CODEC,
+            _get_max_header_size(starting_page_number),
+            [
+                len(page_data[offset : offset + symbol_packing.chunk_size])
+                for offset in range(0, len(page_data), symbol_packing.chunk_size)
+            ],
+        )
+        for _, page_data in pages
+    ]
+
+    symbol_indices: list[int] = []
+    symbols_data: list[bytes] = []
+
+    page_offset: int
+    page_flags: int
+    page_data: bytes
+    for page_offset, (page_flags, page_data) in enumerate(pages):
+        page_symbols_data: Sequence[bytes] = _pack_page_symbols(
+            starting_page_number + page_offset,
+            page_flags,
+            page_data,
+            symbol_packing.chunk_size,
+        )
+        symbol_indices.extend(
+            page_offset * page_layout.slots_per_page * channels + slot
+            for slot in range(len(page_symbols_data))
+        )
+        symbols_data.extend(page_symbols_data)
+
+    # NOTE: Consecutive symbols share a slot, one per colour channel
+    return _EncodedFrame(
+        module_size=page_layout.module_size,
+        placed_symbols=[
+            (
+                page_layout.locate(slot_index),
+                _combine_channel_symbols(
+                    [rendered_symbol for _, rendered_symbol in slot_symbols], channels
+                ),
+            )
+            for slot_index, slot_symbols in itertools.groupby(
+                zip(symbol_indices, encode_symbols(symbols_data), strict=True),
+                key=lambda indexed_symbol: indexed_symbol[0] // channels,
+            )
+        ],
+        page_fill_ratios=page_fill_ratios,
+        page_packing_efficiencies=page_packing_efficiencies,
+    )
+
+
+def _write_text_pages(
+    pdf: FPDF, content: bytes, starting_page_number: int
+) -> tuple[Sequence[float], Sequence[float]]:
+    text_layout: _TextLayout = _get_text_layout(pdf, starting_page_number)
+    text_capacity: int = get_text_lines_capacity(
+        text_layout.lines_per_page, text_layout.data_characters_per_line
+    )
+
+    frame_flags: int
+    frame_flags, content = _compress_frame(content)
+    pages: Sequence[tuple[int, bytes]] = _paginate_frame(
+        frame_flags, content, text_layout.chunk_size
+    )
+
+    page_offset: int
+    page_flags: int
+    page_data: bytes
+    for page_offset, (page_flags, page_data) in enumerate(pages):
+        pdf.add_page()
+        pdf.set_font(TEXT_FONT_FAMILY, size=TEXT_FONT_SIZE)
+
+        symbol_data: bytes
+        (symbol_data,) = _pack_page_symbols(
+            starting_page_number + page_offset, page_flags, page_data, text_layout.chunk_size
+        )
+
+        # NOTE: The text is placed by its baseline, one font size below the top of its line
+        line_index: int
+        text_line: str
+        for line_index, text_line in enumerate(
+            encode_text_lines(symbol_data, text_layout.data_characters_per_line)
+        ):
+            pdf.text(
+                x=settings.PAGE_MARGIN,
+                y=settings.PAGE_MARGIN
+                + line_index * text_layout.line_height
+                + TEXT_FONT_SIZE / pdf.k,
+                text=text_line,
+            )
+
+    return (
+        [len(page_data) / text_layout.chunk_size for _, page_data in pages],
+        [len(page_data) / text_capacity for _, page_data in pages],
+    )
+
+
+def bytes_into_pdf(
+    content: bytes,
+    starting_page_number: int,
+    symbol_rendering: SymbolRendering | None = None,
+) -> RenderedPDF:
     """"""
     logger.debug("Beginning PDF formatting")
 
-    pdf: FPDF = _IPoPS_PDF(format="A4", starting_page_number=starting_page_number)
+    if symbol_rendering is None:
+        symbol_rendering = settings.SYMBOL_RENDERING
+
+    page_fill_ratios: Sequence[float] = ()
+    page_packing_efficiencies: Sequence[float] = ()
+
+    pdf: FPDF = _IPoPS_PDF(
+        format=settings.PAPER_SIZE, starting_page_number=starting_page_number
+    )
 
     match settings.PDF_DATA_FORMAT:
         case PDFDataFormat.TEXT:
-            pdf.add_font(
-                "IPoPS-custom-font",
-                fname=_get_font_location("DejaVu Sans"),  # Allow configuration
+            logger.debug("Generating PDF with text")
+
+            page_fill_ratios, page_packing_efficiencies = _write_text_pages(
+                pdf, content, starting_page_number
             )
-            pdf.set_font("IPoPS-custom-font", size=12)
-            pdf.write(text=_encode_bytes_base64_for_ocr(content), wrapmode=WrapMode.CHAR)
 
         case PDFDataFormat.DATA_MATRIX:
             logger.debug("Generating PDF with data matrix")
 
-            page_index: int = starting_page_number
-            content_chunk: Sequence[int]
-            for content_chunk in itertools.batched(
-                content, settings.MAX_BUFFER_SIZE, strict=False
-            ):
-                pdf.add_page()
-                encoded_datamatrix: pylibdmtx.Encoded = pylibdmtx.encode(
-                    page_index.to_bytes(length=1, byteorder="big")
-                    + base64.b85encode(bytes(content_chunk))
-                )
-                pdf.image(
-                    resize(Image.frombytes(
-                        "RGB",
-                        (encoded_datamatrix.width, encoded_datamatrix.height),
-                        encoded_datamatrix.pixels,
-                    )),
+            encoded_frame: _EncodedFrame = _encode_frame(
+                content, starting_page_number, pdf.w, pdf.h
+            )
+            page_fill_ratios = encoded_frame.page_fill_ratios
+            page_packing_efficiencies = encoded_frame.page_packing_efficiencies
+
+            symbol_slot: SymbolSlot
+            rendered_symbol: RenderedSymbol
+            for symbol_slot, rendered_symbol in encoded_frame.placed_symbols:
+                if symbol_slot.slot == 0:
+                    pdf.add_page()
+
+                _place_symbol(
+                    pdf,
+                    rendered_symbol,
+                    symbol_slot,
+                    encoded_frame.module_size,
+                    symbol_rendering,
                 )
-                page_index += 1
 
         case _:
             UNKNOWN_PDF_DATA_FORMAT_ERROR: Final[str] = (
@@ -113,4 +751,122 @@ def bytes_into_pdf(content: bytes, starting_page_number: int) -> tuple[bytearray
 
     logger.debug("Formatting PDF completed successfully")
 
-    return pdf.output(), pdf.pages_count
+    return RenderedPDF(
+        pdf.output(), pdf.pages_count, page_fill_ratios, page_packing_efficiencies
+    )
+
+
+def _get_postscript_symbol(
+    rendered_symbol: RenderedSymbol,
+    symbol_slot: SymbolSlot,
+    module_size: float,
+    paper_height: float,
+) -> str:
+    # NOTE: PostScript measures in points upwards from the bottom of the page,
+    # and paints the zero bits of the 1-bit symbol image as dark modules
+    symbol_size: float = rendered_symbol.modules * module_size * POINTS_PER_MILLIMETRE
+    x: float = symbol_slot.x * POINTS_PER_MILLIMETRE
+    y: float = (paper_height - symbol_slot.y) * POINTS_PER_MILLIMETRE - symbol_size
+
+    symbol_width: int
+    symbol_height: int
+    symbol_width, symbol_height = rendered_symbol.image.size
+    symbol_hex: str = rendered_symbol.image.tobytes().hex()
+
+    return "\n".join(
+        (
+            f"gsave {x:.3f} {y:.3f} translate {symbol_size:.3f} {symbol_size:.3f} scale",
+            (
+                f"{symbol_width} {symbol_height} false "
+                f"[{symbol_width} 0 0 -{symbol_height} 0 {symbol_height}] {{<"
+            ),
+            *(
+                symbol_hex[offset : offset + POSTSCRIPT_HEX_LINE_LENGTH]
+                for offset in range(0, len(symbol_hex), POSTSCRIPT_HEX_LINE_LENGTH)
+            ),
+            ">} imagemask grestore",
+        )
+    )
+
+
+def _get_postscript_footer(page_number: int, paper_width: float) -> str:
+    return (
+        f"{(paper_width - POSTSCRIPT_FOOTER_X_OFFSET) * POINTS_PER_MILLIMETRE:.3f} "
+        f"{POSTSCRIPT_FOOTER_Y_OFFSET * POINTS_PER_MILLIMETRE:.3f} moveto "
+        f"({page_number}) dup stringwidth pop 2 div neg 0 rmoveto show"
+    )
+
+
+def bytes_into_postscript(content: bytes, starting_page_number: int) -> RenderedPostScript:
+    """"""
+    logger.debug("Beginning PostScript formatting")
+
+    if settings.PDF_DATA_FORMAT is not PDFDataFormat.DATA_MATRIX:
+        UNSUPPORTED_PDF_DATA_FORMAT_ERROR: Final[str] = (
+            f"PostScript output cannot print the {settings.PDF_DATA_FORMAT} data format."
+        )
+        raise ValueError(UNSUPPORTED_PDF_DATA_FORMAT_ERROR)
+
+    if settings.COLOUR_MODE is not ColourMode.MONOCHROME:
+        UNSUPPORTED_COLOUR_MODE_ERROR: Final[str] = (
+            f"PostScript output cannot print the {settings.COLOUR_MODE} colour mode."
+        )
+        raise ValueError(UNSUPPORTED_COLOUR_MODE_ERROR)
+
+    paper: FPDF = FPDF(format=settings.PAPER_SIZE)
+    encoded_frame: _EncodedFrame = _encode_frame(
+        content, starting_page_number, paper.w, paper.h
+    )
+
+    pages_symbols: list[list[str]] = []
+
+    symbol_slot: SymbolSlot
+    rendered_symbol: RenderedSymbol
+    for symbol_slot, rendered_symbol in encoded_frame.placed_symbols:
+        if symbol_slot.slot == 0:
+            pages_symbols.append([])
+
+        pages_symbols[-1].append(
+            _get_postscript_symbol(
+                rendered_symbol, symbol_slot, encoded_frame.module_size, paper.h
+            )
+        )
+
+    paper_width_points: float = paper.w * POINTS_PER_MILLIMETRE
+    paper_height_points: float = paper.h * POINTS_PER_MILLIMETRE
+
+    postscript_lines: list[str] = [
+        "%!PS-Adobe-3.0",
+        "%%Creator: IPoPS",
+        f"%%Pages: {len(pages_symbols)}",
+        f"%%BoundingBox: 0 0 {round(paper_width_points)} {round(paper_height_points)}",
+        "%%EndComments",
+        "%%BeginSetup",
+        f"<< /PageSize [{paper_width_points:.3f} {paper_height_points:.3f}] >> setpagedevice",
+        f"/Courier findfont {POSTSCRIPT_FOOTER_FONT_SIZE} scalefont setfont",
+        "%%EndSetup",
+    ]
+
+    # NOTE: The footers are numbered the same way as the footers of PDF pages
+    page_offset: int
+    page_symbols: Sequence[str]
+    for page_offset, page_symbols in enumerate(pages_symbols):
+        postscript_lines.extend(
+            (
+                f"%%Page: {page_offset + 1} {page_offset + 1}",
+                *page_symbols,
+                _get_postscript_footer(starting_page_number + page_offset + 1, paper.w),
+                "showpage",
+            )
+        )
+
+    postscript_lines.extend(("%%Trailer", "%%EOF", ""))
+
+    logger.debug("Formatting PostScript completed successfully")
+
+    return RenderedPostScript(
+        "\n".join(postscript_lines).encode("ascii"),
+        len(pages_symbols),
+        encoded_frame.page_fill_ratios,
+        encoded_frame.page_packing_efficiencies,
+    )
@@ -0,0 +1,322 @@
+""""""
+
+import logging
+import queue
+import re
+import subprocess
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from . import metrics, pdf
+from .config import OutputFormat, settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from logging import Logger
+    from pathlib import Path
+    from typing import Final
+
+__all__: Sequence[str] = ("PrintJob", "PrintSpool")
+
+
+logger: Final[Logger] = logging.getLogger("ipops-printer")
+
+
+QUEUE_POLL_INTERVAL: Final[float] = 0.1
+OUTPUT_FILE_SUFFIXES: Final[Mapping[OutputFormat, str]] = {
+    OutputFormat.PDF: ".pdf",
+    OutputFormat.POSTSCRIPT: ".ps",
+}
+
+
+class PrintJob(NamedTuple):
+    """"""
+
+    document_bytes: bytes | bytearray
+    starting_page_number: int
+    pages_count: int
+    frame: bytes
+    page_fill_ratios: Sequence[float] = ()
+    page_packing_efficiencies: Sequence[float] = ()
+    output_format: OutputFormat = OutputFormat.PDF
+
+
+def _render_frame(frame: bytes, starting_page_number: int) -> PrintJob:
+    match settings.OUTPUT_FORMAT:
+        case OutputFormat.PDF:
+            rendered_pdf: pdf.RenderedPDF = pdf.bytes_into_pdf(frame, starting_page_number)
+            return PrintJob(
+                rendered_pdf.pdf_bytes,
+                starting_page_number,
+                rendered_pdf.pages_count,
+                frame,
+                rendered_pdf.page_fill_ratios,
+                rendered_pdf.page_packing_efficiencies,
+                OutputFormat.PDF,
+            )
+
+        case OutputFormat.POSTSCRIPT:
+            rendered_postscript: pdf.RenderedPostScript = pdf.bytes_into_postscript(
+                frame, starting_page_number
+            )
+            return PrintJob(
+                rendered_postscript.postscript_bytes,
+                starting_page_number,
+                rendered_postscript.pages_count,
+                frame,
+                rendered_postscript.page_fill_ratios,
+                rendered_postscript.page_packing_efficiencies,
+                OutputFormat.POSTSCRIPT,
+            )
+
+        case _:
+            UNKNOWN_OUTPUT_FORMAT_MESSAGE: Final[str] = (
+                f"Unrecognized output format: {settings.OUTPUT_FORMAT}"
+            )
+            raise ValueError(UNKNOWN_OUTPUT_FORMAT_MESSAGE)
+
+
+def _write_print_job(output_directory: Path, print_job: PrintJob) -> None:
+    output_file_path: Path = output_directory / (
+        f"ipops-page-{print_job.starting_page_number:06d}"
+        f"{OUTPUT_FILE_SUFFIXES[print_job.output_format]}"
+    )
+    output_file_path.write_bytes(print_job.document_bytes)
+
+    logger.debug("Wrote print job to %s", output_file_path)
+
+
+def _submit_print_job(lp_executable: str, print_job: PrintJob) -> None:
+    # NOTE: PostScript is already in the printer's own language,
+    # so it skips the CUPS filters that would rasterise a PDF again
+    lp_arguments: Sequence[str] = (
+        ("-o", "raw") if print_job.output_format is OutputFormat.POSTSCRIPT else ()
+    )
+
+    # NOTE: 'lp' runs in its own process group, so that a Ctrl-C meant to stop the printer
+    # lets the queued print jobs drain instead of also killing the job being submitted
+    completed_print_subprocess_stdout: str = subprocess.run(
+        (lp_executable, *lp_arguments),
+        check=True,
+        input=print_job.document_bytes,
+        stdout=subprocess.PIPE,
+        text=False,
+        timeout=None,
+        process_group=0,
+    ).stdout.decode()
+
+    if completed_print_subprocess_stdout:
+        known_stdout_match: re.Match[str] | None = re.fullmatch(
+            r"\Arequest id is (?P<job_id>[\w-]+) \((?P<files_count>\d+) file\(s\)\)\n\Z",
+            completed_print_subprocess_stdout,
+        )
+        if known_stdout_match is not None:
+            logger.debug(
+                "Printed %s file(s) with job ID '%s'",
+                known_stdout_match.group("files_count"),
+                known_stdout_match.group("job_id"),
+            )
+        else:
+            logger.warning(
+                "Subprocess call to 'lp' had stdout: %s",
+                repr(completed_print_subprocess_stdout),
+            )
+
+
+def _print_document(lp_executable: str | None, print_job: PrintJob) -> None:
+    start_time: float = time.perf_counter()
+
+    if settings.OUTPUT_DIRECTORY is not None:
+        _write_print_job(settings.OUTPUT_DIRECTORY, print_job)
+    elif lp_executable is not None:
+        _submit_print_job(lp_executable, print_job)
+    else:
+        NO_PRINT_DESTINATION_MESSAGE: Final[str] = (
+            "Print jobs need either the 'lp' executable or an output directory."
+        )
+        raise ValueError(NO_PRINT_DESTINATION_MESSAGE)
+
+    metrics.LP_SECONDS.observe(time.perf_counter() - start_time)
+    metrics.PAGES_PRINTED.inc(print_job.pages_count)
+
+    logger.debug(
+        "Printing pages %d to %d completed successfully",
+        print_job.starting_page_number,
+        print_job.starting_page_number + print_job.pages_count - 1,
+    )
+
+    page_offset: int
+    page_fill_ratio: float
+    page_packing_efficiency: float
+    for page_offset, (page_fill_ratio, page_packing_efficiency) in enumerate(
+        zip(print_job.page_fill_ratios, print_job.page_packing_efficiencies, strict=True)
+    ):
+        logger.info(
+            "Printed page %d filled to %.1f%% of its capacity, "
+            "with %.1f%% of its symbol codewords carrying data",
+            print_job.starting_page_number + page_offset,
+            page_fill_ratio * 100,
+            page_packing_efficiency * 100,
+        )
+
+
+class PrintSpool:
+    """"""
+
+    def __init__(
+        self, lp_executable: str | None, starting_page_number: int, depth: int
+    ) -> None:
+        """"""
+        self.lp_executable: str | None = lp_executable
+        self.next_page_number: int = starting_page_number
+        self.printed_page_number: int = starting_page_number
+        self.error: Exception | None = None
+
+        # NOTE: Both queues are bounded, so a slow printer pushes back on encoding,
+        # and encoding pushes back on reading new frames
+        self._frame_queue: queue.Queue[bytes] = queue.Queue(maxsize=depth)
+        self._print_queue: queue.Queue[PrintJob | None] = queue.Queue(maxsize=depth)
+        self._stop_encoding: threading.Event = threading.Event()
+
+        # NOTE: Jobs that were encoded but never printed, because printing failed,
+        # are kept so their frames can be persisted instead of lost
+        self._failed_print_job: PrintJob | None = None
+        self._unqueued_print_job: PrintJob | None = None
+
+        self._encoder_thread: threading.Thread = threading.Thread(
+            target=self._run_stage, args=(self._encode_frames,), name="ipops-encoder"
+        )
+        self._printer_thread: threading.Thread = threading.Thread(
+            target=self._run_stage, args=(self._print_jobs,), name="ipops-printer"
+        )
+
+    @property
+    def is_failed(self) -> bool:
+        """"""
+        return self.error is not None
+
+    def _run_stage(self, stage: Callable[[], None]) -> None:
+        try:
+            stage()
+        except Exception as e:  # noqa: BLE001
+            self.error = e
+            self._stop_encoding.set()
+
+        finally:
+            if threading.current_thread() is self._encoder_thread:
+                self._put_print_job(None)
+
+    def _put_print_job(self, print_job: PrintJob | None) -> bool:
+        while True:
+            try:
+                self._print_queue.put(print_job, timeout=QUEUE_POLL_INTERVAL)
+            except queue.Full:
+                if self.is_failed and not self._printer_thread.is_alive():
+                    return False
+                continue
+
+            metrics.PRINT_QUEUE_DEPTH.set(self._print_queue.qsize())
+            return True
+
+    def _encode_frames(self) -> None:
+        while not self._stop_encoding.is_set():
+            try:
+                frame: bytes = self._frame_queue.get(timeout=QUEUE_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+            metrics.SPOOL_DEPTH.set(self._frame_queue.qsize())
+
+            start_time: float = time.perf_counter()
+            print_job: PrintJob = _render_frame(frame, self.next_page_number)
+            metrics.ENCODE_SECONDS.observe(time.perf_counter() - start_time)
+
+            page_fill_ratio: float
+            for page_fill_ratio in print_job.page_fill_ratios:
+                metrics.PAGE_FILL_RATIO.observe(page_fill_ratio)
+
+            page_packing_efficiency: float
+            for page_packing_efficiency in print_job.page_packing_efficiencies:
+                metrics.PAGE_PACKING_EFFICIENCY.observe(page_packing_efficiency)
+
+            logger.debug("Queueing %d page(s) for printing", print_job.pages_count)
+
+            self.next_page_number += print_job.pages_count
+            if not self._put_print_job(print_job):
+                self._unqueued_print_job = print_job
+                return
+
+    def _print_jobs(self) -> None:
+        while True:
+            print_job: PrintJob | None = self._print_queue.get()
+            metrics.PRINT_QUEUE_DEPTH.set(self._print_queue.qsize())
+            if print_job is None:
+                return
+
+            try:
+                _print_document(self.lp_executable, print_job)
+            except Exception:
+                self._failed_print_job = print_job
+                raise
+
+            self.printed_page_number = print_job.starting_page_number + print_job.pages_count
+
+    def start(self) -> None:
+        """"""
+        self._encoder_thread.start()
+        self._printer_thread.start()
+
+    def submit(self, frame: bytes, should_abort: Callable[[], bool]) -> bool:
+        """"""
+        if self._frame_queue.full():
+            logger.warning(
+                "Print spool is full (%d frames), waiting before reading more packets",
+                self._frame_queue.maxsize,
+            )
+
+        while not self.is_failed and not should_abort():
+            try:
+                self._frame_queue.put(frame, timeout=QUEUE_POLL_INTERVAL)
+            except queue.Full:
+                continue
+
+            metrics.FRAMES_SPOOLED.inc()
+            metrics.SPOOL_DEPTH.set(self._frame_queue.qsize())
+            return True
+
+        return False
+
+    def shutdown(self) -> Sequence[bytes]:
+        """"""
+        # NOTE: Frames that have not been encoded yet are handed back to be persisted,
+        # while frames that already have page numbers are still printed. If printing
+        # failed, the frames of every job left unprinted are handed back as well, in order,
+        # and are given new page numbers from printed_page_number at the next start
+        self._stop_encoding.set()
+        self._encoder_thread.join()
+        self._printer_thread.join()
+
+        unprinted_frames: list[bytes] = []
+        if self._failed_print_job is not None:
+            unprinted_frames.append(self._failed_print_job.frame)
+
+        while True:
+            try:
+                print_job: PrintJob | None = self._print_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if print_job is not None:
+                unprinted_frames.append(print_job.frame)
+
+        if self._unqueued_print_job is not None:
+            unprinted_frames.append(self._unqueued_print_job.frame)
+
+        while True:
+            try:
+                unprinted_frames.append(self._frame_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return unprinted_frames
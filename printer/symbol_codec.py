@@ -0,0 +1,74 @@
+""""""
+
+import base64
+from typing import TYPE_CHECKING
+
+from .config import SymbolCodec
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "DMTX_ENCODING_SCHEMES",
+    "cobs_encode",
+    "encode_symbol_data",
+    "get_symbol_codewords",
+)
+
+
+COBS_MAX_BLOCK_SIZE: Final[int] = 254
+BASE256_SHORT_LENGTH_LIMIT: Final[int] = 249
+
+DMTX_ENCODING_SCHEMES: Final[Mapping[SymbolCodec, str]] = {
+    SymbolCodec.BASE85: "Ascii",
+    SymbolCodec.BASE256: "Base256",
+}
+
+
+def cobs_encode(data: bytes) -> bytes:
+    """"""
+    encoded_data: bytearray = bytearray()
+
+    # NOTE: Each zero-delimited segment becomes a length code followed by its bytes,
+    # so the encoded data never contains a null byte
+    segment: bytes
+    for segment in data.split(b"\x00"):
+        full_blocks_size: int = len(segment) - len(segment) % COBS_MAX_BLOCK_SIZE
+
+        block_start: int
+        for block_start in range(0, full_blocks_size, COBS_MAX_BLOCK_SIZE):
+            encoded_data.append(COBS_MAX_BLOCK_SIZE + 1)
+            encoded_data += segment[block_start : block_start + COBS_MAX_BLOCK_SIZE]
+
+        encoded_data.append(len(segment) - full_blocks_size + 1)
+        encoded_data += segment[full_blocks_size:]
+
+    return bytes(encoded_data)
+
+
+def encode_symbol_data(
+    symbol_codec: SymbolCodec, data: bytes, raw_prefix: bytes = b""
+) -> bytes:
+    """"""
+    match symbol_codec:
+        case SymbolCodec.BASE85:
+            # NOTE: Version 1 headers keep their page byte outside of the base85 text
+            return raw_prefix + base64.b85encode(data)
+        case SymbolCodec.BASE256:
+            return cobs_encode(raw_prefix + data)
+
+
+def get_symbol_codewords(symbol_codec: SymbolCodec, data_size: int) -> int:
+    """"""
+    match symbol_codec:
+        case SymbolCodec.BASE85:
+            # NOTE: Every base85 character is one ASCII-mode codeword,
+            # but a raw page byte above 127 needs an upper shift codeword too
+            return 2 + 5 * -(-data_size // 4)
+
+        case SymbolCodec.BASE256:
+            # NOTE: COBS adds at most one code byte per 254 bytes,
+            # then Base256 mode adds a latch codeword and a one or two byte length field
+            encoded_size: int = data_size + data_size // COBS_MAX_BLOCK_SIZE + 1
+            return 1 + (1 if encoded_size <= BASE256_SHORT_LENGTH_LIMIT else 2) + encoded_size
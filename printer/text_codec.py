@@ -0,0 +1,91 @@
+""""""
+
+import base64
+import zlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "TEXT_ALPHABET",
+    "TEXT_LINE_OVERHEAD",
+    "encode_text_lines",
+    "get_text_lines_capacity",
+)
+
+
+# NOTE: Crockford's base32 alphabet leaves out I, L, O and U, so the letters that OCR
+# most often confuses with digits never appear in printed text
+TEXT_ALPHABET: Final[str] = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+BASE32_ALPHABET: Final[str] = "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+TEXT_ALPHABET_BITS: Final[int] = 5
+LINE_NUMBER_CHARACTERS: Final[int] = 2
+LINE_CHECKSUM_CHARACTERS: Final[int] = 4
+MAX_TEXT_LINES: Final[int] = len(TEXT_ALPHABET) ** LINE_NUMBER_CHARACTERS - 1
+
+# NOTE: Every line is its line number, the lines count, its data and a checksum,
+# with the data set apart by spaces
+TEXT_LINE_OVERHEAD: Final[int] = 2 * LINE_NUMBER_CHARACTERS + LINE_CHECKSUM_CHARACTERS + 2
+
+TEXT_ENCODE_TRANSLATION: Final[dict[int, int]] = str.maketrans(BASE32_ALPHABET, TEXT_ALPHABET)
+
+
+def _encode_number(number: int, characters_count: int) -> str:
+    return "".join(
+        TEXT_ALPHABET[(number >> (TEXT_ALPHABET_BITS * position)) % len(TEXT_ALPHABET)]
+        for position in reversed(range(characters_count))
+    )
+
+
+def _get_line_checksum(line_prefix: str, line_data: str) -> str:
+    return _encode_number(
+        zlib.crc32(f"{line_prefix}{line_data}".encode("ascii")),
+        LINE_CHECKSUM_CHARACTERS,
+    )
+
+
+def get_text_lines_capacity(lines_count: int, data_characters_per_line: int) -> int:
+    """"""
+    return lines_count * data_characters_per_line * TEXT_ALPHABET_BITS // 8
+
+
+def encode_text_lines(data: bytes, data_characters_per_line: int) -> Sequence[str]:
+    """"""
+    if data_characters_per_line < 1:
+        NO_DATA_CHARACTERS_MESSAGE: Final[str] = (
+            "Each text line needs room for at least one data character."
+        )
+        raise ValueError(NO_DATA_CHARACTERS_MESSAGE)
+
+    # NOTE: The base32 padding is dropped, as the decoder can work it out from the length
+    encoded_data: str = (
+        base64.b32encode(data).decode("ascii").rstrip("=").translate(TEXT_ENCODE_TRANSLATION)
+    )
+    lines_data: Sequence[str] = [
+        encoded_data[offset : offset + data_characters_per_line]
+        for offset in range(0, len(encoded_data), data_characters_per_line)
+    ] or [""]
+
+    if len(lines_data) > MAX_TEXT_LINES:
+        TOO_MANY_LINES_MESSAGE: Final[str] = (
+            f"{len(data)} bytes need {len(lines_data)} text lines, "
+            f"more than the {MAX_TEXT_LINES} that can be numbered."
+        )
+        raise ValueError(TOO_MANY_LINES_MESSAGE)
+
+    lines_count: str = _encode_number(len(lines_data), LINE_NUMBER_CHARACTERS)
+    text_lines: list[str] = []
+
+    line_number: int
+    line_data: str
+    for line_number, line_data in enumerate(lines_data):
+        line_prefix: str = (
+            f"{_encode_number(line_number, LINE_NUMBER_CHARACTERS)}{lines_count}"
+        )
+        text_lines.append(
+            f"{line_prefix} {line_data} {_get_line_checksum(line_prefix, line_data)}"
+        )
+
+    return text_lines
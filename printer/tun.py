@@ -0,0 +1,131 @@
+""""""
+
+import fcntl
+import os
+import selectors
+import socket
+import struct
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "MAX_PACKET_SIZE",
+    "TunPacketReader",
+    "open_mock_tun_device",
+    "open_tun_device",
+)
+
+
+TUN_CLONE_DEVICE_PATH: Final[str] = "/dev/net/tun"
+TUNSETIFF: Final[int] = 0x400454CA
+IFF_TUN: Final[int] = 0x0001
+IFF_MULTI_QUEUE: Final[int] = 0x0100
+IFF_NO_PI: Final[int] = 0x1000
+IFNAMSIZ: Final[int] = 16
+MAX_PACKET_SIZE: Final[int] = 0xFFFF
+
+
+def open_tun_device(name: str) -> int:
+    """"""
+    encoded_name: bytes = name.encode("ascii")
+    if not encoded_name or len(encoded_name) >= IFNAMSIZ:
+        INVALID_DEVICE_NAME_MESSAGE: Final[str] = (
+            f"TUN device names must be between 1 and {IFNAMSIZ - 1} characters long."
+        )
+        raise ValueError(INVALID_DEVICE_NAME_MESSAGE)
+
+    tun_fd: int = os.open(TUN_CLONE_DEVICE_PATH, os.O_RDWR | os.O_NONBLOCK | os.O_CLOEXEC)
+    try:
+        # NOTE: The device is attached as one of several queues, so that the scanner can
+        # attach its own queue to inject inbound packets while the printer reads this one
+        fcntl.ioctl(
+            tun_fd,
+            TUNSETIFF,
+            struct.pack(f"{IFNAMSIZ}sH", encoded_name, IFF_TUN | IFF_NO_PI | IFF_MULTI_QUEUE),
+        )
+    except OSError:
+        os.close(tun_fd)
+        raise
+
+    return tun_fd
+
+
+def open_mock_tun_device() -> tuple[int, int]:
+    """"""
+    # NOTE: Sequenced packet sockets keep message boundaries like a TUN device does,
+    # so the first descriptor stands in for the device and the second for the kernel
+    device_socket: socket.socket
+    kernel_socket: socket.socket
+    device_socket, kernel_socket = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    device_socket.setblocking(False)  # noqa: FBT003
+
+    return device_socket.detach(), kernel_socket.detach()
+
+
+class TunPacketReader:
+    """"""
+
+    def __init__(self, fd: int) -> None:
+        """"""
+        # NOTE: Every read from a TUN device returns exactly one whole packet,
+        # so there is no length prefix to parse and no partial packet to keep
+        self._fd: int = fd
+        self._buffer: bytearray = bytearray(MAX_PACKET_SIZE)
+        self._view: memoryview = memoryview(self._buffer)
+        self._packet: memoryview | None = None
+        self._is_packet_unread: bool = False
+
+        self._selector: selectors.BaseSelector = selectors.DefaultSelector()
+        self._selector.register(fd, selectors.EVENT_READ)
+
+    def _read_into_buffer(self) -> int | None:
+        try:
+            return os.readv(self._fd, (self._view,))
+        except BlockingIOError:
+            return None
+
+    def read_packet(self, timeout: float | None) -> memoryview | None:
+        """"""
+        if self._is_packet_unread:
+            self._is_packet_unread = False
+            return self._packet
+
+        deadline: float | None = None if timeout is None else time.monotonic() + timeout
+        self._packet = None
+
+        while True:
+            # NOTE: The previous packet is overwritten here, which is safe because
+            # the printer copies each packet into its frame before reading the next one
+            bytes_read: int | None = self._read_into_buffer()
+            if bytes_read == 0:
+                END_OF_STREAM_MESSAGE: str = "TUN device was closed."
+                raise EOFError(END_OF_STREAM_MESSAGE)
+
+            if bytes_read is not None:
+                self._packet = self._view[:bytes_read]
+                return self._packet
+
+            remaining_timeout: float | None = (
+                None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+            if not self._selector.select(remaining_timeout):
+                return None
+
+    def unread_packet(self) -> None:
+        """"""
+        if self._packet is None or self._is_packet_unread:
+            NO_PACKET_TO_UNREAD_MESSAGE: Final[str] = (
+                "Only the packet returned by the latest read can be unread."
+            )
+            raise RuntimeError(NO_PACKET_TO_UNREAD_MESSAGE)
+
+        self._is_packet_unread = True
+
+    def close(self) -> None:
+        """"""
+        self._selector.close()
+        os.close(self._fd)
@@ -9,7 +9,7 @@ import platformdirs
 from typed_classproperties import classproperty
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from logging import Logger
     from pathlib import Path
     from types import FrameType
@@ -18,7 +18,9 @@ if TYPE_CHECKING:
 __all__: Sequence[str] = (
     "GracefulTerminationHandler",
     "PerformGracefulTermination",
+    "load_spooled_frames",
     "load_starting_page_number",
+    "save_spooled_frames",
     "save_starting_page_number",
 )
 
@@ -30,6 +32,7 @@ APP_STATE_PATH: Final[Path] = platformdirs.user_state_path(
     "IPoPS-printer", roaming=False, ensure_exists=True
 )
 STARTING_PAGE_NUMBER_FILE_PATH: Final[Path] = APP_STATE_PATH / "starting_page_number"
+SPOOL_DIRECTORY_PATH: Final[Path] = APP_STATE_PATH / "spool"
 
 
 class PerformGracefulTermination(RuntimeError):  # noqa: N818
@@ -93,3 +96,41 @@ def save_starting_page_number(starting_page_number: int, /) -> None:
             length=(starting_page_number.bit_length() + 7) // 8, byteorder="big"
         )
     )
+
+
+def load_spooled_frames() -> Sequence[bytes]:
+    """"""
+    if not SPOOL_DIRECTORY_PATH.is_dir():
+        return []
+
+    spooled_frame_paths: Sequence[Path] = sorted(SPOOL_DIRECTORY_PATH.glob("*.frame"))
+    spooled_frames: Sequence[bytes] = [
+        spooled_frame_path.read_bytes() for spooled_frame_path in spooled_frame_paths
+    ]
+
+    spooled_frame_path: Path
+    for spooled_frame_path in spooled_frame_paths:
+        spooled_frame_path.unlink()
+
+    if spooled_frames:
+        logger.info(
+            "Loaded %d IPoPS frame(s) left unprinted at last exit", len(spooled_frames)
+        )
+
+    return spooled_frames
+
+
+def save_spooled_frames(frames: Iterable[bytes]) -> None:
+    """"""
+    SPOOL_DIRECTORY_PATH.mkdir(exist_ok=True)
+
+    frames_count: int = 0
+
+    frame_index: int
+    frame: bytes
+    for frame_index, frame in enumerate(frames):
+        (SPOOL_DIRECTORY_PATH / f"{frame_index:08d}.frame").write_bytes(frame)
+        frames_count += 1
+
+    if frames_count:
+        logger.info("Saved %d unprinted IPoPS frame(s) for the next start", frames_count)
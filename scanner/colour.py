@@ -0,0 +1,192 @@
+""""""
+
+import enum
+import itertools
+import statistics
+from enum import Enum
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+    from PIL import Image
+
+__all__: Sequence[str] = (
+    "ColourMode",
+    "InkCalibration",
+    "measure_calibration",
+    "separate_channels",
+)
+
+
+CALIBRATION_BAND_RATIO: Final[float] = 0.05
+CALIBRATION_BITMAP_WIDTH: Final[int] = 512
+MIN_INK_CONTRAST: Final[int] = 48
+MAX_PAPER_CHROMA: Final[int] = 32
+MIN_PAPER_LIGHTNESS: Final[int] = 128
+MIN_PATCH_PIXELS: Final[int] = 16
+MIN_DETERMINANT: Final[float] = 1e-6
+INK_NAMES: Final[Sequence[str]] = ("cyan", "magenta", "yellow")
+
+
+class ColourMode(Enum):
+    """"""
+
+    MONOCHROME = enum.auto()
+    CMY = enum.auto()
+
+
+class InkCalibration(NamedTuple):
+    """"""
+
+    paper: tuple[float, float, float]
+    inks: Sequence[tuple[float, float, float]]
+
+
+def _get_median_colour(pixels: Sequence[tuple[int, int, int]]) -> tuple[float, float, float]:
+    return (
+        statistics.median(pixel[0] for pixel in pixels),
+        statistics.median(pixel[1] for pixel in pixels),
+        statistics.median(pixel[2] for pixel in pixels),
+    )
+
+
+def _classify_pixel(pixel: tuple[int, int, int]) -> int | None:
+    lowest: int
+    middle: int
+    highest: int
+    lowest, middle, highest = sorted(pixel)
+
+    if highest - lowest <= MAX_PAPER_CHROMA:
+        return -1 if lowest >= MIN_PAPER_LIGHTNESS else None
+
+    # NOTE: A single ink darkens one channel far more than the other two, which stay closer
+    # together, while mixed inks and black text darken two or three channels alike
+    if middle - lowest >= MIN_INK_CONTRAST and highest - middle < middle - lowest:
+        return pixel.index(lowest)
+
+    return None
+
+
+def measure_calibration(image: Image.Image) -> InkCalibration:
+    """"""
+    rgb_image: Image.Image = image.convert("RGB")
+
+    # NOTE: The printer puts one patch of each ink in the footer, below every symbol,
+    # so the bottom of the sheet only holds paper, the patches and the black page number
+    band_height: int = max(round(rgb_image.height * CALIBRATION_BAND_RATIO), 1)
+    calibration_band: Image.Image = rgb_image.crop(
+        (0, rgb_image.height - band_height, rgb_image.width, rgb_image.height)
+    )
+    calibration_band = calibration_band.reduce(
+        max(calibration_band.width // CALIBRATION_BITMAP_WIDTH, 1)
+    )
+
+    paper_pixels: list[tuple[int, int, int]] = []
+    inks_pixels: Sequence[list[tuple[int, int, int]]] = [[] for _ in INK_NAMES]
+
+    pixel: tuple[int, int, int]
+    for pixel in itertools.batched(calibration_band.tobytes(), 3, strict=True):
+        pixel_class: int | None = _classify_pixel(pixel)
+        if pixel_class is None:
+            continue
+
+        if pixel_class < 0:
+            paper_pixels.append(pixel)
+        else:
+            inks_pixels[pixel_class].append(pixel)
+
+    missing_patches: Sequence[str] = [
+        patch_name
+        for patch_name, patch_pixels in zip(
+            (*INK_NAMES, "paper"), (*inks_pixels, paper_pixels), strict=True
+        )
+        if len(patch_pixels) < MIN_PATCH_PIXELS
+    ]
+    if missing_patches:
+        MISSING_PATCHES_MESSAGE: Final[str] = (
+            f"No {', '.join(missing_patches)} calibration patch was found in the footer"
+        )
+        raise ValueError(MISSING_PATCHES_MESSAGE)
+
+    # NOTE: Only the darker half of each ink's pixels is used, so that the blurred edges
+    # of its patch, where the ink fades into the paper, do not make it look lighter
+    return InkCalibration(
+        paper=_get_median_colour(paper_pixels),
+        inks=[
+            _get_median_colour(sorted(ink_pixels, key=min)[: len(ink_pixels) // 2])
+            for ink_pixels in inks_pixels
+        ],
+    )
+
+
+def _invert_matrix(matrix: Sequence[Sequence[float]]) -> Sequence[Sequence[float]]:
+    a: float
+    b: float
+    c: float
+    d: float
+    e: float
+    f: float
+    g: float
+    h: float
+    i: float
+    (a, b, c), (d, e, f), (g, h, i) = matrix
+    determinant: float = a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+    if abs(determinant) < MIN_DETERMINANT:
+        SINGULAR_CALIBRATION_MESSAGE: Final[str] = (
+            "The calibration patches are too alike to tell the inks apart"
+        )
+        raise ValueError(SINGULAR_CALIBRATION_MESSAGE)
+
+    return [
+        [
+            (e * i - f * h) / determinant,
+            (c * h - b * i) / determinant,
+            (b * f - c * e) / determinant,
+        ],
+        [
+            (f * g - d * i) / determinant,
+            (a * i - c * g) / determinant,
+            (c * d - a * f) / determinant,
+        ],
+        [
+            (d * h - e * g) / determinant,
+            (b * g - a * h) / determinant,
+            (a * e - b * d) / determinant,
+        ],
+    ]
+
+
+def separate_channels(
+    image: Image.Image, calibration: InkCalibration | None = None
+) -> Sequence[Image.Image]:
+    """"""
+    rgb_image: Image.Image = image.convert("RGB")
+    if calibration is None:
+        calibration = measure_calibration(rgb_image)
+
+    # NOTE: Each scanned colour is the paper colour darkened by some amount of every ink,
+    # so inverting the inks' measured darkening gives how much of each ink was printed,
+    # which is then turned back into one grayscale image per ink
+    ink_darkening: Sequence[Sequence[float]] = [
+        [calibration.paper[channel] - ink[channel] for ink in calibration.inks]
+        for channel in range(3)
+    ]
+    unmixing: Sequence[Sequence[float]] = _invert_matrix(ink_darkening)
+
+    conversion_matrix: list[float] = []
+
+    unmixing_row: Sequence[float]
+    for unmixing_row in unmixing:
+        conversion_matrix.extend(255 * weight for weight in unmixing_row)
+        conversion_matrix.append(
+            255
+            - 255
+            * sum(
+                weight * paper_value
+                for weight, paper_value in zip(unmixing_row, calibration.paper, strict=True)
+            )
+        )
+
+    return rgb_image.convert("RGB", matrix=tuple(conversion_matrix)).split()
@@ -0,0 +1,42 @@
+""""""
+
+import bz2
+import enum
+import lzma
+import zlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ("FrameCodec", "decompress_frame")
+
+
+class FrameCodec(enum.IntEnum):
+    """"""
+
+    NONE = 0
+    ZLIB = 1
+    LZMA = 2
+    BZ2 = 3
+
+
+def decompress_frame(frame_codec: FrameCodec, content: bytes) -> bytes:
+    """"""
+    # NOTE: Each codec reports corrupt data with its own exception type
+    try:
+        match frame_codec:
+            case FrameCodec.NONE:
+                return content
+            case FrameCodec.ZLIB:
+                return zlib.decompress(content)
+            case FrameCodec.LZMA:
+                return lzma.decompress(content, format=lzma.FORMAT_ALONE)
+            case FrameCodec.BZ2:
+                return bz2.decompress(content)
+    except (zlib.error, lzma.LZMAError, OSError, EOFError) as e:
+        CORRUPT_FRAME_MESSAGE: Final[str] = (
+            f"Frame could not be decompressed with {frame_codec.name}: {e}"
+        )
+        raise ValueError(CORRUPT_FRAME_MESSAGE) from e
@@ -2,28 +2,39 @@
 
 import enum
 import io
+import logging
+import os
 import shutil
 import subprocess
 import time
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 import click
 import platformdirs
 from PIL import Image
-from pylibdmtx import pylibdmtx
 
-from . import utils
+from . import colour, decoder, framing, ingest, metrics, ocr, tun, utils
+from .colour import ColourMode
+from .header import HeaderVersion
+from .symbol_codec import SymbolCodec
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
+    from logging import Logger
     from subprocess import CompletedProcess
     from typing import BinaryIO, Final, Literal
 
+    from .reorder import ReorderStatistics
+    from .utils import SymbolPayload
+
 __all__: Sequence[str] = ("PDFDataFormat", "run")
 
 
+logger: Final[Logger] = logging.getLogger("ipops-scanner")
+
+
 INTERMEDIARY_IMAGE_FORMAT: Final[Literal["png", "jpg", "tiff"]] = "tiff"
 APP_STATE_PATH: Final[Path] = platformdirs.user_state_path(
     "IPoPS-scanner", roaming=False, ensure_exists=True
@@ -37,78 +48,267 @@ class PDFDataFormat(Enum):
     DATA_MATRIX = enum.auto()
 
 
-def _scan_and_send(
-    ctx: click.Context,
-    scanimage_executable: str,
-    start_page: int,
-    virtual_pipe_file: BinaryIO,
-    local_input_file: BinaryIO | None,
-    pdf_data_format: PDFDataFormat,
-) -> None:
-    if local_input_file is None:
-        click.echo("[*] Scanning...")
-
-        completed_scanimage_subprocess: CompletedProcess[bytes] = subprocess.run(
-            (scanimage_executable, "--format", INTERMEDIARY_IMAGE_FORMAT),
-            check=False,
-            capture_output=True,
-            text=False,
-            timeout=None,
-        )
-        if completed_scanimage_subprocess.returncode != 0:
-            click.echo(
-                (
-                    f"Subrocess call to 'scanimage' failed with exit code {
-                        completed_scanimage_subprocess.returncode
-                    }\nstderr: {completed_scanimage_subprocess.stderr.decode()!r}"
-                ),
-                err=True,
+def _format_reorder_statistics(reorder_statistics: ReorderStatistics) -> str:
+    formatted_reorder_statistics: str = (
+        f"[!] Reorder buffer: next page {reorder_statistics.watermark}, "
+        f"{reorder_statistics.pending_count} pending, "
+        f"{reorder_statistics.missing_count} missing"
+    )
+    if not reorder_statistics.gaps:
+        return formatted_reorder_statistics
+
+    formatted_gaps: str = ", ".join(
+        str(gap.start) if len(gap) == 1 else f"{gap.start}-{gap.stop - 1}"
+        for gap in reorder_statistics.gaps
+    )
+    return f"{formatted_reorder_statistics} (gaps: {formatted_gaps})"
+
+
+def _parse_symbol_payloads(
+    raw_symbols_data: Sequence[bytes],
+    symbol_codec: SymbolCodec,
+    header_version: HeaderVersion,
+    stream_id: int,
+) -> Sequence[SymbolPayload]:
+    symbol_payloads: list[SymbolPayload] = []
+
+    raw_data: bytes
+    for raw_data in raw_symbols_data:
+        try:
+            symbol_payload: SymbolPayload = utils.parse_symbol_payload(
+                raw_data, symbol_codec, header_version
             )
-            ctx.exit(3)
+        except ValueError as e:
+            click.echo(f"[!] Dropped unreadable symbol: {e}")
+            metrics.DROPPED_SYMBOLS.inc()
+            continue
+
+        if symbol_payload.stream_id != stream_id:
+            click.echo(f"[!] Dropped symbol from stream {symbol_payload.stream_id}")
+            metrics.DROPPED_SYMBOLS.inc()
+            continue
 
-        Path(f"tempscan.{int(time.time())}.{INTERMEDIARY_IMAGE_FORMAT}").write_bytes(
-            completed_scanimage_subprocess.stdout
+        symbol_payloads.append(symbol_payload)
+
+    return symbol_payloads
+
+
+class _DecodeOptions(NamedTuple):
+    pdf_data_format: PDFDataFormat
+    colour_mode: ColourMode
+    symbol_codec: SymbolCodec
+    header_version: HeaderVersion
+    stream_id: int
+    decode_workers: int | None
+
+
+def _scan_sheet(ctx: click.Context, scanimage_executable: str) -> Sequence[Image.Image]:
+    click.echo("[*] Scanning...")
+
+    completed_scanimage_subprocess: CompletedProcess[bytes] = subprocess.run(
+        (scanimage_executable, "--format", INTERMEDIARY_IMAGE_FORMAT),
+        check=False,
+        capture_output=True,
+        text=False,
+        timeout=None,
+    )
+    if completed_scanimage_subprocess.returncode != 0:
+        click.echo(
+            (
+                f"Subrocess call to 'scanimage' failed with exit code {
+                    completed_scanimage_subprocess.returncode
+                }\nstderr: {completed_scanimage_subprocess.stderr.decode()!r}"
+            ),
+            err=True,
         )
+        ctx.exit(3)
+
+    Path(f"tempscan.{int(time.time())}.{INTERMEDIARY_IMAGE_FORMAT}").write_bytes(
+        completed_scanimage_subprocess.stdout
+    )
 
-        scanned_image: Image.Image = Image.open(
+    return [
+        Image.open(
             io.BytesIO(completed_scanimage_subprocess.stdout),
             formats=(INTERMEDIARY_IMAGE_FORMAT,),
         )
+    ]
+
 
-    else:
-        raise NotImplementedError
+def _assemble_pages(symbol_payloads: Sequence[SymbolPayload]) -> Mapping[int, bytes]:
+    pages_symbol_payloads: dict[int, list[SymbolPayload]] = {}
 
-    scanned_image: Image.Image = Image.open(image_buffer, formats=(INTERMEDIARY_IMAGE_FORMAT,))
+    symbol_payload: SymbolPayload
+    for symbol_payload in symbol_payloads:
+        pages_symbol_payloads.setdefault(symbol_payload.page_number, []).append(symbol_payload)
 
-    click.echo("[*] Parsing...")
+    pages: dict[int, bytes] = {}
 
+    # NOTE: An incomplete page is skipped on its own, so one damaged sheet in a batch
+    # does not hold back every other sheet
     page_number: int
-    payload: bytes
+    page_symbol_payloads: Sequence[SymbolPayload]
+    for page_number, page_symbol_payloads in sorted(pages_symbol_payloads.items()):
+        try:
+            pages.update(utils.assemble_pages(page_symbol_payloads))
+        except ValueError as e:
+            click.echo(f"[!] Skipped page {page_number}: {e}")
+            metrics.INCOMPLETE_PAGES.inc()
+
+    return pages
+
+
+def _decode_sheet(
+    scanned_sheet: Image.Image, decode_options: _DecodeOptions
+) -> Sequence[bytes]:
+    match decode_options.pdf_data_format:
+        case PDFDataFormat.DATA_MATRIX if decode_options.colour_mode is ColourMode.CMY:
+            channel_images: Sequence[Image.Image]
+            try:
+                channel_images = colour.separate_channels(scanned_sheet)
+            except ValueError as e:
+                click.echo(f"[!] {e}, reading the scanned colour channels as they are")
+                channel_images = scanned_sheet.convert("RGB").split()
+
+            return [
+                raw_data
+                for channel_image in channel_images
+                for raw_data in decoder.decode_page(
+                    channel_image, decode_options.decode_workers
+                )
+            ]
 
-    match pdf_data_format:
         case PDFDataFormat.DATA_MATRIX:
-            result: Sequence[pylibdmtx.Decoded] = pylibdmtx.decode(scanned_image)
-            click.echo(f"[!] {result}")
-            if len(result) != 1:
-                click.echo("Decoding data matrices resulted in multiple outputs.", err=True)
-                ctx.exit(3)
+            return decoder.decode_page(scanned_sheet, decode_options.decode_workers)
 
-            if not result[0].data:
-                click.echo("Decoding data matrices resulted in no data.", err=True)
-                ctx.exit(3)
+        case PDFDataFormat.TEXT:
+            try:
+                return [ocr.decode_text_page(scanned_sheet, decode_options.decode_workers)]
+            except ValueError as e:
+                click.echo(f"[!] Dropped unreadable text: {e}")
+                metrics.DROPPED_SYMBOLS.inc()
+                return []
+
+
+def _decode_sheets(
+    scanned_sheets: Sequence[Image.Image], decode_options: _DecodeOptions
+) -> Mapping[int, bytes]:
+    click.echo(f"[*] Parsing {len(scanned_sheets)} sheets...")
+
+    start_time: float = time.perf_counter()
+    symbol_payloads: list[SymbolPayload] = []
+
+    sheet_index: int
+    scanned_sheet: Image.Image
+    for sheet_index, scanned_sheet in enumerate(scanned_sheets):
+        sheet_start_time: float = time.perf_counter()
+        metrics.SHEETS_SCANNED.inc()
+
+        result: Sequence[bytes] = _decode_sheet(scanned_sheet, decode_options)
+        if not result:
+            click.echo(
+                f"Decoding {decode_options.pdf_data_format.name.lower().replace('_', ' ')} "
+                f"on sheet {sheet_index + 1} resulted in no outputs.",
+                err=True,
+            )
+            metrics.EMPTY_SHEETS.inc()
+            metrics.DECODE_SECONDS.observe(time.perf_counter() - sheet_start_time)
+            continue
+
+        symbol_payloads.extend(
+            _parse_symbol_payloads(
+                result,
+                decode_options.symbol_codec,
+                decode_options.header_version,
+                decode_options.stream_id,
+            )
+        )
+        metrics.DECODE_SECONDS.observe(time.perf_counter() - sheet_start_time)
 
-            page_number = int(result[0].data[0])
-            payload = result[0].data[1:]
+    click.echo(
+        f"[!] Decoded {len(symbol_payloads)} symbols from "
+        f"{len(scanned_sheets)} sheets in {time.perf_counter() - start_time:.2f}s"
+    )
 
-        case PDFDataFormat.TEXT:
-            raise NotImplementedError
+    return _assemble_pages(symbol_payloads)
 
-    utils.save_data_for_page(page_number, payload)
 
-    click.echo(f"[*] Got page {page_number}")
+def _ingest_sheets(
+    scanned_sheets: Sequence[Image.Image],
+    start_page: int,
+    virtual_pipe_file: BinaryIO,
+    tun_fd: int | None,
+    decode_options: _DecodeOptions,
+) -> None:
+    page_number: int
+    payload: bytes
+    for page_number, payload in _decode_sheets(scanned_sheets, decode_options).items():
+        utils.save_data_for_page(page_number, payload)
+        metrics.PAGES_SCANNED.inc()
+
+        click.echo(f"[*] Got page {page_number}")
+
+    recovered_page_number: int
+    for recovered_page_number in utils.recover_missing_pages(start_page):
+        click.echo(f"[*] Rebuilt page {recovered_page_number} from parity pages")
+        metrics.PAGES_RECOVERED.inc()
+
+    contiguous_block: bytes | None = utils.send_lowest_contiguous_block(start_page)
+    if contiguous_block is not None:
+        packets: Sequence[bytes]
+        unframed_data: bytes
+        packets, unframed_data = framing.split_packets(contiguous_block)
+        if unframed_data:
+            click.echo(f"[!] Dropped {len(unframed_data)} bytes that are not whole IP packets")
+
+        if tun_fd is None:
+            # NOTE: Every packet is length-prefixed, so the driver can tell where each one
+            # ends, and they are all written at once so it can inject them as a single batch
+            virtual_pipe_file.write(framing.frame_packets(packets))
+            virtual_pipe_file.flush()
+            delivered_packets_count: int = len(packets)
+        else:
+            delivered_packets_count = tun.inject_packets(tun_fd, packets)
+            if delivered_packets_count < len(packets):
+                click.echo(
+                    f"[!] The TUN device rejected {len(packets) - delivered_packets_count} "
+                    "packets"
+                )
+
+        metrics.PACKETS_DELIVERED.inc(delivered_packets_count)
+        metrics.BYTES_DELIVERED.inc(len(contiguous_block) - len(unframed_data))
+
+    click.echo("[!] Page state: ", nl=False)
+
+    for i, state in utils.get_page_states(start_page).items():
+        click.echo(f"{click.style(str(i), fg=state.value)} ", nl=False)
+
+    click.echo("", nl=True)
+
+    reorder_statistics: ReorderStatistics = utils.get_reorder_buffer(
+        start_page
+    ).get_statistics()
+    metrics.REORDER_PENDING_PAGES.set(reorder_statistics.pending_count)
+    metrics.REORDER_MISSING_PAGES.set(reorder_statistics.missing_count)
+    metrics.REORDER_GAPS.set(len(reorder_statistics.gaps))
+
+    click.echo(_format_reorder_statistics(reorder_statistics))
+
+
+def _get_scanimage_executable(ctx: click.Context) -> str:
+    scanimage_executable: str | None = shutil.which("scanimage")
+    if scanimage_executable is None:
+        click.echo(
+            (
+                "The 'scanimage' executable could not be found.\n"
+                "Ensure SANE-utils is installed on your Linux system "
+                "and that the 'scanimage' binary is available on your PATH."
+            ),
+            err=True,
+        )
+        ctx.exit(2)
 
-    if utils.send_lowest_contiguous_block(start_page) is not None:
-        virtual_pipe_file.write(payload)
+    return scanimage_executable
 
 
 @click.command(
@@ -118,30 +318,124 @@ def _scan_and_send(
 )
 @click.argument("start-page-number", type=int)
 @click.option("-p", "--virtual-pipe-file", type=click.File("wb"), default="/var/run/printun")
-@click.option("-f", "--local-input-file", type=click.File("rb"))
 @click.option(
-    "-d", "--pdf-data-format", type=click.Choice(PDFDataFormat, case_sensitive=False)
+    "-t",
+    "--tun-device",
+    help="Inject packets straight into this multi-queue TUN device "
+    "instead of writing them to the virtual pipe file.",
+)
+@click.option(
+    "-f",
+    "--local-input-file",
+    type=click.File("rb"),
+    multiple=True,
+    help="Read scanned sheets from an image, multi-page TIFF or PDF file instead. "
+    "May be given more than once.",
+)
+@click.option(
+    "-b",
+    "--batch",
+    is_flag=True,
+    help="Scan every sheet in the document feeder on each prompt.",
+)
+@click.option(
+    "--watch-directory",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Ingest every scan file that appears in this directory, until interrupted.",
+)
+@click.option(
+    "--watch-interval",
+    type=click.FloatRange(min=0.01),
+    default=1.0,
+    show_default=True,
+    help="Seconds between checks of the watched directory.",
+)
+@click.option(
+    "-d",
+    "--pdf-data-format",
+    type=click.Choice(PDFDataFormat, case_sensitive=False),
+    default=PDFDataFormat.DATA_MATRIX,
+)
+@click.option(
+    "--colour-mode",
+    type=click.Choice(ColourMode, case_sensitive=False),
+    default=ColourMode.MONOCHROME,
+    help="How symbols were printed. Must match IPOPS_PRINTER_COLOUR_MODE.",
+)
+@click.option(
+    "-c",
+    "--symbol-codec",
+    type=click.Choice(SymbolCodec, case_sensitive=False),
+    default=SymbolCodec.BASE256,
+    help="How data was packed into each symbol. Must match IPOPS_PRINTER_SYMBOL_CODEC.",
+)
+@click.option(
+    "--header-version",
+    type=click.Choice(HeaderVersion, case_sensitive=False),
+    default=HeaderVersion.AUTO,
+    help="Symbol header version to expect. AUTO accepts both, preferring V2.",
+)
+@click.option(
+    "-s",
+    "--stream-id",
+    type=click.IntRange(min=0, max=0xFFFFFFFF),
+    default=0,
+    help="Only accept symbols from this stream. Must match IPOPS_PRINTER_STREAM_ID.",
+)
+@click.option(
+    "-w",
+    "--decode-workers",
+    type=click.IntRange(min=1),
+    help="Number of processes used to decode symbols. [default: number of CPUs]",
+)
+@click.option(
+    "--reset-state",
+    is_flag=True,
+    help="Discard every previously scanned page before starting.",
+)
+@click.option(
+    "--metrics-port",
+    type=click.IntRange(min=1, max=65535),
+    help="Serve Prometheus metrics on this local port.",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    help="Write Prometheus metrics to this file, for a textfile collector.",
 )
 @click.pass_context
-def run(
+def run(  # noqa: PLR0913, PLR0915, PLR0917
     ctx: click.Context,
     start_page_number: int,
     virtual_pipe_file: BinaryIO,
-    local_input_file: BinaryIO | None,
+    tun_device: str | None,
+    local_input_file: Sequence[BinaryIO],
+    watch_directory: Path | None,
+    watch_interval: float,
     pdf_data_format: PDFDataFormat,
+    colour_mode: ColourMode,
+    symbol_codec: SymbolCodec,
+    header_version: HeaderVersion,
+    stream_id: int,
+    decode_workers: int | None,
+    metrics_port: int | None,
+    metrics_file: Path | None,
+    *,
+    batch: bool,
+    reset_state: bool,
 ) -> None:
     """Run cli entry-point."""
-    scanimage_executable: str | None = shutil.which("scanimage")
-    if scanimage_executable is None:
-        click.echo(
-            (
-                "The 'scanimage' executable could not be found.\n"
-                "Ensure SANE-utils is installed on your Linux system "
-                "and that the 'scanimage' binary is available on your PATH."
-            ),
-            err=True,
+    if sum((bool(local_input_file), watch_directory is not None, batch)) > 1:
+        CONFLICTING_INPUTS_MESSAGE: Final[str] = (
+            "Only one of --local-input-file, --watch-directory or --batch can be used."
         )
-        ctx.exit(2)
+        raise click.UsageError(CONFLICTING_INPUTS_MESSAGE, ctx=ctx)
+
+    if colour_mode is ColourMode.CMY and pdf_data_format is not PDFDataFormat.DATA_MATRIX:
+        UNSUPPORTED_COLOUR_MODE_MESSAGE: Final[str] = (
+            "--colour-mode CMY can only be used with --pdf-data-format DATA_MATRIX."
+        )
+        raise click.UsageError(UNSUPPORTED_COLOUR_MODE_MESSAGE, ctx=ctx)
 
     if pdf_data_format is PDFDataFormat.TEXT and shutil.which("tesseract") is None:
         click.echo(
@@ -154,15 +448,115 @@ def run(
         )
         ctx.exit(2)
 
-    while True:
-        _scan_and_send(
-            ctx, scanimage_executable, start_page_number, virtual_pipe_file, pdf_data_format
-        )
-        click.echo("[!] Page state: ", nl=False)
+    if reset_state:
+        utils.get_page_store().reset()
+
+    decode_options: _DecodeOptions = _DecodeOptions(
+        pdf_data_format=pdf_data_format,
+        colour_mode=colour_mode,
+        symbol_codec=symbol_codec,
+        header_version=header_version,
+        stream_id=stream_id,
+        decode_workers=decode_workers,
+    )
+
+    tun_fd: int | None = None
+    if tun_device is not None:
+        try:
+            tun_fd = tun.open_tun_device(tun_device)
+        except (OSError, ValueError) as e:
+            click.echo(f"Could not open the TUN device {tun_device!r}: {e}", err=True)
+            ctx.exit(2)
+
+    metrics_exporter: metrics.MetricsExporter = metrics.MetricsExporter(
+        metrics.REGISTRY, metrics_port, metrics_file, logger
+    )
+    try:
+        metrics_exporter.start()
+    except OSError as e:
+        click.echo(f"Could not start the metrics exporter: {e}", err=True)
+        ctx.exit(2)
+
+    try:
+        if local_input_file:
+            scanned_sheets: list[Image.Image] = []
+
+            scan_start_time: float = time.perf_counter()
+
+            scan_file: BinaryIO
+            for scan_file in local_input_file:
+                try:
+                    scanned_sheets.extend(ingest.load_scan_file(scan_file, colour_mode))
+                except (OSError, ingest.ScanError) as e:
+                    click.echo(f"Reading {scan_file.name!r} failed: {e}", err=True)
+                    ctx.exit(3)
+
+            metrics.SCAN_SECONDS.observe(time.perf_counter() - scan_start_time)
+
+            _ingest_sheets(
+                scanned_sheets, start_page_number, virtual_pipe_file, tun_fd, decode_options
+            )
+            return
+
+        if watch_directory is not None:
+            click.echo(f"[*] Watching {watch_directory} for scans...")
+
+            scan_path: Path
+            for scan_path in ingest.watch_scan_directory(watch_directory, watch_interval):
+                click.echo(f"[*] Found {scan_path.name}")
+
+                scan_start_time = time.perf_counter()
+                try:
+                    with scan_path.open("rb") as scan_file:
+                        watched_sheets: Sequence[Image.Image] = ingest.load_scan_file(
+                            scan_file, colour_mode
+                        )
+                except (OSError, ingest.ScanError) as e:
+                    click.echo(f"Reading {scan_path.name!r} failed: {e}", err=True)
+                    continue
+
+                metrics.SCAN_SECONDS.observe(time.perf_counter() - scan_start_time)
+
+                _ingest_sheets(
+                    watched_sheets,
+                    start_page_number,
+                    virtual_pipe_file,
+                    tun_fd,
+                    decode_options,
+                )
+
+            return
+
+        scanimage_executable: str = _get_scanimage_executable(ctx)
+
+        while True:
+            scan_start_time = time.perf_counter()
+
+            if batch:
+                click.echo("[*] Scanning every sheet in the document feeder...")
+                try:
+                    batch_sheets: Sequence[Image.Image] = ingest.scan_adf_batch(
+                        scanimage_executable, INTERMEDIARY_IMAGE_FORMAT, colour_mode
+                    )
+                except ingest.ScanError as e:
+                    click.echo(str(e), err=True)
+                    ctx.exit(3)
+
+            else:
+                batch_sheets = _scan_sheet(ctx, scanimage_executable)
+
+            metrics.SCAN_SECONDS.observe(time.perf_counter() - scan_start_time)
+
+            _ingest_sheets(
+                batch_sheets, start_page_number, virtual_pipe_file, tun_fd, decode_options
+            )
 
-        for i, state in utils.get_page_states(start_page_number).items():
-            click.echo(f"{click.style(str(i), fg=state.value)} ", nl=False)
+            click.confirm("[?] Send another? [y/N]", abort=True, default=False)
 
-        click.echo("", nl=True)
+    finally:
+        decoder.shutdown_decoder_pools()
+        ocr.shutdown_ocr_pools()
+        metrics_exporter.stop()
 
-        click.confirm("[?] Send another? [y/N]", abort=True, default=False)
+        if tun_fd is not None:
+            os.close(tun_fd)
@@ -0,0 +1,661 @@
+""""""
+
+import math
+import os
+import re
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple
+
+from PIL import Image, ImageChops, ImageFilter, ImageOps
+from pylibdmtx import pylibdmtx
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "PreparedSymbol",
+    "SymbolRegion",
+    "decode_page",
+    "locate_symbol_regions",
+    "prepare_symbol_image",
+    "shutdown_decoder_pools",
+)
+
+
+LOCATOR_BITMAP_WIDTH: Final[int] = 256
+MAX_LOCATOR_BITMAP_WIDTH: Final[int] = 1024
+MODULE_SAMPLE_ROWS_COUNT: Final[int] = 64
+SYMBOL_GAP_MODULES: Final[int] = 4
+LOCATOR_GAP_PIXELS: Final[int] = 4
+LOCATOR_DARK_THRESHOLD: Final[int] = 160
+SYMBOL_DARK_THRESHOLD: Final[int] = 128
+MIN_REGION_SIZE: Final[int] = 4
+REGION_PADDING: Final[int] = 1
+FINDER_EDGE_DEPTH: Final[int] = 3
+FINDER_SOLID_EDGE_RATIO: Final[float] = 0.85
+ADAPTIVE_WINDOW_DIVISOR: Final[int] = 8
+ADAPTIVE_DARK_OFFSET: Final[int] = 16
+SKEW_SAMPLES_COUNT: Final[int] = 64
+MIN_SKEW_SAMPLES_COUNT: Final[int] = 8
+SKEW_SAMPLE_MARGIN_DIVISOR: Final[int] = 8
+MIN_DESKEW_DEGREES: Final[float] = 0.2
+TARGET_MODULE_PIXELS: Final[int] = 4
+QUIET_ZONE_MODULES: Final[int] = 2
+MODULES_COUNT_TOLERANCE: Final[float] = 0.1
+SYMBOL_EDGE_TOLERANCE: Final[float] = 0.2
+SYMBOL_DECODE_TIMEOUT: Final[int] = 1000
+DMTX_SQUARE_AUTO_SHAPE: Final[int] = -2
+DARK_PIXEL_RUN_PATTERN: Final[re.Pattern[bytes]] = re.compile(rb"\x00+")
+
+# NOTE: Modules per side of every square ECC200 symbol size, in libdmtx's DmtxSymbolSize order
+DATA_MATRIX_SQUARE_SYMBOL_MODULES: Final[Sequence[int]] = (
+    10,
+    12,
+    14,
+    16,
+    18,
+    20,
+    22,
+    24,
+    26,
+    32,
+    36,
+    40,
+    44,
+    48,
+    52,
+    64,
+    72,
+    80,
+    88,
+    96,
+    104,
+    120,
+    132,
+    144,
+)
+
+
+_decoder_pools: Final[dict[int, ProcessPoolExecutor]] = {}
+
+
+class SymbolRegion(NamedTuple):
+    """"""
+
+    left: int
+    top: int
+    right: int
+    bottom: int
+
+
+class _LocatedRegions(NamedTuple):
+    symbol_regions: Sequence[SymbolRegion]
+    unconfirmed_regions: Sequence[SymbolRegion]
+
+
+class PreparedSymbol(NamedTuple):
+    """"""
+
+    image: Image.Image
+    modules: int | None
+
+
+def _find_dark_components(mask: bytes, width: int, height: int) -> Sequence[SymbolRegion]:
+    visited: bytearray = bytearray(len(mask))
+    components: list[SymbolRegion] = []
+
+    start_index: int
+    for start_index in range(len(mask)):
+        if not mask[start_index] or visited[start_index]:
+            continue
+
+        visited[start_index] = 1
+        left: int = width
+        top: int = height
+        right: int = 0
+        bottom: int = 0
+
+        queue: deque[int] = deque((start_index,))
+        while queue:
+            index: int = queue.popleft()
+            y: int
+            x: int
+            y, x = divmod(index, width)
+            left, top, right, bottom = min(left, x), min(top, y), max(right, x), max(bottom, y)
+
+            neighbour: int
+            for neighbour in (
+                index - 1 if x > 0 else -1,
+                index + 1 if x < width - 1 else -1,
+                index - width,
+                index + width,
+            ):
+                if 0 <= neighbour < len(mask) and mask[neighbour] and not visited[neighbour]:
+                    visited[neighbour] = 1
+                    queue.append(neighbour)
+
+        if min(right - left, bottom - top) + 1 >= MIN_REGION_SIZE:
+            components.append(SymbolRegion(left, top, right + 1, bottom + 1))
+
+    return components
+
+
+def _get_edge(bounding_box: SymbolRegion, side: int, depth: int) -> SymbolRegion:
+    left: int
+    top: int
+    right: int
+    bottom: int
+    left, top, right, bottom = bounding_box
+
+    match side:
+        case 0:
+            return SymbolRegion(left, top + depth, right, top + depth + 1)
+        case 1:
+            return SymbolRegion(right - depth - 1, top, right - depth, bottom)
+        case 2:
+            return SymbolRegion(left, bottom - depth - 1, right, bottom - depth)
+        case _:
+            return SymbolRegion(left + depth, top, left + depth + 1, bottom)
+
+
+def _is_solid_edge(symbol_mask: Image.Image, bounding_box: SymbolRegion, side: int) -> bool:
+    depth: int
+    for depth in range(FINDER_EDGE_DEPTH):
+        edge_histogram: Sequence[int] = symbol_mask.crop(
+            _get_edge(bounding_box, side, depth)
+        ).histogram()
+        if edge_histogram[255] >= FINDER_SOLID_EDGE_RATIO * max(sum(edge_histogram), 1):
+            return True
+
+    return False
+
+
+def _get_solid_edges(symbol_mask: Image.Image, bounding_box: SymbolRegion) -> Sequence[bool]:
+    return [_is_solid_edge(symbol_mask, bounding_box, side) for side in range(4)]
+
+
+def _is_finder_pattern(solid_edges: Sequence[bool]) -> bool:
+    return sum(solid_edges) == 2 and any(
+        solid_edges[side] and solid_edges[(side + 1) % 4] for side in range(4)
+    )
+
+
+def _has_finder_pattern(grayscale_region: Image.Image) -> bool:
+    # NOTE: A data matrix symbol is bordered by two adjacent solid edges (the finder pattern)
+    # and two alternating edges (the timing pattern), in whichever orientation it was scanned
+    symbol_mask: Image.Image = grayscale_region.point(
+        lambda value: 255 if value < SYMBOL_DARK_THRESHOLD else 0
+    )
+    raw_bounding_box: tuple[int, int, int, int] | None = symbol_mask.getbbox()
+    if raw_bounding_box is None:
+        return False
+
+    return _is_finder_pattern(_get_solid_edges(symbol_mask, SymbolRegion(*raw_bounding_box)))
+
+
+def _get_dark_runs(line: Sequence[int]) -> Sequence[tuple[int, int]]:
+    dark_runs: list[tuple[int, int]] = []
+    run_start: int | None = None
+
+    index: int
+    is_dark: int
+    for index, is_dark in enumerate((*line, 0)):
+        if is_dark and run_start is None:
+            run_start = index
+        elif not is_dark and run_start is not None:
+            dark_runs.append((run_start, index))
+            run_start = None
+
+    return dark_runs
+
+
+def _split_component(
+    mask: bytes, width: int, component: SymbolRegion
+) -> Sequence[SymbolRegion]:
+    # NOTE: A component that still spans several symbols of the grid is cut along the
+    # blank rows and columns that run right across it, until no more cuts can be made
+    rows: Sequence[bytes] = [
+        mask[row * width + component.left : row * width + component.right]
+        for row in range(component.top, component.bottom)
+    ]
+    column_runs: Sequence[tuple[int, int]] = _get_dark_runs(
+        [any(column) for column in zip(*rows, strict=True)]
+    )
+    row_runs: Sequence[tuple[int, int]] = _get_dark_runs([any(row) for row in rows])
+
+    if len(column_runs) == 1 and len(row_runs) == 1:
+        column_start: int
+        column_end: int
+        row_start: int
+        row_end: int
+        (column_start, column_end), (row_start, row_end) = column_runs[0], row_runs[0]
+        return [
+            SymbolRegion(
+                component.left + column_start,
+                component.top + row_start,
+                component.left + column_end,
+                component.top + row_end,
+            )
+        ]
+
+    return [
+        piece
+        for column_start, column_end in column_runs
+        for row_start, row_end in row_runs
+        for piece in _split_component(
+            mask,
+            width,
+            SymbolRegion(
+                component.left + column_start,
+                component.top + row_start,
+                component.left + column_end,
+                component.top + row_end,
+            ),
+        )
+        if min(piece.right - piece.left, piece.bottom - piece.top) >= MIN_REGION_SIZE
+    ]
+
+
+def _scale_region(region: SymbolRegion, scale: int, image: Image.Image) -> SymbolRegion:
+    return SymbolRegion(
+        left=max((region.left - REGION_PADDING) * scale, 0),
+        top=max((region.top - REGION_PADDING) * scale, 0),
+        right=min((region.right + REGION_PADDING) * scale, image.width),
+        bottom=min((region.bottom + REGION_PADDING) * scale, image.height),
+    )
+
+
+def _estimate_module_pixels(grayscale_image: Image.Image) -> int | None:
+    # NOTE: Most runs of dark pixels across a row of symbols are a single module long,
+    # as in the timing edges and in random data, so the commonest run length is one module
+    sample_mask: Image.Image = grayscale_image.point(
+        lambda value: 0 if value < SYMBOL_DARK_THRESHOLD else 255
+    )
+    run_lengths: Counter[int] = Counter()
+
+    row: int
+    for row in range(
+        0, sample_mask.height, max(sample_mask.height // MODULE_SAMPLE_ROWS_COUNT, 1)
+    ):
+        run_lengths.update(
+            len(run_match.group())
+            for run_match in DARK_PIXEL_RUN_PATTERN.finditer(
+                sample_mask.crop((0, row, sample_mask.width, row + 1)).tobytes()
+            )
+        )
+
+    if not run_lengths:
+        return None
+
+    return run_lengths.most_common(1)[0][0]
+
+
+def _get_locator_scale(grayscale_image: Image.Image) -> int:
+    min_scale: int = max(grayscale_image.width // MAX_LOCATOR_BITMAP_WIDTH, 1)
+    max_scale: int = max(grayscale_image.width // LOCATOR_BITMAP_WIDTH, min_scale)
+
+    # NOTE: Neighbouring symbols are only the printer's quiet zone and libdmtx's margin apart,
+    # so the bitmap is kept fine enough for that gap to outlast the dilation below
+    module_pixels: int | None = _estimate_module_pixels(grayscale_image)
+    if module_pixels is None:
+        return max_scale
+
+    return min(
+        max(module_pixels * SYMBOL_GAP_MODULES // LOCATOR_GAP_PIXELS, min_scale), max_scale
+    )
+
+
+def _is_nested_region(region: SymbolRegion, regions: Sequence[SymbolRegion]) -> bool:
+    return any(
+        other_region != region
+        and other_region.left <= region.left
+        and other_region.top <= region.top
+        and region.right <= other_region.right
+        and region.bottom <= other_region.bottom
+        for other_region in regions
+    )
+
+
+def _locate_regions(grayscale_image: Image.Image) -> _LocatedRegions:
+    scale: int = _get_locator_scale(grayscale_image)
+    locator_bitmap: Image.Image = (
+        grayscale_image.reduce(scale)
+        .filter(ImageFilter.MinFilter(3))
+        .point(lambda value: 1 if value < LOCATOR_DARK_THRESHOLD else 0)
+    )
+    locator_mask: bytes = locator_bitmap.tobytes()
+
+    pieces: Sequence[SymbolRegion] = list(
+        {
+            piece
+            for component in _find_dark_components(
+                locator_mask, locator_bitmap.width, locator_bitmap.height
+            )
+            for piece in _split_component(locator_mask, locator_bitmap.width, component)
+        }
+    )
+
+    symbol_regions: list[SymbolRegion] = []
+    unconfirmed_regions: list[SymbolRegion] = []
+
+    piece: SymbolRegion
+    for piece in pieces:
+        if _is_nested_region(piece, pieces):
+            continue
+
+        region: SymbolRegion = _scale_region(piece, scale, grayscale_image)
+        if _has_finder_pattern(grayscale_image.crop(region)):
+            symbol_regions.append(region)
+        else:
+            unconfirmed_regions.append(region)
+
+    return _LocatedRegions(
+        symbol_regions=sorted(symbol_regions, key=lambda region: (region.top, region.left)),
+        unconfirmed_regions=sorted(
+            unconfirmed_regions, key=lambda region: (region.top, region.left)
+        ),
+    )
+
+
+def locate_symbol_regions(image: Image.Image) -> Sequence[SymbolRegion]:
+    """"""
+    return _locate_regions(image.convert("L")).symbol_regions
+
+
+def _binarize(grayscale_image: Image.Image) -> Image.Image:
+    # NOTE: A module is dark when it is darker than its surroundings, so faded toner and
+    # uneven lighting are tolerated, or when it is dark outright, so large dark areas are too
+    local_mean: Image.Image = grayscale_image.filter(
+        ImageFilter.BoxBlur(max(min(grayscale_image.size) // ADAPTIVE_WINDOW_DIVISOR, 1))
+    )
+    adaptive_mask: Image.Image = ImageChops.subtract(local_mean, grayscale_image).point(
+        lambda value: 255 if value > ADAPTIVE_DARK_OFFSET else 0
+    )
+    global_mask: Image.Image = grayscale_image.point(
+        lambda value: 255 if value < SYMBOL_DARK_THRESHOLD else 0
+    )
+
+    return ImageChops.lighter(adaptive_mask, global_mask)
+
+
+def _get_outer_edge_offsets(
+    symbol_mask: Image.Image, bounding_box: SymbolRegion, side: int
+) -> Sequence[tuple[int, int]]:
+    left: int
+    top: int
+    right: int
+    bottom: int
+    left, top, right, bottom = bounding_box
+    length: int = right - left if side % 2 == 0 else bottom - top
+
+    outer_edge_offsets: list[tuple[int, int]] = []
+
+    position: int
+    for position in range(
+        length // SKEW_SAMPLE_MARGIN_DIVISOR,
+        length - length // SKEW_SAMPLE_MARGIN_DIVISOR,
+        max(length // SKEW_SAMPLES_COUNT, 1),
+    ):
+        raw_strip_bounding_box: tuple[int, int, int, int] | None = symbol_mask.crop(
+            (left + position, top, left + position + 1, bottom)
+            if side % 2 == 0
+            else (left, top + position, right, top + position + 1)
+        ).getbbox()
+        if raw_strip_bounding_box is None:
+            continue
+
+        # NOTE: Offsets are the distance from the image edge on that side to the first dark
+        # pixel, so each side's offsets grow the same way as the symbol turns
+        match side:
+            case 0:
+                outer_edge_offsets.append((position, raw_strip_bounding_box[1]))
+            case 1:
+                outer_edge_offsets.append((position, raw_strip_bounding_box[2]))
+            case 2:
+                outer_edge_offsets.append((position, raw_strip_bounding_box[3]))
+            case _:
+                outer_edge_offsets.append((position, raw_strip_bounding_box[0]))
+
+    return outer_edge_offsets
+
+
+def _fit_line(points: Sequence[tuple[int, int]]) -> tuple[float, float]:
+    mean_x: float = sum(x for x, _ in points) / len(points)
+    mean_y: float = sum(y for _, y in points) / len(points)
+    variance_x: float = sum((x - mean_x) ** 2 for x, _ in points)
+    slope: float = (
+        sum((x - mean_x) * (y - mean_y) for x, y in points) / variance_x if variance_x else 0
+    )
+    residual: float = sum((y - mean_y - slope * (x - mean_x)) ** 2 for x, y in points) / len(
+        points
+    )
+
+    return slope, residual
+
+
+def _estimate_skew(symbol_mask: Image.Image) -> float:
+    # NOTE: The finder pattern's solid edges are the straightest of the symbol's outer edges,
+    # so the best fitting line along any side gives the angle the symbol was scanned at
+    raw_bounding_box: tuple[int, int, int, int] | None = symbol_mask.getbbox()
+    if raw_bounding_box is None:
+        return 0
+
+    bounding_box: SymbolRegion = SymbolRegion(*raw_bounding_box)
+    edge_lines: list[tuple[float, float]] = []
+
+    side: int
+    for side in range(4):
+        outer_edge_offsets: Sequence[tuple[int, int]] = _get_outer_edge_offsets(
+            symbol_mask, bounding_box, side
+        )
+        if len(outer_edge_offsets) < MIN_SKEW_SAMPLES_COUNT:
+            continue
+
+        slope: float
+        residual: float
+        slope, residual = _fit_line(outer_edge_offsets)
+        edge_lines.append((residual, slope if side % 2 == 0 else -slope))
+
+    if not edge_lines:
+        return 0
+
+    return math.degrees(math.atan(min(edge_lines)[1]))
+
+
+def _count_edge_modules(
+    symbol_mask: Image.Image, bounding_box: SymbolRegion, side: int
+) -> int:
+    edge_modules_counts: list[int] = []
+
+    # NOTE: The outermost row of pixels is skipped, as it is the most ragged after deskewing
+    depth: int
+    for depth in range(1, FINDER_EDGE_DEPTH + 1):
+        edge_pixels: bytes = symbol_mask.crop(_get_edge(bounding_box, side, depth)).tobytes()
+        edge_modules_counts.append(
+            1
+            + sum(
+                (edge_pixels[index] > SYMBOL_DARK_THRESHOLD)
+                != (edge_pixels[index + 1] > SYMBOL_DARK_THRESHOLD)
+                for index in range(len(edge_pixels) - 1)
+            )
+        )
+
+    return Counter(edge_modules_counts).most_common(1)[0][0]
+
+
+def _count_symbol_modules(symbol_mask: Image.Image, bounding_box: SymbolRegion) -> int | None:
+    # NOTE: Every module along a timing edge alternates between dark and light, so counting
+    # the changes gives the symbol size, which is snapped to the nearest valid size
+    solid_edges: Sequence[bool] = _get_solid_edges(symbol_mask, bounding_box)
+    if not _is_finder_pattern(solid_edges):
+        return None
+
+    measured_modules: int = max(
+        _count_edge_modules(symbol_mask, bounding_box, side)
+        for side in range(4)
+        if not solid_edges[side]
+    )
+    modules: int = min(
+        DATA_MATRIX_SQUARE_SYMBOL_MODULES,
+        key=lambda symbol_modules: abs(symbol_modules - measured_modules),
+    )
+    if abs(modules - measured_modules) > MODULES_COUNT_TOLERANCE * modules:
+        return None
+
+    return modules
+
+
+def prepare_symbol_image(symbol_image: Image.Image) -> PreparedSymbol:
+    """"""
+    grayscale_image: Image.Image = symbol_image.convert("L")
+    symbol_mask: Image.Image = _binarize(grayscale_image)
+
+    # NOTE: The mask is rotated rather than the scan, so the corners uncovered by the
+    # rotation are always blank instead of standing out against a shaded background
+    skew_angle: float = _estimate_skew(symbol_mask)
+    if abs(skew_angle) >= MIN_DESKEW_DEGREES:
+        symbol_mask = symbol_mask.rotate(
+            skew_angle, resample=Image.Resampling.BICUBIC, expand=True
+        ).point(lambda value: 255 if value > SYMBOL_DARK_THRESHOLD else 0)
+
+    raw_bounding_box: tuple[int, int, int, int] | None = symbol_mask.getbbox()
+    if raw_bounding_box is None:
+        return PreparedSymbol(image=grayscale_image, modules=None)
+
+    bounding_box: SymbolRegion = SymbolRegion(*raw_bounding_box)
+    modules: int | None = _count_symbol_modules(symbol_mask, bounding_box)
+    symbol_mask = symbol_mask.crop(bounding_box)
+
+    # NOTE: Scanned pixels finer than the module pitch carry no information, so the symbol
+    # is resampled to a few pixels per module, with each pixel voted on by those it covers
+    if modules is not None:
+        symbol_mask = symbol_mask.resize(
+            (modules * TARGET_MODULE_PIXELS, modules * TARGET_MODULE_PIXELS),
+            Image.Resampling.BOX,
+        ).point(lambda value: 255 if value > SYMBOL_DARK_THRESHOLD else 0)
+
+    quiet_zone_pixels: int = QUIET_ZONE_MODULES * (
+        TARGET_MODULE_PIXELS
+        if modules is not None
+        else max(symbol_mask.width // DATA_MATRIX_SQUARE_SYMBOL_MODULES[0], 1)
+    )
+    return PreparedSymbol(
+        image=ImageOps.expand(
+            ImageOps.invert(symbol_mask), border=quiet_zone_pixels, fill=255
+        ),
+        modules=modules,
+    )
+
+
+def _decode_prepared_symbol(prepared_symbol: PreparedSymbol) -> bytes | None:
+    if prepared_symbol.modules is None:
+        decoded_symbols: Sequence[pylibdmtx.Decoded] = pylibdmtx.decode(
+            prepared_symbol.image,
+            timeout=SYMBOL_DECODE_TIMEOUT,
+            shape=DMTX_SQUARE_AUTO_SHAPE,
+            max_count=1,
+        )
+        return decoded_symbols[0].data if decoded_symbols else None
+
+    symbol_edge: int = prepared_symbol.modules * TARGET_MODULE_PIXELS
+    decoded_symbols = pylibdmtx.decode(
+        prepared_symbol.image,
+        timeout=SYMBOL_DECODE_TIMEOUT,
+        shape=DATA_MATRIX_SQUARE_SYMBOL_MODULES.index(prepared_symbol.modules),
+        min_edge=int(symbol_edge * (1 - SYMBOL_EDGE_TOLERANCE)),
+        max_edge=int(symbol_edge * (1 + SYMBOL_EDGE_TOLERANCE)),
+        max_count=1,
+    )
+    return decoded_symbols[0].data if decoded_symbols else None
+
+
+def _decode_symbol_region(symbol_image: Image.Image) -> bytes | None:
+    decoded_data: bytes | None = _decode_prepared_symbol(prepare_symbol_image(symbol_image))
+    if decoded_data is not None:
+        return decoded_data
+
+    # NOTE: A symbol that preprocessing could not make readable is still given one
+    # unhinted attempt on its original pixels
+    decoded_symbols: Sequence[pylibdmtx.Decoded] = pylibdmtx.decode(
+        symbol_image, timeout=SYMBOL_DECODE_TIMEOUT, max_count=1
+    )
+    return decoded_symbols[0].data if decoded_symbols else None
+
+
+def _decode_unconfirmed_region(region_image: Image.Image) -> Sequence[bytes]:
+    # NOTE: A region with no finder pattern may still hold symbols the locator could not
+    # separate, such as a skewed row of them, so libdmtx looks for every symbol in it
+    return [
+        decoded_symbol.data
+        for decoded_symbol in pylibdmtx.decode(region_image, shape=DMTX_SQUARE_AUTO_SHAPE)
+        if decoded_symbol.data
+    ]
+
+
+def _get_decoder_pool(workers: int) -> ProcessPoolExecutor:
+    if workers not in _decoder_pools:
+        _decoder_pools[workers] = ProcessPoolExecutor(max_workers=workers)
+
+    return _decoder_pools[workers]
+
+
+def decode_page(image: Image.Image, workers: int | None = None) -> Sequence[bytes]:
+    """"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    grayscale_image: Image.Image = image.convert("L")
+    located_regions: _LocatedRegions = _locate_regions(grayscale_image)
+
+    if not located_regions.symbol_regions:
+        return [
+            decoded_symbol.data
+            for decoded_symbol in pylibdmtx.decode(
+                grayscale_image, shape=DMTX_SQUARE_AUTO_SHAPE
+            )
+            if decoded_symbol.data
+        ]
+
+    symbol_images: Sequence[Image.Image] = [
+        grayscale_image.crop(region) for region in located_regions.symbol_regions
+    ]
+    unconfirmed_images: Sequence[Image.Image] = [
+        grayscale_image.crop(region) for region in located_regions.unconfirmed_regions
+    ]
+
+    decoded_payloads: Sequence[bytes | None]
+    unconfirmed_payloads: Sequence[Sequence[bytes]]
+    if workers <= 1 or len(symbol_images) + len(unconfirmed_images) <= 1:
+        decoded_payloads = [
+            _decode_symbol_region(symbol_image) for symbol_image in symbol_images
+        ]
+        unconfirmed_payloads = [
+            _decode_unconfirmed_region(unconfirmed_image)
+            for unconfirmed_image in unconfirmed_images
+        ]
+    else:
+        decoder_pool: ProcessPoolExecutor = _get_decoder_pool(workers)
+        decoded_payloads_iterator: Iterator[bytes | None] = decoder_pool.map(
+            _decode_symbol_region, symbol_images
+        )
+        unconfirmed_payloads_iterator: Iterator[Sequence[bytes]] = decoder_pool.map(
+            _decode_unconfirmed_region, unconfirmed_images
+        )
+        decoded_payloads = list(decoded_payloads_iterator)
+        unconfirmed_payloads = list(unconfirmed_payloads_iterator)
+
+    return [
+        *(payload for payload in decoded_payloads if payload),
+        *(payload for payload_group in unconfirmed_payloads for payload in payload_group),
+    ]
+
+
+def shutdown_decoder_pools() -> None:
+    """"""
+    pool: ProcessPoolExecutor
+    for pool in _decoder_pools.values():
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    _decoder_pools.clear()
@@ -0,0 +1,143 @@
+""""""
+
+from typing import TYPE_CHECKING
+
+from shared.fec import (
+    SHARD_LENGTH_PREFIX_SIZE,
+    get_cauchy_coefficient,
+    get_multiplication_table,
+    gf_inverse,
+    gf_multiply,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ("recover_data_records",)
+
+
+def _scale_shard(shard: int, coefficient: int, shard_length: int) -> int:
+    return int.from_bytes(
+        shard.to_bytes(shard_length).translate(get_multiplication_table(coefficient))
+    )
+
+
+def _invert_matrix(matrix: Sequence[Sequence[int]]) -> Sequence[Sequence[int]]:
+    size: int = len(matrix)
+    augmented_matrix: list[list[int]] = [
+        [*row, *(int(column == row_index) for column in range(size))]
+        for row_index, row in enumerate(matrix)
+    ]
+
+    column: int
+    for column in range(size):
+        pivot_row: int = next(
+            row for row in range(column, size) if augmented_matrix[row][column]
+        )
+        augmented_matrix[column], augmented_matrix[pivot_row] = (
+            augmented_matrix[pivot_row],
+            augmented_matrix[column],
+        )
+
+        pivot_inverse: int = gf_inverse(augmented_matrix[column][column])
+        augmented_matrix[column] = [
+            gf_multiply(value, pivot_inverse) for value in augmented_matrix[column]
+        ]
+
+        row: int
+        for row in range(size):
+            factor: int = augmented_matrix[row][column]
+            if row == column or not factor:
+                continue
+
+            augmented_matrix[row] = [
+                value ^ gf_multiply(factor, pivot_value)
+                for value, pivot_value in zip(
+                    augmented_matrix[row], augmented_matrix[column], strict=True
+                )
+            ]
+
+    return [row[size:] for row in augmented_matrix]
+
+
+def recover_data_records(
+    data_records: Mapping[int, bytes],
+    parity_shards: Mapping[int, bytes],
+    data_shards_count: int,
+) -> Mapping[int, bytes]:
+    """"""
+    missing_data_indices: Sequence[int] = [
+        data_index for data_index in range(data_shards_count) if data_index not in data_records
+    ]
+    if not missing_data_indices:
+        return {}
+
+    if len(parity_shards) < len(missing_data_indices):
+        NOT_ENOUGH_PARITY_MESSAGE: Final[str] = (
+            f"Cannot recover {len(missing_data_indices)} missing pages "
+            f"from {len(parity_shards)} parity pages."
+        )
+        raise ValueError(NOT_ENOUGH_PARITY_MESSAGE)
+
+    shard_length: int = len(next(iter(parity_shards.values())))
+    used_parity_indices: Sequence[int] = sorted(parity_shards)[: len(missing_data_indices)]
+
+    # NOTE: Remove every known data shard's contribution, leaving only the missing shards' terms
+    syndromes: list[int] = []
+
+    parity_index: int
+    for parity_index in used_parity_indices:
+        syndrome: int = int.from_bytes(parity_shards[parity_index])
+
+        data_index: int
+        data_record: bytes
+        for data_index, data_record in data_records.items():
+            syndrome ^= _scale_shard(
+                int.from_bytes(
+                    (
+                        len(data_record).to_bytes(SHARD_LENGTH_PREFIX_SIZE, byteorder="big")
+                        + data_record
+                    ).ljust(shard_length, b"\x00")
+                ),
+                get_cauchy_coefficient(parity_index, data_index, data_shards_count),
+                shard_length,
+            )
+
+        syndromes.append(syndrome)
+
+    inverse_matrix: Sequence[Sequence[int]] = _invert_matrix(
+        [
+            [
+                get_cauchy_coefficient(parity_index, data_index, data_shards_count)
+                for data_index in missing_data_indices
+            ]
+            for parity_index in used_parity_indices
+        ]
+    )
+
+    recovered_data_records: dict[int, bytes] = {}
+
+    row_index: int
+    for row_index, data_index in enumerate(missing_data_indices):
+        recovered_shard_value: int = 0
+
+        column_index: int
+        for column_index, syndrome in enumerate(syndromes):
+            recovered_shard_value ^= _scale_shard(
+                syndrome, inverse_matrix[row_index][column_index], shard_length
+            )
+
+        recovered_shard: bytes = recovered_shard_value.to_bytes(shard_length)
+        record_length: int = int.from_bytes(recovered_shard[:SHARD_LENGTH_PREFIX_SIZE])
+        if record_length > shard_length - SHARD_LENGTH_PREFIX_SIZE:
+            CORRUPT_SHARD_MESSAGE: str = (
+                f"Recovered page at group index {data_index} has an invalid length."
+            )
+            raise ValueError(CORRUPT_SHARD_MESSAGE)
+
+        recovered_data_records[data_index] = recovered_shard[
+            SHARD_LENGTH_PREFIX_SIZE : SHARD_LENGTH_PREFIX_SIZE + record_length
+        ]
+
+    return recovered_data_records
@@ -0,0 +1,57 @@
+""""""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ("PACKET_LENGTH_SIZE", "frame_packets", "split_packets")
+
+
+PACKET_LENGTH_SIZE: Final[int] = 3
+IPV4_HEADER_SIZE: Final[int] = 20
+IPV6_HEADER_SIZE: Final[int] = 40
+
+
+def _get_packet_size(content: bytes, offset: int) -> int | None:
+    match content[offset] >> 4:
+        case 4 if len(content) - offset >= IPV4_HEADER_SIZE:
+            packet_size: int = int.from_bytes(
+                content[offset + 2 : offset + 4], byteorder="big"
+            )
+            return packet_size if packet_size >= IPV4_HEADER_SIZE else None
+
+        case 6 if len(content) - offset >= IPV6_HEADER_SIZE:
+            return IPV6_HEADER_SIZE + int.from_bytes(
+                content[offset + 4 : offset + 6], byteorder="big"
+            )
+
+        case _:
+            return None
+
+
+def split_packets(content: bytes) -> tuple[Sequence[bytes], bytes]:
+    """"""
+    # NOTE: Frames carry whole IP packets back to back, so each packet's own length field
+    # marks where the next one starts, and anything after the last whole packet is returned
+    packets: list[bytes] = []
+    offset: int = 0
+
+    while offset < len(content):
+        packet_size: int | None = _get_packet_size(content, offset)
+        if packet_size is None or offset + packet_size > len(content):
+            break
+
+        packets.append(content[offset : offset + packet_size])
+        offset += packet_size
+
+    return packets, content[offset:]
+
+
+def frame_packets(packets: Iterable[bytes]) -> bytes:
+    """"""
+    return b"".join(
+        len(packet).to_bytes(PACKET_LENGTH_SIZE, byteorder="big") + packet
+        for packet in packets
+    )
@@ -0,0 +1,138 @@
+""""""
+
+import enum
+import zlib
+from enum import Enum
+from typing import TYPE_CHECKING, NamedTuple
+
+from .symbol_codec import decode_symbol_data
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+    from .symbol_codec import SymbolCodec
+
+__all__: Sequence[str] = (
+    "HEADER_V2_MAGIC",
+    "HeaderVersion",
+    "SymbolHeader",
+    "decode_varint",
+    "unpack_symbol",
+)
+
+
+HEADER_V2_MAGIC: Final[int] = 0xE2
+HEADER_V1_SIZE: Final[int] = 4
+HEADER_CHECKSUM_SIZE: Final[int] = 4
+MAX_VARINT_SIZE: Final[int] = 10
+
+
+class HeaderVersion(Enum):
+    """"""
+
+    AUTO = enum.auto()
+    V1 = enum.auto()
+    V2 = enum.auto()
+
+
+class SymbolHeader(NamedTuple):
+    """"""
+
+    page_number: int
+    slot: int
+    slots_count: int
+    page_flags: int
+    stream_id: int = 0
+
+
+def decode_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """"""
+    value: int = 0
+
+    index: int
+    for index in range(min(MAX_VARINT_SIZE, len(data) - offset)):
+        byte: int = data[offset + index]
+        value |= (byte & 0x7F) << (7 * index)
+        if not byte & 0x80:
+            return value, offset + index + 1
+
+    TRUNCATED_VARINT_MESSAGE: Final[str] = f"Truncated or oversized varint at offset {offset}."
+    raise ValueError(TRUNCATED_VARINT_MESSAGE)
+
+
+def _unpack_symbol_v1(symbol_data: bytes) -> tuple[SymbolHeader, bytes]:
+    if len(symbol_data) < HEADER_V1_SIZE:
+        SYMBOL_TOO_SHORT_MESSAGE: Final[str] = "Symbol data too short to contain a header."
+        raise ValueError(SYMBOL_TOO_SHORT_MESSAGE)
+
+    return SymbolHeader(
+        page_number=symbol_data[0],
+        slot=symbol_data[1],
+        slots_count=symbol_data[2],
+        page_flags=symbol_data[3],
+    ), symbol_data[HEADER_V1_SIZE:]
+
+
+def _unpack_symbol_v2(symbol_data: bytes) -> tuple[SymbolHeader, bytes]:
+    if not symbol_data or symbol_data[0] != HEADER_V2_MAGIC:
+        NOT_V2_HEADER_MESSAGE: Final[str] = "Symbol data does not start with a v2 header."
+        raise ValueError(NOT_V2_HEADER_MESSAGE)
+
+    offset: int = 1
+    page_number: int
+    page_number, offset = decode_varint(symbol_data, offset)
+    stream_id: int
+    stream_id, offset = decode_varint(symbol_data, offset)
+    slot: int
+    slot, offset = decode_varint(symbol_data, offset)
+    slots_count: int
+    slots_count, offset = decode_varint(symbol_data, offset)
+    page_flags_offset: int = offset
+    chunk_length: int
+    chunk_length, offset = decode_varint(symbol_data, offset + 1)
+
+    checksum_end: int = offset + HEADER_CHECKSUM_SIZE
+    if page_flags_offset >= len(symbol_data) or checksum_end + chunk_length != len(
+        symbol_data
+    ):
+        INVALID_LENGTH_MESSAGE: Final[str] = (
+            f"Symbol data is {len(symbol_data)} bytes, but its header expects "
+            f"{checksum_end + chunk_length} bytes."
+        )
+        raise ValueError(INVALID_LENGTH_MESSAGE)
+
+    chunk: bytes = symbol_data[checksum_end:]
+    if zlib.crc32(chunk, zlib.crc32(symbol_data[:offset])) != int.from_bytes(
+        symbol_data[offset:checksum_end], byteorder="big"
+    ):
+        CHECKSUM_MISMATCH_MESSAGE: Final[str] = "Symbol data failed its CRC32 check."
+        raise ValueError(CHECKSUM_MISMATCH_MESSAGE)
+
+    return SymbolHeader(
+        page_number=page_number,
+        slot=slot,
+        slots_count=slots_count,
+        page_flags=symbol_data[page_flags_offset],
+        stream_id=stream_id,
+    ), chunk
+
+
+def unpack_symbol(
+    header_version: HeaderVersion, symbol_codec: SymbolCodec, raw_data: bytes
+) -> tuple[SymbolHeader, bytes]:
+    """"""
+    match header_version:
+        case HeaderVersion.V1:
+            return _unpack_symbol_v1(decode_symbol_data(symbol_codec, raw_data, 1))
+
+        case HeaderVersion.V2:
+            return _unpack_symbol_v2(decode_symbol_data(symbol_codec, raw_data))
+
+        case HeaderVersion.AUTO:
+            # NOTE: A version 1 symbol only passes as version 2 if it also happens to
+            # carry the magic byte, consistent varint lengths and a matching CRC32
+            try:
+                return _unpack_symbol_v2(decode_symbol_data(symbol_codec, raw_data))
+            except ValueError:
+                return _unpack_symbol_v1(decode_symbol_data(symbol_codec, raw_data, 1))
@@ -0,0 +1,131 @@
+""""""
+
+from typing import TYPE_CHECKING
+
+from shared.header_compression import (
+    FieldKind,
+    RecordKind,
+    fill_inferred_fields,
+    get_header_fields,
+)
+
+from .header import decode_varint
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from shared.header_compression import HeaderField
+
+__all__: Sequence[str] = ("decompress_packet_headers",)
+
+
+def _decode_field_delta(previous_value: bytes, encoded_delta: int) -> bytes:
+    value_bits: int = 8 * len(previous_value)
+    delta: int = encoded_delta >> 1 if not encoded_delta & 1 else -(encoded_delta >> 1) - 1
+
+    return (
+        (int.from_bytes(previous_value, byteorder="big") + delta) % (1 << value_bits)
+    ).to_bytes(len(previous_value), byteorder="big")
+
+
+def _decode_delta_record(
+    header_fields: Sequence[HeaderField], context_header: bytes, content: bytes, offset: int
+) -> tuple[bytes, int]:
+    changed_fields_mask: int
+    changed_fields_mask, offset = decode_varint(content, offset)
+
+    header: bytearray = bytearray(context_header)
+
+    field_index: int = 0
+    header_field: HeaderField
+    for header_field in header_fields:
+        if header_field.kind not in (FieldKind.VERBATIM, FieldKind.DELTA):
+            continue
+
+        if changed_fields_mask >> field_index & 1:
+            field_end: int = header_field.offset + header_field.size
+            if header_field.kind is FieldKind.DELTA:
+                encoded_delta: int
+                encoded_delta, offset = decode_varint(content, offset)
+                header[header_field.offset : field_end] = _decode_field_delta(
+                    context_header[header_field.offset : field_end], encoded_delta
+                )
+            else:
+                header[header_field.offset : field_end] = content[
+                    offset : offset + header_field.size
+                ]
+                offset += header_field.size
+
+        field_index += 1
+
+    payload_size: int
+    payload_size, offset = decode_varint(content, offset)
+    fill_inferred_fields(header, header_fields, len(header) + payload_size)
+
+    return bytes(header) + content[offset : offset + payload_size], offset + payload_size
+
+
+def decompress_packet_headers(content: bytes) -> bytes:
+    """"""
+    contexts: list[tuple[Sequence[HeaderField], bytes]] = []
+    packets: list[bytes] = []
+    offset: int = 0
+
+    while offset < len(content):
+        record_kind: int = content[offset]
+        offset += 1
+
+        packet: bytes
+        match record_kind:
+            case RecordKind.RAW | RecordKind.FULL:
+                packet_size: int
+                packet_size, offset = decode_varint(content, offset)
+                packet = content[offset : offset + packet_size]
+                offset += packet_size
+
+                if record_kind == RecordKind.FULL:
+                    header_fields: Sequence[HeaderField] | None = get_header_fields(packet)
+                    if header_fields is None:
+                        INVALID_FULL_RECORD_MESSAGE: str = (
+                            f"Full header record before offset {offset} is not an IP packet."
+                        )
+                        raise ValueError(INVALID_FULL_RECORD_MESSAGE)
+
+                    contexts.append(
+                        (
+                            header_fields,
+                            packet[: header_fields[-1].offset + header_fields[-1].size],
+                        )
+                    )
+
+            case RecordKind.DELTA:
+                context_id: int
+                context_id, offset = decode_varint(content, offset)
+                if context_id >= len(contexts):
+                    UNKNOWN_CONTEXT_MESSAGE: str = (
+                        f"Delta record at offset {offset} uses unknown context {context_id}."
+                    )
+                    raise ValueError(UNKNOWN_CONTEXT_MESSAGE)
+
+                context_header_fields: Sequence[HeaderField]
+                context_header: bytes
+                context_header_fields, context_header = contexts[context_id]
+                packet, offset = _decode_delta_record(
+                    context_header_fields, context_header, content, offset
+                )
+                contexts[context_id] = (context_header_fields, packet[: len(context_header)])
+
+            case _:
+                UNKNOWN_RECORD_KIND_MESSAGE: str = (
+                    f"Unknown header compression record kind {record_kind} "
+                    f"at offset {offset - 1}."
+                )
+                raise ValueError(UNKNOWN_RECORD_KIND_MESSAGE)
+
+        if offset > len(content):
+            TRUNCATED_RECORD_MESSAGE: str = "Header compressed frame is truncated."
+            raise ValueError(TRUNCATED_RECORD_MESSAGE)
+
+        packets.append(packet)
+
+    return b"".join(packets)
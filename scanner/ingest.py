@@ -0,0 +1,161 @@
+""""""
+
+import io
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from PIL import Image, ImageSequence
+
+from .colour import ColourMode
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, MutableMapping, Sequence
+    from subprocess import CompletedProcess
+    from typing import BinaryIO, Final
+
+__all__: Sequence[str] = (
+    "SCAN_FILE_SUFFIXES",
+    "ScanError",
+    "load_scan_file",
+    "scan_adf_batch",
+    "watch_scan_directory",
+)
+
+
+PDF_MAGIC: Final[bytes] = b"%PDF"
+PDF_RASTER_RESOLUTION: Final[int] = 300
+SCAN_FILE_SUFFIXES: Final[frozenset[str]] = frozenset(
+    (".pdf", ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".pnm")
+)
+
+
+class ScanError(Exception):
+    """"""
+
+
+def _load_image_frames(image_data: BinaryIO, colour_mode: ColourMode) -> Sequence[Image.Image]:
+    image: Image.Image = Image.open(image_data)
+
+    # NOTE: Converting copies each frame, as a multi-page image only exposes one frame at a time.
+    # Colour sheets are kept in colour, so that each ink can be separated from the others
+    frame_mode: str = "L" if colour_mode is ColourMode.MONOCHROME else "RGB"
+    return [frame.convert(frame_mode) for frame in ImageSequence.Iterator(image)]
+
+
+def _rasterize_pdf(pdf_data: bytes, colour_mode: ColourMode) -> Sequence[Image.Image]:
+    pdftoppm_executable: str | None = shutil.which("pdftoppm")
+    if pdftoppm_executable is None:
+        MISSING_PDFTOPPM_MESSAGE: Final[str] = (
+            "The 'pdftoppm' executable could not be found. "
+            "Ensure poppler-utils is installed to read PDF scans."
+        )
+        raise ScanError(MISSING_PDFTOPPM_MESSAGE)
+
+    temporary_directory: str
+    with tempfile.TemporaryDirectory(prefix="ipops-scanner-") as temporary_directory:
+        completed_pdftoppm_subprocess: CompletedProcess[bytes] = subprocess.run(
+            (
+                pdftoppm_executable,
+                "-r",
+                str(PDF_RASTER_RESOLUTION),
+                *(("-gray",) if colour_mode is ColourMode.MONOCHROME else ()),
+                "-png",
+                "-",
+                str(Path(temporary_directory) / "page"),
+            ),
+            input=pdf_data,
+            check=False,
+            capture_output=True,
+            timeout=None,
+        )
+        if completed_pdftoppm_subprocess.returncode != 0:
+            PDFTOPPM_FAILED_MESSAGE: Final[str] = (
+                f"Subprocess call to 'pdftoppm' failed with exit code "
+                f"{completed_pdftoppm_subprocess.returncode}: "
+                f"{completed_pdftoppm_subprocess.stderr.decode()!r}"
+            )
+            raise ScanError(PDFTOPPM_FAILED_MESSAGE)
+
+        # NOTE: pdftoppm zero-pads page numbers, so name order is page order
+        return [
+            image
+            for page_path in sorted(Path(temporary_directory).iterdir())
+            for image in _load_image_frames(io.BytesIO(page_path.read_bytes()), colour_mode)
+        ]
+
+
+def load_scan_file(scan_file: BinaryIO, colour_mode: ColourMode) -> Sequence[Image.Image]:
+    """"""
+    scan_data: bytes = scan_file.read()
+    if scan_data.startswith(PDF_MAGIC):
+        return _rasterize_pdf(scan_data, colour_mode)
+
+    return _load_image_frames(io.BytesIO(scan_data), colour_mode)
+
+
+def scan_adf_batch(
+    scanimage_executable: str, image_format: str, colour_mode: ColourMode
+) -> Sequence[Image.Image]:
+    """"""
+    temporary_directory: str
+    with tempfile.TemporaryDirectory(prefix="ipops-scanner-") as temporary_directory:
+        completed_scanimage_subprocess: CompletedProcess[bytes] = subprocess.run(
+            (
+                scanimage_executable,
+                "--format",
+                image_format,
+                f"--batch={Path(temporary_directory) / f'sheet%06d.{image_format}'}",
+            ),
+            check=False,
+            capture_output=True,
+            timeout=None,
+        )
+
+        # NOTE: scanimage reports an empty document feeder once every sheet has been
+        # scanned, so any sheets it wrote before failing are still used
+        scanned_sheet_paths: Sequence[Path] = sorted(Path(temporary_directory).iterdir())
+        if not scanned_sheet_paths:
+            SCANIMAGE_FAILED_MESSAGE: Final[str] = (
+                f"Subprocess call to 'scanimage' failed with exit code "
+                f"{completed_scanimage_subprocess.returncode}: "
+                f"{completed_scanimage_subprocess.stderr.decode()!r}"
+            )
+            raise ScanError(SCANIMAGE_FAILED_MESSAGE)
+
+        return [
+            image
+            for sheet_path in scanned_sheet_paths
+            for image in _load_image_frames(io.BytesIO(sheet_path.read_bytes()), colour_mode)
+        ]
+
+
+def watch_scan_directory(directory: Path, poll_interval: float) -> Iterator[Path]:
+    """"""
+    processed_paths: set[Path] = set()
+    pending_file_sizes: MutableMapping[Path, int] = {}
+
+    while True:
+        path: Path
+        for path in sorted(directory.iterdir()):
+            if (
+                path in processed_paths
+                or not path.is_file()
+                or path.suffix.lower() not in SCAN_FILE_SUFFIXES
+            ):
+                continue
+
+            # NOTE: Wait until a file's size stops changing, so half-written scans are not read
+            file_size: int = path.stat().st_size
+            if pending_file_sizes.get(path) != file_size:
+                pending_file_sizes[path] = file_size
+                continue
+
+            del pending_file_sizes[path]
+            processed_paths.add(path)
+            yield path
+
+        time.sleep(poll_interval)
@@ -0,0 +1,84 @@
+""""""
+
+from typing import TYPE_CHECKING
+
+from shared.metrics import Counter, Gauge, Histogram, MetricsExporter, MetricsRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "BYTES_DELIVERED",
+    "DECODE_SECONDS",
+    "DROPPED_SYMBOLS",
+    "EMPTY_SHEETS",
+    "INCOMPLETE_PAGES",
+    "PACKETS_DELIVERED",
+    "PAGES_RECOVERED",
+    "PAGES_SCANNED",
+    "REGISTRY",
+    "REORDER_GAPS",
+    "REORDER_MISSING_PAGES",
+    "REORDER_PENDING_PAGES",
+    "SCAN_SECONDS",
+    "SHEETS_SCANNED",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsExporter",
+    "MetricsRegistry",
+)
+
+
+LATENCY_BUCKETS: Final[Sequence[float]] = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+REGISTRY: Final[MetricsRegistry] = MetricsRegistry()
+
+SCAN_SECONDS: Final[Histogram] = REGISTRY.histogram(
+    "ipops_scanner_scan_seconds",
+    "Time taken to scan or load each batch of sheets.",
+    LATENCY_BUCKETS,
+)
+DECODE_SECONDS: Final[Histogram] = REGISTRY.histogram(
+    "ipops_scanner_decode_seconds",
+    "Time taken to find, decode and parse the symbols on each sheet.",
+    LATENCY_BUCKETS,
+)
+SHEETS_SCANNED: Final[Counter] = REGISTRY.counter(
+    "ipops_scanner_sheets_scanned_total", "Sheets handed to the symbol decoder."
+)
+EMPTY_SHEETS: Final[Counter] = REGISTRY.counter(
+    "ipops_scanner_empty_sheets_total", "Sheets on which no symbols could be decoded."
+)
+DROPPED_SYMBOLS: Final[Counter] = REGISTRY.counter(
+    "ipops_scanner_dropped_symbols_total",
+    "Decoded symbols dropped for a bad header, checksum or stream.",
+)
+INCOMPLETE_PAGES: Final[Counter] = REGISTRY.counter(
+    "ipops_scanner_incomplete_pages_total", "Pages skipped because symbols were missing."
+)
+PAGES_SCANNED: Final[Counter] = REGISTRY.counter(
+    "ipops_scanner_pages_scanned_total", "Pages saved to the page store."
+)
+PAGES_RECOVERED: Final[Counter] = REGISTRY.counter(
+    "ipops_scanner_pages_recovered_total", "Data pages rebuilt from parity pages."
+)
+BYTES_DELIVERED: Final[Counter] = REGISTRY.counter(
+    "ipops_scanner_delivered_bytes_total", "Bytes of IP packets written to the virtual pipe."
+)
+PACKETS_DELIVERED: Final[Counter] = REGISTRY.counter(
+    "ipops_scanner_delivered_packets_total", "IP packets written to the virtual pipe."
+)
+REORDER_PENDING_PAGES: Final[Gauge] = REGISTRY.gauge(
+    "ipops_scanner_reorder_pending_pages",
+    "Pages held in the reorder buffer until the pages before them arrive.",
+)
+REORDER_MISSING_PAGES: Final[Gauge] = REGISTRY.gauge(
+    "ipops_scanner_reorder_missing_pages",
+    "Pages missing below the highest page held in the reorder buffer.",
+)
+REORDER_GAPS: Final[Gauge] = REGISTRY.gauge(
+    "ipops_scanner_reorder_gaps", "Runs of missing pages in the reorder buffer."
+)
@@ -0,0 +1,126 @@
+""""""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple, cast
+
+import pytesseract  # type: ignore[import-untyped]
+from PIL import Image
+
+from .text_codec import TEXT_ALPHABET, decode_text_lines
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "TextLineRegion",
+    "decode_text_page",
+    "locate_text_lines",
+    "shutdown_ocr_pools",
+)
+
+
+TEXT_DARK_THRESHOLD: Final[int] = 128
+MIN_ROW_INK: Final[int] = 1
+MIN_LINE_HEIGHT: Final[int] = 4
+LINE_PADDING_DIVISOR: Final[int] = 4
+
+# NOTE: Each strip holds exactly one line of text, and OCR is only allowed to read
+# characters from the printed alphabet, plus the spaces that set the line's fields apart
+TESSERACT_CONFIG: Final[str] = (
+    f'--psm 7 -c tessedit_char_whitelist="{TEXT_ALPHABET} " -c preserve_interword_spaces=1'
+)
+
+
+_ocr_pools: Final[dict[int, ProcessPoolExecutor]] = {}
+
+
+class TextLineRegion(NamedTuple):
+    """"""
+
+    top: int
+    bottom: int
+
+
+def locate_text_lines(image: Image.Image) -> Sequence[TextLineRegion]:
+    """"""
+    grayscale_image: Image.Image = image.convert("L")
+
+    # NOTE: Squashing the dark pixels into a single column gives the share of ink on each
+    # row, and the printed lines are the runs of rows with any ink on them
+    rows_ink: bytes = (
+        grayscale_image.point(lambda value: 255 if value < TEXT_DARK_THRESHOLD else 0)
+        .resize((1, grayscale_image.height), Image.Resampling.BOX)
+        .tobytes()
+    )
+
+    line_regions: list[TextLineRegion] = []
+    line_top: int | None = None
+
+    row: int
+    row_ink: int
+    for row, row_ink in enumerate((*rows_ink, 0)):
+        if row_ink >= MIN_ROW_INK:
+            if line_top is None:
+                line_top = row
+            continue
+
+        if line_top is None:
+            continue
+
+        if row - line_top >= MIN_LINE_HEIGHT:
+            line_padding: int = (row - line_top) // LINE_PADDING_DIVISOR + 1
+            line_regions.append(
+                TextLineRegion(
+                    top=max(line_top - line_padding, 0),
+                    bottom=min(row + line_padding, grayscale_image.height),
+                )
+            )
+
+        line_top = None
+
+    return line_regions
+
+
+def _read_text_line(line_image: Image.Image) -> str:
+    # NOTE: pytesseract has no type hints, but always returns the recognised text as a string
+    return cast("str", pytesseract.image_to_string(line_image, config=TESSERACT_CONFIG))
+
+
+def _get_ocr_pool(workers: int) -> ProcessPoolExecutor:
+    if workers not in _ocr_pools:
+        _ocr_pools[workers] = ProcessPoolExecutor(max_workers=workers)
+
+    return _ocr_pools[workers]
+
+
+def decode_text_page(image: Image.Image, workers: int | None = None) -> bytes:
+    """"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    grayscale_image: Image.Image = image.convert("L")
+    line_images: Sequence[Image.Image] = [
+        grayscale_image.crop((0, line_region.top, grayscale_image.width, line_region.bottom))
+        for line_region in locate_text_lines(grayscale_image)
+    ]
+
+    # NOTE: Every line carries its own number and checksum, so lines are read independently
+    # and any that are misread (or are not data lines at all, like the footer) are dropped
+    read_texts: Sequence[str] = (
+        [_read_text_line(line_image) for line_image in line_images]
+        if workers <= 1 or len(line_images) <= 1
+        else list(_get_ocr_pool(workers).map(_read_text_line, line_images))
+    )
+
+    return decode_text_lines(read_texts)
+
+
+def shutdown_ocr_pools() -> None:
+    """"""
+    pool: ProcessPoolExecutor
+    for pool in _ocr_pools.values():
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    _ocr_pools.clear()
@@ -0,0 +1,114 @@
+""""""
+
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+__all__: Sequence[str] = ("ReorderBuffer", "ReorderStatistics")
+
+
+class ReorderStatistics(NamedTuple):
+    """"""
+
+    watermark: int
+    pending_count: int
+    missing_count: int
+    gaps: Sequence[range]
+
+
+class ReorderBuffer:
+    """"""
+
+    def __init__(self, watermark: int, pending_page_numbers: Iterable[int] = ()) -> None:
+        """"""
+        self.watermark: int = watermark
+
+        # NOTE: Bit i is set when page (watermark + i) has arrived but not yet been released
+        self._pending_bitmap: int = 0
+
+        page_number: int
+        for page_number in pending_page_numbers:
+            self.add(page_number)
+
+    def __contains__(self, page_number: object) -> bool:
+        """"""
+        return (
+            isinstance(page_number, int)
+            and page_number >= self.watermark
+            and bool(self._pending_bitmap >> (page_number - self.watermark) & 1)
+        )
+
+    def add(self, page_number: int) -> bool:
+        """"""
+        if page_number < self.watermark:
+            return False
+
+        page_bit: int = 1 << (page_number - self.watermark)
+        if self._pending_bitmap & page_bit:
+            return False
+
+        self._pending_bitmap |= page_bit
+        return True
+
+    def release(self) -> range:
+        """"""
+        # NOTE: The lowest clear bit marks the end of the contiguous run starting at the watermark
+        run_length: int = (~self._pending_bitmap & (self._pending_bitmap + 1)).bit_length() - 1
+        released_page_numbers: range = range(self.watermark, self.watermark + run_length)
+
+        self._pending_bitmap >>= run_length
+        self.watermark += run_length
+
+        return released_page_numbers
+
+    @property
+    def pending_count(self) -> int:
+        """"""
+        return self._pending_bitmap.bit_count()
+
+    @property
+    def highest_pending_page_number(self) -> int | None:
+        """"""
+        if not self._pending_bitmap:
+            return None
+
+        return self.watermark + self._pending_bitmap.bit_length() - 1
+
+    def get_pending_page_numbers(self) -> Sequence[int]:
+        """"""
+        return [
+            self.watermark + offset
+            for offset in range(self._pending_bitmap.bit_length())
+            if self._pending_bitmap >> offset & 1
+        ]
+
+    def get_gaps(self) -> Sequence[range]:
+        """"""
+        gaps: list[range] = []
+        missing_bitmap: int = ~self._pending_bitmap & (
+            (1 << self._pending_bitmap.bit_length()) - 1
+        )
+
+        offset: int = 0
+        while missing_bitmap:
+            gap_start: int = (missing_bitmap & -missing_bitmap).bit_length() - 1
+            missing_bitmap >>= gap_start
+            offset += gap_start
+
+            gap_length: int = (~missing_bitmap & (missing_bitmap + 1)).bit_length() - 1
+            gaps.append(range(self.watermark + offset, self.watermark + offset + gap_length))
+            missing_bitmap >>= gap_length
+            offset += gap_length
+
+        return gaps
+
+    def get_statistics(self) -> ReorderStatistics:
+        """"""
+        pending_count: int = self.pending_count
+        return ReorderStatistics(
+            watermark=self.watermark,
+            pending_count=pending_count,
+            missing_count=self._pending_bitmap.bit_length() - pending_count,
+            gaps=self.get_gaps(),
+        )
@@ -0,0 +1,166 @@
+""""""
+
+import enum
+import logging
+import os
+import struct
+import zlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from collections.abc import Set as AbstractSet
+    from logging import Logger
+    from pathlib import Path
+    from typing import Final
+
+__all__: Sequence[str] = ("PageStore",)
+
+
+logger: Final[Logger] = logging.getLogger("ipops-scanner")
+
+
+# NOTE: Each record is a (kind, page number, payload length, CRC32) header followed by payload
+RECORD_HEADER: Final[struct.Struct] = struct.Struct(">BQII")
+
+
+class _RecordKind(enum.IntEnum):
+    DATA = 1
+    SENT = 2
+
+
+class PageStore:
+    """"""
+
+    def __init__(self, path: Path) -> None:
+        """"""
+        self.path: Path = path
+        self._fd: int = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600)
+        self._data_index: dict[int, tuple[int, int]] = {}
+        self._sent_page_numbers: set[int] = set()
+
+        self._load_index()
+
+    def __contains__(self, page_number: object) -> bool:
+        """"""
+        return page_number in self._data_index
+
+    def __len__(self) -> int:
+        """"""
+        return len(self._data_index)
+
+    def _load_index(self) -> None:
+        file_size: int = os.fstat(self._fd).st_size
+        offset: int = 0
+
+        while offset + RECORD_HEADER.size <= file_size:
+            kind: int
+            page_number: int
+            length: int
+            checksum: int
+            kind, page_number, length, checksum = RECORD_HEADER.unpack(
+                os.pread(self._fd, RECORD_HEADER.size, offset)
+            )
+            data_offset: int = offset + RECORD_HEADER.size
+            if data_offset + length > file_size:
+                break
+
+            if zlib.crc32(os.pread(self._fd, length, data_offset)) != checksum:
+                break
+
+            match kind:
+                case _RecordKind.DATA:
+                    self._data_index[page_number] = (data_offset, length)
+                case _RecordKind.SENT:
+                    self._sent_page_numbers.add(page_number)
+                case _:
+                    break
+
+            offset = data_offset + length
+
+        if offset != file_size:
+            # NOTE: A torn or corrupt record can only be the last one written before a crash
+            logger.warning(
+                "Discarding %d bytes of incomplete records from page store", file_size - offset
+            )
+            os.ftruncate(self._fd, offset)
+
+    def _append_records(
+        self, records: Sequence[tuple[_RecordKind, int, bytes]]
+    ) -> Sequence[int]:
+        file_offset: int = os.fstat(self._fd).st_size
+        data_offsets: list[int] = []
+        buffer: bytearray = bytearray()
+
+        kind: _RecordKind
+        page_number: int
+        data: bytes
+        for kind, page_number, data in records:
+            if page_number < 0:
+                NEGATIVE_PAGE_NUMBER_MESSAGE: str = (
+                    f"Cannot store negative page number: {page_number}."
+                )
+                raise ValueError(NEGATIVE_PAGE_NUMBER_MESSAGE)
+
+            buffer += RECORD_HEADER.pack(kind, page_number, len(data), zlib.crc32(data))
+            data_offsets.append(file_offset + len(buffer))
+            buffer += data
+
+        os.write(self._fd, buffer)
+        os.fsync(self._fd)
+        return data_offsets
+
+    @property
+    def page_numbers(self) -> AbstractSet[int]:
+        """"""
+        return self._data_index.keys()
+
+    @property
+    def sent_page_numbers(self) -> AbstractSet[int]:
+        """"""
+        return self._sent_page_numbers
+
+    def put(self, page_number: int, data: bytes) -> None:
+        """"""
+        self._data_index[page_number] = (
+            self._append_records(((_RecordKind.DATA, page_number, data),))[0],
+            len(data),
+        )
+
+    def get(self, page_number: int) -> bytes | None:
+        """"""
+        if page_number not in self._data_index:
+            return None
+
+        offset: int
+        length: int
+        offset, length = self._data_index[page_number]
+        return os.pread(self._fd, length, offset)
+
+    def is_sent(self, page_number: int) -> bool:
+        """"""
+        return page_number in self._sent_page_numbers
+
+    def mark_sent(self, page_numbers: Iterable[int]) -> None:
+        """"""
+        unsent_page_numbers: Sequence[int] = sorted(
+            set(page_numbers).difference(self._sent_page_numbers)
+        )
+        if not unsent_page_numbers:
+            return
+
+        self._append_records(
+            [(_RecordKind.SENT, page_number, b"") for page_number in unsent_page_numbers]
+        )
+        self._sent_page_numbers.update(unsent_page_numbers)
+
+    def reset(self) -> None:
+        """"""
+        os.ftruncate(self._fd, 0)
+        os.fsync(self._fd)
+        self._data_index.clear()
+        self._sent_page_numbers.clear()
+
+    def close(self) -> None:
+        """"""
+        os.close(self._fd)
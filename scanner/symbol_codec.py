@@ -0,0 +1,61 @@
+""""""
+
+import base64
+import enum
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ("SymbolCodec", "cobs_decode", "decode_symbol_data")
+
+
+COBS_MAX_BLOCK_SIZE: Final[int] = 254
+
+
+class SymbolCodec(Enum):
+    """"""
+
+    BASE85 = enum.auto()
+    BASE256 = enum.auto()
+
+
+def cobs_decode(encoded_data: bytes) -> bytes:
+    """"""
+    decoded_data: bytearray = bytearray()
+    offset: int = 0
+
+    while offset < len(encoded_data):
+        block_code: int = encoded_data[offset]
+        block_end: int = offset + block_code
+        if not block_code or block_end > len(encoded_data):
+            INVALID_COBS_BLOCK_MESSAGE: str = (
+                f"Invalid COBS block code {block_code} at offset {offset}."
+            )
+            raise ValueError(INVALID_COBS_BLOCK_MESSAGE)
+
+        decoded_data += encoded_data[offset + 1 : block_end]
+
+        # NOTE: Only blocks shorter than the maximum were followed by a null byte
+        if block_code <= COBS_MAX_BLOCK_SIZE:
+            decoded_data.append(0)
+
+        offset = block_end
+
+    # NOTE: The encoder always ends on a short block, whose implied null byte is not data
+    return bytes(decoded_data[:-1])
+
+
+def decode_symbol_data(
+    symbol_codec: SymbolCodec, raw_data: bytes, raw_prefix_size: int = 0
+) -> bytes:
+    """"""
+    match symbol_codec:
+        case SymbolCodec.BASE85:
+            # NOTE: Version 1 headers keep their page byte outside of the base85 text
+            return raw_data[:raw_prefix_size] + base64.b85decode(raw_data[raw_prefix_size:])
+
+        case SymbolCodec.BASE256:
+            return cobs_decode(raw_data)
@@ -0,0 +1,131 @@
+""""""
+
+import base64
+import binascii
+import zlib
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ("TEXT_ALPHABET", "TextLine", "decode_text_lines", "parse_text_line")
+
+
+# NOTE: Crockford's base32 alphabet leaves out I, L, O and U, so the letters that OCR
+# most often confuses with digits never appear in printed text
+TEXT_ALPHABET: Final[str] = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+BASE32_ALPHABET: Final[str] = "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+TEXT_ALPHABET_BITS: Final[int] = 5
+LINE_NUMBER_CHARACTERS: Final[int] = 2
+LINE_CHECKSUM_CHARACTERS: Final[int] = 4
+BASE32_BLOCK_CHARACTERS: Final[int] = 8
+
+TEXT_DECODE_TRANSLATION: Final[dict[int, int]] = str.maketrans(TEXT_ALPHABET, BASE32_ALPHABET)
+
+# NOTE: Read characters are folded onto the alphabet the same way Crockford's base32 does,
+# and anything else that OCR reads, such as spaces, is dropped
+OCR_CHARACTER_TRANSLATION: Final[dict[int, int | None]] = {
+    **str.maketrans("OILoil", "011011"),
+    **{
+        character: None
+        for character in range(0x80)
+        if chr(character).upper() not in TEXT_ALPHABET + "OIL"
+    },
+}
+
+
+class TextLine(NamedTuple):
+    """"""
+
+    line_number: int
+    lines_count: int
+    data: str
+
+
+def _decode_number(characters: str) -> int:
+    number: int = 0
+
+    character: str
+    for character in characters:
+        number = (number << TEXT_ALPHABET_BITS) | TEXT_ALPHABET.index(character)
+
+    return number
+
+
+def _get_line_checksum(line_prefix: str, line_data: str) -> int:
+    return zlib.crc32(f"{line_prefix}{line_data}".encode("ascii")) % (
+        1 << (TEXT_ALPHABET_BITS * LINE_CHECKSUM_CHARACTERS)
+    )
+
+
+def parse_text_line(text: str) -> TextLine | None:
+    """"""
+    characters: str = text.translate(OCR_CHARACTER_TRANSLATION).upper()
+    if len(characters) < 2 * LINE_NUMBER_CHARACTERS + LINE_CHECKSUM_CHARACTERS or any(
+        character not in TEXT_ALPHABET for character in characters
+    ):
+        return None
+
+    line_prefix: str = characters[: 2 * LINE_NUMBER_CHARACTERS]
+    line_data: str = characters[2 * LINE_NUMBER_CHARACTERS : -LINE_CHECKSUM_CHARACTERS]
+    if _decode_number(characters[-LINE_CHECKSUM_CHARACTERS:]) != _get_line_checksum(
+        line_prefix, line_data
+    ):
+        return None
+
+    text_line: TextLine = TextLine(
+        line_number=_decode_number(line_prefix[:LINE_NUMBER_CHARACTERS]),
+        lines_count=_decode_number(line_prefix[LINE_NUMBER_CHARACTERS:]),
+        data=line_data,
+    )
+    if text_line.line_number >= text_line.lines_count:
+        return None
+
+    return text_line
+
+
+def decode_text_lines(texts: Iterable[str]) -> bytes:
+    """"""
+    lines_data: dict[int, str] = {}
+    lines_count: int | None = None
+
+    text: str
+    for text in texts:
+        text_line: TextLine | None = parse_text_line(text)
+        if text_line is None:
+            continue
+
+        if lines_count is not None and text_line.lines_count != lines_count:
+            MISMATCHED_LINES_COUNT_MESSAGE: str = (
+                f"Text lines disagree on the lines count: {lines_count} "
+                f"and {text_line.lines_count}."
+            )
+            raise ValueError(MISMATCHED_LINES_COUNT_MESSAGE)
+
+        lines_count = text_line.lines_count
+        lines_data[text_line.line_number] = text_line.data
+
+    if lines_count is None:
+        NO_TEXT_LINES_MESSAGE: Final[str] = "No text line could be read."
+        raise ValueError(NO_TEXT_LINES_MESSAGE)
+
+    missing_line_numbers: Sequence[int] = [
+        line_number for line_number in range(lines_count) if line_number not in lines_data
+    ]
+    if missing_line_numbers:
+        MISSING_TEXT_LINES_MESSAGE: Final[str] = (
+            f"{len(missing_line_numbers)} of {lines_count} text lines could not be read: "
+            f"{', '.join(map(str, missing_line_numbers))}."
+        )
+        raise ValueError(MISSING_TEXT_LINES_MESSAGE)
+
+    encoded_data: str = "".join(lines_data[line_number] for line_number in range(lines_count))
+    try:
+        return base64.b32decode(
+            encoded_data.translate(TEXT_DECODE_TRANSLATION)
+            + "=" * (-len(encoded_data) % BASE32_BLOCK_CHARACTERS)
+        )
+    except binascii.Error as e:
+        INVALID_TEXT_DATA_MESSAGE: Final[str] = f"Text lines hold invalid base32 data: {e}"
+        raise ValueError(INVALID_TEXT_DATA_MESSAGE) from e
@@ -0,0 +1,87 @@
+""""""
+
+import fcntl
+import os
+import select
+import socket
+import struct
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from typing import Final
+
+__all__: Sequence[str] = ("inject_packets", "open_mock_tun_device", "open_tun_device")
+
+
+TUN_CLONE_DEVICE_PATH: Final[str] = "/dev/net/tun"
+TUNSETIFF: Final[int] = 0x400454CA
+TUNSETQUEUE: Final[int] = 0x400454D9
+IFF_TUN: Final[int] = 0x0001
+IFF_MULTI_QUEUE: Final[int] = 0x0100
+IFF_DETACH_QUEUE: Final[int] = 0x0400
+IFF_NO_PI: Final[int] = 0x1000
+IFNAMSIZ: Final[int] = 16
+WRITE_TIMEOUT: Final[float] = 5.0
+
+
+def open_tun_device(name: str) -> int:
+    """"""
+    encoded_name: bytes = name.encode("ascii")
+    if not encoded_name or len(encoded_name) >= IFNAMSIZ:
+        INVALID_DEVICE_NAME_MESSAGE: Final[str] = (
+            f"TUN device names must be between 1 and {IFNAMSIZ - 1} characters long."
+        )
+        raise ValueError(INVALID_DEVICE_NAME_MESSAGE)
+
+    tun_fd: int = os.open(TUN_CLONE_DEVICE_PATH, os.O_RDWR | os.O_NONBLOCK | os.O_CLOEXEC)
+    try:
+        fcntl.ioctl(
+            tun_fd,
+            TUNSETIFF,
+            struct.pack(f"{IFNAMSIZ}sH", encoded_name, IFF_TUN | IFF_NO_PI | IFF_MULTI_QUEUE),
+        )
+
+        # NOTE: A detached queue can still inject packets, but the kernel no longer hands
+        # it outbound packets, which would otherwise be lost instead of reaching the printer
+        fcntl.ioctl(tun_fd, TUNSETQUEUE, struct.pack(f"{IFNAMSIZ}sH", b"", IFF_DETACH_QUEUE))
+    except OSError:
+        os.close(tun_fd)
+        raise
+
+    return tun_fd
+
+
+def open_mock_tun_device() -> tuple[int, int]:
+    """"""
+    # NOTE: Sequenced packet sockets keep message boundaries like a TUN device does,
+    # so the first descriptor stands in for the device and the second for the kernel
+    device_socket: socket.socket
+    kernel_socket: socket.socket
+    device_socket, kernel_socket = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    device_socket.setblocking(False)  # noqa: FBT003
+
+    return device_socket.detach(), kernel_socket.detach()
+
+
+def _write_packet(tun_fd: int, packet: bytes) -> bool:
+    while True:
+        try:
+            os.write(tun_fd, packet)
+        except BlockingIOError:
+            if not select.select((), (tun_fd,), (), WRITE_TIMEOUT)[1]:
+                TIMED_OUT_MESSAGE: str = (
+                    f"The TUN device did not accept a packet within {WRITE_TIMEOUT} seconds."
+                )
+                raise TimeoutError(TIMED_OUT_MESSAGE) from None
+        except OSError:
+            return False
+        else:
+            return True
+
+
+def inject_packets(tun_fd: int, packets: Iterable[bytes]) -> int:
+    """"""
+    # NOTE: Each write to a TUN device injects exactly one whole packet, so no framing
+    # is needed, and packets the kernel rejects are skipped rather than ending the batch
+    return sum(_write_packet(tun_fd, packet) for packet in packets)
@@ -1,39 +1,60 @@
 """"""
 
-import base64
 import enum
-import json
-import time
-from typing import TYPE_CHECKING, cast
+import logging
+from typing import TYPE_CHECKING, NamedTuple
 
 import platformdirs
 
+from . import fec
+from .compression import FrameCodec, decompress_frame
+from .header import HeaderVersion, unpack_symbol
+from .header_compression import decompress_packet_headers
+from .reorder import ReorderBuffer
+from .store import PageStore
+from .symbol_codec import SymbolCodec
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable, MutableMapping, MutableSequence, Sequence
+    from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+    from logging import Logger
     from pathlib import Path
-    from typing import Final, TypedDict
+    from typing import Final
+
+    from .header import SymbolHeader
 
 __all__: Sequence[str] = (
     "PageState",
+    "SymbolPayload",
+    "assemble_pages",
     "get_page_states",
+    "get_page_store",
+    "get_reorder_buffer",
     "load_previous_page_number",
+    "parse_symbol_payload",
+    "recover_missing_pages",
     "save_previous_page_number",
     "send_lowest_contiguous_block",
 )
 
 
-if TYPE_CHECKING:
-
-    class StateFileData(TypedDict):
-        data: MutableMapping[str, str]
-        sent: MutableSequence[int]
-
+logger: Final[Logger] = logging.getLogger("ipops-scanner")
 
 APP_STATE_PATH: Final[Path] = platformdirs.user_state_path(
     "IPoPS-scanner", roaming=False, ensure_exists=True
 )
 PREVIOUS_PAGE_NUMBER_FILE_PATH: Final[Path] = APP_STATE_PATH / "previous_page_number"
-SCAN_STATE_FILE_PATH: Final[Path] = APP_STATE_PATH / f"state.{int(time.time())}"
+SCAN_STATE_FILE_PATH: Final[Path] = APP_STATE_PATH / "pages.log"
+FRAME_END_PAGE_FLAG: Final[int] = 0x80
+FEC_PAGE_FLAG: Final[int] = 0x40
+PARITY_PAGE_FLAG: Final[int] = 0x20
+HEADER_COMPRESSION_PAGE_FLAG: Final[int] = 0x10
+FRAME_CODEC_PAGE_FLAGS_MASK: Final[int] = 0x07
+FEC_PAGE_HEADER_SIZE: Final[int] = 3
+
+
+_page_store: PageStore | None = None
+_reorder_buffer: ReorderBuffer | None = None
+_partial_frame_page_numbers: Final[list[int]] = []
 
 
 class PageState(enum.Enum):
@@ -44,6 +65,76 @@ class PageState(enum.Enum):
     SENT = "green"
 
 
+class SymbolPayload(NamedTuple):
+    """"""
+
+    page_number: int
+    slot: int
+    slots_count: int
+    page_flags: int
+    data: bytes
+    stream_id: int = 0
+
+
+def parse_symbol_payload(
+    raw_data: bytes,
+    symbol_codec: SymbolCodec = SymbolCodec.BASE256,
+    header_version: HeaderVersion = HeaderVersion.AUTO,
+) -> SymbolPayload:
+    """"""
+    if len(raw_data) < 2:
+        SYMBOL_TOO_SHORT_MESSAGE: Final[str] = "Symbol data too short to contain a header."
+        raise ValueError(SYMBOL_TOO_SHORT_MESSAGE)
+
+    symbol_header: SymbolHeader
+    data: bytes
+    symbol_header, data = unpack_symbol(header_version, symbol_codec, raw_data)
+    if symbol_header.slot >= symbol_header.slots_count:
+        INVALID_SLOT_HEADER_MESSAGE: Final[str] = "Symbol data has an invalid slot header."
+        raise ValueError(INVALID_SLOT_HEADER_MESSAGE)
+
+    return SymbolPayload(
+        page_number=symbol_header.page_number,
+        slot=symbol_header.slot,
+        slots_count=symbol_header.slots_count,
+        page_flags=symbol_header.page_flags,
+        data=data,
+        stream_id=symbol_header.stream_id,
+    )
+
+
+def assemble_pages(symbol_payloads: Iterable[SymbolPayload]) -> Mapping[int, bytes]:
+    """"""
+    page_slots: dict[int, dict[int, bytes]] = {}
+    page_slots_counts: dict[int, int] = {}
+    pages_flags: dict[int, int] = {}
+
+    symbol_payload: SymbolPayload
+    for symbol_payload in symbol_payloads:
+        page_slots.setdefault(symbol_payload.page_number, {})[symbol_payload.slot] = (
+            symbol_payload.data
+        )
+        page_slots_counts[symbol_payload.page_number] = symbol_payload.slots_count
+        pages_flags[symbol_payload.page_number] = symbol_payload.page_flags
+
+    page_number: int
+    slots: dict[int, bytes]
+    for page_number, slots in page_slots.items():
+        if len(slots) != page_slots_counts[page_number]:
+            MISSING_SLOTS_MESSAGE: str = (
+                f"Page {page_number} is missing {page_slots_counts[page_number] - len(slots)} "
+                "of its symbols."
+            )
+            raise ValueError(MISSING_SLOTS_MESSAGE)
+
+    # NOTE: Each stored page record keeps its page flags as the first byte
+    return {
+        page_number: bytes((pages_flags[page_number],))
+        + b"".join(slots[slot] for slot in sorted(slots))
+        for page_number, slots in page_slots.items()
+    }
+
+
 def load_previous_page_number() -> int:
     """"""
     return (
@@ -66,84 +157,206 @@ def save_previous_page_number(starting_page_number: int, /) -> None:
     )
 
 
-def _get_highest_known_page_number(page_numbers: Iterable[int | str]) -> int:
-    return max(int(page_number) for page_number in page_numbers)
+def get_page_store() -> PageStore:
+    """"""
+    global _page_store  # noqa: PLW0603
+    if _page_store is None:
+        _page_store = PageStore(SCAN_STATE_FILE_PATH)
+
+    return _page_store
+
+
+def _get_highest_known_page_number(page_numbers: Iterable[int], default: int) -> int:
+    return max(page_numbers, default=default)
 
 
 def get_page_states(starting_page_number: int) -> MutableMapping[int, PageState]:
     """"""
-    state_file_data: StateFileData = (
-        cast("StateFileData", json.loads(SCAN_STATE_FILE_PATH.read_text()))
-        if SCAN_STATE_FILE_PATH.exists()
-        else {"sent": [], "data": {}}
-    )
+    page_store: PageStore = get_page_store()
     return {
         page_number: (
             PageState.SENT
-            if page_number in state_file_data["sent"]
+            if page_store.is_sent(page_number)
             else PageState.SEEN
-            if str(page_number) in state_file_data["data"]
+            if page_number in page_store
             else PageState.UNSEEN
         )
         for page_number in range(
-            starting_page_number, _get_highest_known_page_number(state_file_data["data"]) + 1
+            starting_page_number,
+            _get_highest_known_page_number(
+                page_store.page_numbers, default=starting_page_number - 1
+            )
+            + 1,
         )
     }
 
 
-def save_data_for_page(page_number: int, data: bytes) -> None:
-    state_file_data: StateFileData = (
-        cast("StateFileData", json.loads(SCAN_STATE_FILE_PATH.read_text()))
-        if SCAN_STATE_FILE_PATH.exists()
-        else {"sent": [], "data": {}}
-    )
+def get_reorder_buffer(starting_page_number: int) -> ReorderBuffer:
+    """"""
+    global _reorder_buffer  # noqa: PLW0603
+    if _reorder_buffer is None:
+        page_store: PageStore = get_page_store()
+        watermark: int = (
+            _get_highest_known_page_number(
+                page_store.sent_page_numbers, default=starting_page_number - 1
+            )
+            + 1
+        )
+        _reorder_buffer = ReorderBuffer(
+            watermark,
+            (
+                page_number
+                for page_number in page_store.page_numbers
+                if not page_store.is_sent(page_number)
+            ),
+        )
 
-    state_file_data["data"][str(page_number)] = base64.standard_b64encode(data).decode()
+    return _reorder_buffer
 
-    SCAN_STATE_FILE_PATH.write_text(json.dumps(state_file_data))
+
+def save_data_for_page(page_number: int, data: bytes) -> None:
+    get_page_store().put(page_number, data)
+
+    if _reorder_buffer is not None:
+        _reorder_buffer.add(page_number)
 
 
 def mark_data_as_sent(page_number: int) -> None:
-    state_file_data: StateFileData = (
-        cast("StateFileData", json.loads(SCAN_STATE_FILE_PATH.read_text()))
-        if SCAN_STATE_FILE_PATH.exists()
-        else {"sent": [], "data": {}}
-    )
+    get_page_store().mark_sent((page_number,))
 
-    state_file_data["sent"].append(page_number)
 
-    SCAN_STATE_FILE_PATH.write_text(json.dumps(state_file_data))
+def _get_page_data(page_record: bytes) -> bytes:
+    return page_record[1 + (FEC_PAGE_HEADER_SIZE if page_record[0] & FEC_PAGE_FLAG else 0) :]
+
+
+def recover_missing_pages(starting_page_number: int) -> Sequence[int]:
+    """"""
+    page_store: PageStore = get_page_store()
+    reorder_buffer: ReorderBuffer = get_reorder_buffer(starting_page_number)
+
+    fec_groups: set[tuple[int, int, int]] = set()
+
+    page_number: int
+    for page_number in (
+        reorder_buffer.watermark - 1,
+        *reorder_buffer.get_pending_page_numbers(),
+    ):
+        page_record: bytes | None = page_store.get(page_number)
+        if (
+            page_record is None
+            or not page_record[0] & FEC_PAGE_FLAG
+            or len(page_record) <= FEC_PAGE_HEADER_SIZE
+        ):
+            continue
+
+        group_position: int
+        data_pages_count: int
+        parity_pages_count: int
+        group_position, data_pages_count, parity_pages_count = page_record[
+            1 : 1 + FEC_PAGE_HEADER_SIZE
+        ]
+        fec_groups.add((page_number - group_position, data_pages_count, parity_pages_count))
+
+    recovered_page_numbers: list[int] = []
+
+    group_start: int
+    for group_start, data_pages_count, parity_pages_count in sorted(fec_groups):
+        data_records: dict[int, bytes] = {}
+        parity_shards: dict[int, bytes] = {}
+
+        for group_position in range(data_pages_count + parity_pages_count):
+            group_page_record: bytes | None = page_store.get(group_start + group_position)
+            if group_page_record is None:
+                continue
+
+            if group_position < data_pages_count:
+                data_records[group_position] = group_page_record
+            else:
+                parity_shards[group_position - data_pages_count] = group_page_record[
+                    1 + FEC_PAGE_HEADER_SIZE :
+                ]
+
+        missing_data_pages_count: int = data_pages_count - len(data_records)
+        if missing_data_pages_count > len(parity_shards):
+            continue
+
+        # NOTE: A group rebuilt from damaged pages is skipped, so it cannot stop the other groups
+        try:
+            recovered_data_records: Mapping[int, bytes] = fec.recover_data_records(
+                data_records, parity_shards, data_pages_count
+            )
+        except ValueError as e:
+            logger.warning("Skipping FEC group starting at page %d: %s", group_start, e)
+            continue
+
+        recovered_record: bytes
+        for group_position, recovered_record in recovered_data_records.items():
+            save_data_for_page(group_start + group_position, recovered_record)
+            recovered_page_numbers.append(group_start + group_position)
+
+        # NOTE: Once every data page of a group is known, its missing parity pages can be skipped
+        for group_position in range(data_pages_count, data_pages_count + parity_pages_count):
+            reorder_buffer.add(group_start + group_position)
+
+    return recovered_page_numbers
 
 
 def send_lowest_contiguous_block(starting_page_number: int) -> bytes | None:
     """"""
-    state_file_data: StateFileData = (
-        cast("StateFileData", json.loads(SCAN_STATE_FILE_PATH.read_text()))
-        if SCAN_STATE_FILE_PATH.exists()
-        else {"sent": [], "data": {}}
-    )
+    page_store: PageStore = get_page_store()
 
-    to_send = []
-    i = (
-        max(state_file_data["sent"]) + 1
-        if len(state_file_data["sent"]) > 0
-        else starting_page_number
-    )
-    while i <= _get_highest_known_page_number(state_file_data["data"]):
-        if i in state_file_data["sent"]:
+    _partial_frame_page_numbers.extend(get_reorder_buffer(starting_page_number).release())
+
+    page_records: Sequence[bytes | None] = [
+        page_store.get(page_number) for page_number in _partial_frame_page_numbers
+    ]
+
+    frames: list[bytes] = []
+    frame_start_index: int = 0
+
+    index: int
+    page_record: bytes | None
+    for index, page_record in enumerate(page_records):
+        # NOTE: Parity pages only exist to rebuild data pages, so they never carry frame content
+        if page_record is None or page_record[0] & PARITY_PAGE_FLAG:
+            if index == frame_start_index:
+                frame_start_index += 1
             continue
-        if str(i) not in state_file_data["data"]:
-            break
-        to_send.append(i)
-        i += 1
 
-    if not to_send:
-        return None
+        if not page_record[0] & FRAME_END_PAGE_FLAG:
+            continue
 
-    state_file_data["sent"].extend(to_send)
+        # NOTE: A corrupt frame is dropped and its pages still marked as sent, so that it is not
+        # retried on every later scan
+        try:
+            frame: bytes = decompress_frame(
+                FrameCodec(page_record[0] & FRAME_CODEC_PAGE_FLAGS_MASK),
+                b"".join(
+                    _get_page_data(frame_page_record)
+                    for frame_page_record in page_records[frame_start_index : index + 1]
+                    if frame_page_record is not None
+                    and not frame_page_record[0] & PARITY_PAGE_FLAG
+                ),
+            )
+            frames.append(
+                decompress_packet_headers(frame)
+                if page_record[0] & HEADER_COMPRESSION_PAGE_FLAG
+                else frame
+            )
+        except ValueError as e:
+            logger.warning(
+                "Dropping corrupt frame ending at page %d: %s",
+                _partial_frame_page_numbers[index],
+                e,
+            )
+
+        frame_start_index = index + 1
+
+    if not frame_start_index:
+        return None
 
-    SCAN_STATE_FILE_PATH.write_text(json.dumps(state_file_data))
+    # NOTE: Pages are only marked as sent once their whole frame has been delivered
+    page_store.mark_sent(_partial_frame_page_numbers[:frame_start_index])
+    del _partial_frame_page_numbers[:frame_start_index]
 
-    return b"".join(
-        base64.standard_b64decode(state_file_data["data"][str(x)]) for x in to_send
-    )
+    return b"".join(frames) if frames else None
@@ -0,0 +1,76 @@
+""""""
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "SHARD_LENGTH_PREFIX_SIZE",
+    "get_cauchy_coefficient",
+    "get_multiplication_table",
+    "gf_inverse",
+    "gf_multiply",
+)
+
+
+GF_PRIMITIVE_POLYNOMIAL: Final[int] = 0x11D
+SHARD_LENGTH_PREFIX_SIZE: Final[int] = 4
+
+
+def _build_gf_exp_table() -> Sequence[int]:
+    exp_table: list[int] = [0] * 512
+
+    value: int = 1
+    power: int
+    for power in range(255):
+        exp_table[power] = value
+        value <<= 1
+        if value & 0x100:
+            value ^= GF_PRIMITIVE_POLYNOMIAL
+
+    for power in range(255, 512):
+        exp_table[power] = exp_table[power - 255]
+
+    return exp_table
+
+
+def _build_gf_log_table(exp_table: Sequence[int]) -> Sequence[int]:
+    log_table: list[int] = [0] * 256
+
+    power: int
+    for power in range(255):
+        log_table[exp_table[power]] = power
+
+    return log_table
+
+
+GF_EXP: Final[Sequence[int]] = _build_gf_exp_table()
+GF_LOG: Final[Sequence[int]] = _build_gf_log_table(GF_EXP)
+
+
+def gf_multiply(a: int, b: int) -> int:
+    """"""
+    if not a or not b:
+        return 0
+
+    return GF_EXP[GF_LOG[a] + GF_LOG[b]]
+
+
+def gf_inverse(a: int) -> int:
+    """"""
+    return GF_EXP[255 - GF_LOG[a]]
+
+
+@functools.cache
+def get_multiplication_table(coefficient: int) -> bytes:
+    """"""
+    return bytes(gf_multiply(coefficient, value) for value in range(256))
+
+
+def get_cauchy_coefficient(parity_index: int, data_index: int, data_shards_count: int) -> int:
+    """"""
+    # NOTE: Parity rows use the field elements after every data index, so no row/column collide
+    return gf_inverse((data_shards_count + parity_index) ^ data_index)
@@ -0,0 +1,197 @@
+""""""
+
+import enum
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "FieldKind",
+    "HeaderField",
+    "RecordKind",
+    "fill_inferred_fields",
+    "get_header_fields",
+)
+
+
+IPV4_HEADER_SIZE: Final[int] = 20
+IPV6_HEADER_SIZE: Final[int] = 40
+TCP_HEADER_SIZE: Final[int] = 20
+UDP_HEADER_SIZE: Final[int] = 8
+TCP_PROTOCOL: Final[int] = 6
+UDP_PROTOCOL: Final[int] = 17
+IPV4_FRAGMENT_MASK: Final[int] = 0x3FFF
+OPTION_WORD_SIZE: Final[int] = 4
+
+
+class FieldKind(enum.Enum):
+    """"""
+
+    STATIC = enum.auto()
+    VERBATIM = enum.auto()
+    DELTA = enum.auto()
+    IPV4_TOTAL_LENGTH = enum.auto()
+    IPV4_CHECKSUM = enum.auto()
+    IPV6_PAYLOAD_LENGTH = enum.auto()
+    UDP_LENGTH = enum.auto()
+
+
+# NOTE: A frame is a sequence of records, each starting with its kind. RAW records are a
+# varint length and the packet. FULL records are the same, and also open the next context,
+# numbered from 0 in each frame. DELTA records are a varint context number, a varint bitmask
+# of the changed VERBATIM and DELTA fields, each changed field, a varint payload length and
+# the payload. Contexts never outlive their frame, so a lost page cannot desynchronise them.
+class RecordKind(enum.IntEnum):
+    """"""
+
+    RAW = 0
+    FULL = 1
+    DELTA = 2
+
+
+class HeaderField(NamedTuple):
+    """"""
+
+    offset: int
+    size: int
+    kind: FieldKind
+
+
+def _get_option_word_fields(start: int, end: int) -> Sequence[HeaderField]:
+    return [
+        HeaderField(offset, OPTION_WORD_SIZE, FieldKind.DELTA)
+        for offset in range(start, end, OPTION_WORD_SIZE)
+    ]
+
+
+def _get_ip_header_fields(packet: bytes) -> tuple[Sequence[HeaderField], int] | None:
+    match packet[0] >> 4:
+        case 4:
+            ip_header_size: int = (packet[0] & 0x0F) * 4
+            if ip_header_size < IPV4_HEADER_SIZE or len(packet) < ip_header_size:
+                return None
+
+            return [
+                HeaderField(0, 1, FieldKind.STATIC),
+                HeaderField(1, 1, FieldKind.VERBATIM),
+                HeaderField(2, 2, FieldKind.IPV4_TOTAL_LENGTH),
+                HeaderField(4, 2, FieldKind.DELTA),
+                HeaderField(6, 2, FieldKind.STATIC),
+                HeaderField(8, 1, FieldKind.VERBATIM),
+                HeaderField(9, 1, FieldKind.STATIC),
+                HeaderField(10, 2, FieldKind.IPV4_CHECKSUM),
+                HeaderField(12, 8, FieldKind.STATIC),
+                *_get_option_word_fields(IPV4_HEADER_SIZE, ip_header_size),
+            ], ip_header_size
+
+        case 6:
+            if len(packet) < IPV6_HEADER_SIZE:
+                return None
+
+            return [
+                HeaderField(0, 4, FieldKind.VERBATIM),
+                HeaderField(4, 2, FieldKind.IPV6_PAYLOAD_LENGTH),
+                HeaderField(6, 1, FieldKind.STATIC),
+                HeaderField(7, 1, FieldKind.VERBATIM),
+                HeaderField(8, 32, FieldKind.STATIC),
+            ], IPV6_HEADER_SIZE
+
+        case _:
+            return None
+
+
+def get_header_fields(packet: bytes) -> Sequence[HeaderField] | None:
+    """"""
+    ip_header: tuple[Sequence[HeaderField], int] | None = _get_ip_header_fields(packet)
+    if ip_header is None:
+        return None
+
+    ip_header_fields: Sequence[HeaderField]
+    ip_header_size: int
+    ip_header_fields, ip_header_size = ip_header
+
+    protocol: int
+    match packet[0] >> 4:
+        case 4:
+            # NOTE: Only the first fragment carries a transport header, so fragments keep
+            # their fragment field static and only have their IP header compressed
+            if int.from_bytes(packet[6:8], byteorder="big") & IPV4_FRAGMENT_MASK:
+                return ip_header_fields
+            protocol = packet[9]
+        case _:
+            protocol = packet[6]
+
+    if protocol == TCP_PROTOCOL and len(packet) >= ip_header_size + TCP_HEADER_SIZE:
+        tcp_header_size: int = (packet[ip_header_size + 12] >> 4) * 4
+        if tcp_header_size < TCP_HEADER_SIZE or len(packet) < ip_header_size + tcp_header_size:
+            return ip_header_fields
+
+        return [
+            *ip_header_fields,
+            HeaderField(ip_header_size, 4, FieldKind.STATIC),
+            HeaderField(ip_header_size + 4, 4, FieldKind.DELTA),
+            HeaderField(ip_header_size + 8, 4, FieldKind.DELTA),
+            HeaderField(ip_header_size + 12, 2, FieldKind.VERBATIM),
+            HeaderField(ip_header_size + 14, 2, FieldKind.DELTA),
+            HeaderField(ip_header_size + 16, 4, FieldKind.VERBATIM),
+            *_get_option_word_fields(
+                ip_header_size + TCP_HEADER_SIZE, ip_header_size + tcp_header_size
+            ),
+        ]
+
+    if protocol == UDP_PROTOCOL and len(packet) >= ip_header_size + UDP_HEADER_SIZE:
+        return [
+            *ip_header_fields,
+            HeaderField(ip_header_size, 4, FieldKind.STATIC),
+            HeaderField(ip_header_size + 4, 2, FieldKind.UDP_LENGTH),
+            HeaderField(ip_header_size + 6, 2, FieldKind.VERBATIM),
+        ]
+
+    return ip_header_fields
+
+
+def _get_ipv4_checksum(ip_header: bytes | bytearray) -> int:
+    checksum: int = sum(
+        int.from_bytes(ip_header[offset : offset + 2], byteorder="big")
+        for offset in range(0, len(ip_header), 2)
+    )
+    while checksum > 0xFFFF:
+        checksum = (checksum & 0xFFFF) + (checksum >> 16)
+
+    return ~checksum & 0xFFFF
+
+
+def fill_inferred_fields(
+    header: bytearray, header_fields: Sequence[HeaderField], packet_size: int
+) -> None:
+    """"""
+    inferred_values: Mapping[FieldKind, int] = {
+        FieldKind.IPV4_TOTAL_LENGTH: packet_size,
+        FieldKind.IPV6_PAYLOAD_LENGTH: packet_size - IPV6_HEADER_SIZE,
+    }
+
+    header_field: HeaderField
+    for header_field in header_fields:
+        inferred_value: int | None = (
+            packet_size - header_field.offset + 4
+            if header_field.kind is FieldKind.UDP_LENGTH
+            else inferred_values.get(header_field.kind)
+        )
+        if inferred_value is not None:
+            header[header_field.offset : header_field.offset + header_field.size] = (
+                inferred_value.to_bytes(header_field.size, byteorder="big")
+            )
+
+    # NOTE: The checksum covers the other inferred fields, so it is always filled in last
+    for header_field in header_fields:
+        if header_field.kind is FieldKind.IPV4_CHECKSUM:
+            header[header_field.offset : header_field.offset + header_field.size] = bytes(
+                header_field.size
+            )
+            header[header_field.offset : header_field.offset + header_field.size] = (
+                _get_ipv4_checksum(header[: (header[0] & 0x0F) * 4]).to_bytes(
+                    header_field.size, byteorder="big"
+                )
+            )
@@ -0,0 +1,306 @@
+""""""
+
+import math
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, cast, override
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from logging import Logger
+    from typing import Final
+
+__all__: Sequence[str] = (
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsExporter",
+    "MetricsRegistry",
+)
+
+
+METRICS_CONTENT_TYPE: Final[str] = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_HOST: Final[str] = "127.0.0.1"
+METRICS_FILE_INTERVAL: Final[float] = 5.0
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(value)
+
+
+class _Metric:
+    TYPE: str
+
+    def __init__(self, name: str, description: str) -> None:
+        self.name: str = name
+        self.description: str = description
+        self._lock: threading.Lock = threading.Lock()
+
+    def _render_samples(self) -> Sequence[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """"""
+        with self._lock:
+            samples: Sequence[str] = self._render_samples()
+
+        return "".join(
+            (
+                f"# HELP {self.name} {self.description}\n",
+                f"# TYPE {self.name} {self.TYPE}\n",
+                *(f"{sample}\n" for sample in samples),
+            )
+        )
+
+
+class Counter(_Metric):
+    """"""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, description: str) -> None:
+        """"""
+        super().__init__(name, description)
+        self._value: float = 0
+
+    def inc(self, amount: float = 1) -> None:
+        """"""
+        if amount < 0:
+            NEGATIVE_INCREMENT_MESSAGE: Final[str] = "Counters can only be increased."
+            raise ValueError(NEGATIVE_INCREMENT_MESSAGE)
+
+        with self._lock:
+            self._value += amount
+
+    @override
+    def _render_samples(self) -> Sequence[str]:
+        return (f"{self.name} {_format_value(self._value)}",)
+
+
+class Gauge(_Metric):
+    """"""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, description: str) -> None:
+        """"""
+        super().__init__(name, description)
+        self._value: float = 0
+
+    def set(self, value: float) -> None:
+        """"""
+        with self._lock:
+            self._value = value
+
+    @override
+    def _render_samples(self) -> Sequence[str]:
+        return (f"{self.name} {_format_value(self._value)}",)
+
+
+class Histogram(_Metric):
+    """"""
+
+    TYPE = "histogram"
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float]) -> None:
+        """"""
+        super().__init__(name, description)
+        self.buckets: Sequence[float] = (*sorted(buckets), math.inf)
+        self._bucket_counts: list[int] = [0] * len(self.buckets)
+        self._sum: float = 0
+        self._count: int = 0
+
+    def observe(self, value: float) -> None:
+        """"""
+        with self._lock:
+            # NOTE: Only the first matching bucket is counted here, as the cumulative
+            # counts are only needed when the histogram is rendered
+            bucket_index: int = next(
+                index for index, bucket in enumerate(self.buckets) if value <= bucket
+            )
+            self._bucket_counts[bucket_index] += 1
+            self._sum += value
+            self._count += 1
+
+    @override
+    def _render_samples(self) -> Sequence[str]:
+        samples: list[str] = []
+
+        cumulative_count: int = 0
+
+        bucket: float
+        bucket_count: int
+        for bucket, bucket_count in zip(self.buckets, self._bucket_counts, strict=True):
+            cumulative_count += bucket_count
+            samples.append(
+                f'{self.name}_bucket{{le="{_format_value(bucket)}"}} {cumulative_count}'
+            )
+
+        samples.append(f"{self.name}_sum {_format_value(self._sum)}")
+        samples.append(f"{self.name}_count {self._count}")
+
+        return samples
+
+
+class MetricsRegistry:
+    """"""
+
+    def __init__(self) -> None:
+        """"""
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register[T: _Metric](self, metric: T) -> T:
+        if metric.name in self._metrics:
+            DUPLICATE_METRIC_MESSAGE: Final[str] = (
+                f"A metric named {metric.name!r} is already registered."
+            )
+            raise ValueError(DUPLICATE_METRIC_MESSAGE)
+
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, description: str) -> Counter:
+        """"""
+        return self._register(Counter(name, description))
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        """"""
+        return self._register(Gauge(name, description))
+
+    def histogram(self, name: str, description: str, buckets: Sequence[float]) -> Histogram:
+        """"""
+        return self._register(Histogram(name, description, buckets))
+
+    def render(self) -> str:
+        """"""
+        return "".join(metric.render() for metric in self._metrics.values())
+
+
+class _MetricsHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int, registry: MetricsRegistry, logger: Logger) -> None:
+        self.registry: MetricsRegistry = registry
+        self.logger: Logger = logger
+        super().__init__((METRICS_HOST, port), _MetricsRequestHandler)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    @property
+    def metrics_server(self) -> _MetricsHTTPServer:
+        """"""
+        # NOTE: Handlers are only ever created by the metrics server, which passes itself in
+        return cast("_MetricsHTTPServer", self.server)
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in {"/", "/metrics"}:
+            self.send_error(404)
+            return
+
+        body: bytes = self.metrics_server.registry.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", METRICS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @override
+    def log_message(self, format: str, *args: object) -> None:
+        self.metrics_server.logger.debug("Metrics request: %s", format % args)
+
+
+class MetricsExporter:
+    """"""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        port: int | None,
+        file_path: Path | None,
+        logger: Logger,
+    ) -> None:
+        """"""
+        self.registry: MetricsRegistry = registry
+        self.port: int | None = port
+        self.file_path: Path | None = file_path
+        self.logger: Logger = logger
+
+        self._http_server: _MetricsHTTPServer | None = None
+        self._stop_writing: threading.Event = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def write_file(self) -> None:
+        """"""
+        if self.file_path is None:
+            return
+
+        # NOTE: The file is replaced in one step, so a collector never reads half of it
+        file_descriptor: int
+        temporary_file_path: str
+        file_descriptor, temporary_file_path = tempfile.mkstemp(
+            prefix=f".{self.file_path.name}.", dir=self.file_path.parent
+        )
+        with os.fdopen(file_descriptor, "w") as temporary_file:
+            temporary_file.write(self.registry.render())
+
+        Path(temporary_file_path).replace(self.file_path)
+
+    def _write_file_periodically(self) -> None:
+        while not self._stop_writing.wait(METRICS_FILE_INTERVAL):
+            try:
+                self.write_file()
+            except OSError as e:
+                self.logger.warning("Writing metrics to %s failed: %s", self.file_path, e)
+
+    def start(self) -> None:
+        """"""
+        if self.port is not None:
+            self._http_server = _MetricsHTTPServer(self.port, self.registry, self.logger)
+            self._threads.append(
+                threading.Thread(
+                    target=self._http_server.serve_forever,
+                    name="ipops-metrics-server",
+                    daemon=True,
+                )
+            )
+            self.logger.info(
+                "Serving metrics on http://%s:%d/metrics", METRICS_HOST, self.port
+            )
+
+        if self.file_path is not None:
+            self._threads.append(
+                threading.Thread(
+                    target=self._write_file_periodically,
+                    name="ipops-metrics-writer",
+                    daemon=True,
+                )
+            )
+            self.logger.info("Writing metrics to %s", self.file_path)
+
+        thread: threading.Thread
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """"""
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+
+        self._stop_writing.set()
+
+        thread: threading.Thread
+        for thread in self._threads:
+            thread.join()
+
+        # NOTE: The final values are always written, so short runs still leave their metrics
+        try:
+            self.write_file()
+        except OSError as e:
+            self.logger.warning("Writing metrics to %s failed: %s", self.file_path, e)